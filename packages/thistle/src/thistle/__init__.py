@@ -7,39 +7,53 @@ except ImportError:
 
 from thistle.events import (
     find_ascending_periods,
+    find_catalog_passes,
     find_descending_periods,
     find_eclipse_periods,
+    find_events,
     find_node_crossings,
     find_passes,
+    find_passes_multi,
     find_sunlit_periods,
 )
 from thistle.ground_sites import doppler_shift, generate_range, visibility_circle
 from thistle._core import Site, Sites
-from thistle.orbit_data import generate
+from thistle.orbit_data import generate, generate_iter, generate_many
 from thistle.propagator import (
+    BlendSwitchStrategy,
     EpochSwitchStrategy,
     MidpointSwitchStrategy,
     Propagator,
+    SatelliteList,
     SwitchingStrategy,
     TCASwitchStrategy,
 )
+from thistle.tle_array import TLEArray
 from thistle.utils import load_tle, read_tle
 
 __all__ = [
     "Propagator",
+    "SatelliteList",
+    "TLEArray",
     "read_tle",
     "load_tle",
     "SwitchingStrategy",
     "EpochSwitchStrategy",
     "MidpointSwitchStrategy",
     "TCASwitchStrategy",
+    "BlendSwitchStrategy",
     "visibility_circle",
     "generate_range",
     "doppler_shift",
     "generate",
+    "generate_iter",
+    "generate_many",
     "Site",
     "Sites",
+    "find_events",
     "find_passes",
+    "find_passes_multi",
+    "find_catalog_passes",
     "find_node_crossings",
     "find_sunlit_periods",
     "find_eclipse_periods",
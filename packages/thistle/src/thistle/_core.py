@@ -5,14 +5,25 @@ It is internal (not part of the public API) but its non-underscore names
 are the stable inter-module contract.
 """
 
+import datetime
+import functools
 import pathlib
-from typing import Dict, Sequence, Tuple, Union, cast
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Sequence, Tuple, Union, cast
 
 import numpy as np
 import numpy.typing as npt
+from sgp4.api import Satrec
 from skyfield.api import EarthSatellite, load, wgs84
+from skyfield.constants import AU_KM, DAY_S, tau
+from skyfield.elementslib import osculating_elements_of
+from skyfield.framelib import itrs
+from skyfield.functions import _T, mxm, mxv, rot_z
+from skyfield.sgp4lib import TEME, TEME_to_ITRF, theta_GMST1982
 
-from thistle.utils import dt64_to_time
+from thistle.utils import dt64_to_time, jday_datetime64
+
+if TYPE_CHECKING:
+    from thistle.propagator import Propagator
 
 # ---------------------------------------------------------------------------
 # Singletons
@@ -33,6 +44,10 @@ AU_PER_DAY_TO_M_PER_S = AU_TO_M / 86_400.0
 R_EARTH_KM = 6_371.0
 R_SUN_KM = 696_340.0
 
+_WGS84_F = 1.0 / 298.257223563
+WGS84_A_KM = 6_378.137
+WGS84_E2 = 2.0 * _WGS84_F - _WGS84_F * _WGS84_F
+
 # ---------------------------------------------------------------------------
 # Type aliases
 # ---------------------------------------------------------------------------
@@ -79,6 +94,463 @@ def propagate_sat(
     return t, satellite.at(t)
 
 
+def sgp4_time(t) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Split a Skyfield Time into the UTC (jd, fr) pair that SGP4 expects.
+
+    This is the same conversion ``EarthSatellite.at()`` performs internally,
+    so states computed from it match Skyfield's exactly.
+
+    Args:
+        t: A Skyfield Time (scalar or array).
+
+    Returns:
+        A (jd, fr) tuple of float64 arrays (at least 1-D).
+    """
+    jd = np.atleast_1d(t.whole)
+    fr = np.atleast_1d(t.tai_fraction - t._leap_seconds() / DAY_S)
+    return jd, fr
+
+
+def sgp4_segments(
+    segments: Iterable[Tuple[Satrec, Union[slice, npt.NDArray[np.intp]]]],
+    jd: npt.NDArray[np.float64],
+    fr: npt.NDArray[np.float64],
+) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Evaluate SGP4 for per-sample Satrecs into shared TEME buffers.
+
+    Each segment is evaluated with a single vectorized SGP4 call whose
+    result is stored into its rows of the full-length buffers, so no
+    per-segment Skyfield objects are built and nothing is concatenated.
+
+    Args:
+        segments: (satrec, index) pairs; ``index`` (a slice or index array)
+            selects the samples of ``jd``/``fr`` that the Satrec should
+            propagate.
+        jd: Whole UTC Julian dates.
+        fr: Fractional UTC Julian dates.
+
+    Returns:
+        A (r, v) tuple of TEME position (km) and velocity (km/s) arrays with
+        shape (3, n). Samples not covered by any segment, and samples for
+        which SGP4 reports an error, are NaN.
+    """
+    jd = np.ascontiguousarray(jd, dtype=np.float64)
+    fr = np.ascontiguousarray(fr, dtype=np.float64)
+    n = len(jd)
+    r = np.full((n, 3), np.nan)
+    v = np.full((n, 3), np.nan)
+    e = np.zeros(n, dtype=np.uint8)
+    for satrec, index in segments:
+        e[index], r[index], v[index] = satrec.sgp4_array(jd[index], fr[index])
+    failed = e != 0
+    r[failed] = np.nan
+    v[failed] = np.nan
+    return r.T, v.T
+
+
+def teme_rotation(t) -> npt.NDArray[np.float64]:
+    """TEME -> GCRS rotation matrices for a Skyfield Time, shape (3, 3, n)."""
+    return _T(TEME.rotation_at(t))
+
+
+def teme_to_gcrs(
+    t,
+    r: npt.NDArray[np.float64],
+    v: npt.NDArray[np.float64],
+    rotation: Optional[npt.NDArray[np.float64]] = None,
+) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Rotate TEME state vectors into GCRS with one rotation over all samples.
+
+    Args:
+        t: Skyfield Time matching the columns of ``r`` and ``v``.
+        r: TEME position (km), shape (3, n).
+        v: TEME velocity (km/s), shape (3, n).
+        rotation: Matrices from :func:`teme_rotation` for ``t``, to reuse
+            when rotating several objects on the same time grid.
+
+    Returns:
+        A (position, velocity) tuple in GCRS, in au and au/day.
+    """
+    R = teme_rotation(t) if rotation is None else rotation
+    return mxv(R, r / AU_KM), mxv(R, v / AU_KM * DAY_S)
+
+
+def geodetic_of(
+    xyz: npt.NDArray[np.float64], radius: float
+) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """WGS84 geodetic latitude (deg), longitude (deg), and height.
+
+    Uses the same fixed three-iteration solution as Skyfield's ``wgs84``.
+
+    Args:
+        xyz: ITRS position, shape (3, n).
+        radius: WGS84 equatorial radius in the units of ``xyz``.
+
+    Returns:
+        A (lat, lon, height) tuple, with height in the units of ``xyz``.
+    """
+    x, y, z = xyz
+    R = np.sqrt(x * x + y * y)
+    lat = np.arctan2(z, R)
+    aC = hyp = np.zeros_like(R)  # set by the first iteration
+    for _ in range(3):
+        e2_sin_lat = WGS84_E2 * np.sin(lat)
+        aC = radius / np.sqrt(1.0 - e2_sin_lat * np.sin(lat))
+        hyp = z + aC * e2_sin_lat
+        lat = np.arctan2(hyp, R)
+    lon = (np.arctan2(y, x) - np.pi) % (2.0 * np.pi) - np.pi
+    height = np.sqrt(hyp * hyp + R * R) - aC
+    return np.degrees(lat), np.degrees(lon), height
+
+
+# ---------------------------------------------------------------------------
+# Extraction context
+# ---------------------------------------------------------------------------
+
+
+# Spacing of the nodes for interpolated Sun and Earth-orientation tables.
+# With cubic splines over hourly nodes the interpolation error is below
+# 1e-11 of the Sun distance (~1 m), 1e-5 arcsec in the Sun's apparent right
+# ascension, and 1e-9 arcsec in the TEME and ITRS rotations built from the
+# interpolated precession-nutation matrix and equation of the equinoxes.
+INTERP_STEP_DAYS = 1.0 / 24.0
+
+
+def _interp_nodes(tt: npt.NDArray[np.float64]) -> Optional[npt.NDArray[np.float64]]:
+    """TT node grid spanning *tt*, or None if it would not save any work."""
+    if tt.size < 2:
+        return None
+    lo, hi = tt.min(), tt.max()
+    n_nodes = max(4, int(np.ceil((hi - lo) / INTERP_STEP_DAYS)) + 1)
+    if n_nodes >= tt.size:
+        return None
+    return np.linspace(lo, hi, n_nodes)
+
+
+def _cubic(
+    nodes: npt.NDArray[np.float64],
+    values: npt.NDArray[np.float64],
+    tt: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """Evaluate a cubic spline through (nodes, values) at *tt* (last axis)."""
+    from scipy.interpolate import CubicSpline
+
+    return CubicSpline(nodes, values, axis=-1)(tt)
+
+
+def _sun_position_km(t) -> npt.NDArray[np.float64]:
+    """Geometric GCRS position of the Sun relative to Earth at *t* (km)."""
+    return (eph["sun"] - eph["earth"]).at(t).xyz.km
+
+
+def _sun_ra(t):
+    """Apparent right ascension of the Sun seen from Earth at *t*."""
+    return eph["earth"].at(t).observe(eph["sun"]).apparent().radec()[0]
+
+
+class TimeGrid:
+    """Quantities that depend only on the time grid, computed once.
+
+    Shared by every extractor and, in batch generation, by every object
+    propagated on the same grid. Each quantity is computed on first access.
+
+    With ``interpolate=True`` the expensive, slowly varying inputs are
+    evaluated exactly on an hourly node grid (:data:`INTERP_STEP_DAYS`)
+    and cubic-spline interpolated onto ``t``: the precession-nutation
+    matrix and the equation of the equinoxes, from which the TEME and
+    ITRS rotations are built, and the Sun position and right ascension.
+    The tables live on the grid only; ``t`` itself is left untouched, so
+    Skyfield computations made directly on it stay exact. Short grids with
+    fewer samples than nodes are always evaluated exactly. Passing *nodes*
+    reuses the node grid of a larger grid that contains ``t``, so that
+    chunks of one time array interpolate exactly like the whole.
+
+    Attributes:
+        t: Skyfield Time for the grid.
+        interpolate: Whether interpolated tables are in use.
+    """
+
+    def __init__(
+        self,
+        t,
+        interpolate: bool = False,
+        nodes: Optional[npt.NDArray[np.float64]] = None,
+    ) -> None:
+        self.t = t
+        if interpolate and nodes is None:
+            nodes = _interp_nodes(np.atleast_1d(t.tt))
+        self._nodes = nodes if interpolate else None
+        self.interpolate = self._nodes is not None
+
+    @functools.cached_property
+    def _node_time(self):
+        return ts.tt_jd(self._nodes)
+
+    @functools.cached_property
+    def _orientation(self) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Interpolated precession-nutation matrices and GAST (hours)."""
+        nodes = cast(npt.NDArray[np.float64], self._nodes)
+        node_t, tt = self._node_time, self.t.tt
+        M = _cubic(nodes, cast(npt.NDArray[np.float64], node_t.M), tt)
+        # GAST - GMST only varies with nutation; GMST is cheap to evaluate
+        node_gast = cast(npt.NDArray[np.float64], node_t.gast)
+        node_gmst = cast(npt.NDArray[np.float64], node_t.gmst)
+        eqeq = (node_gast - node_gmst + 12.0) % 24.0 - 12.0
+        gast = (self.t.gmst + _cubic(nodes, eqeq, tt)) % 24.0
+        return M, gast
+
+    @functools.cached_property
+    def sun_position_km(self) -> npt.NDArray[np.float64]:
+        """Geometric GCRS position of the Sun relative to Earth (km)."""
+        if self._nodes is None:
+            return _sun_position_km(self.t)
+        return _cubic(self._nodes, _sun_position_km(self._node_time), self.t.tt)
+
+    @functools.cached_property
+    def sun_ra_hours(self) -> npt.NDArray[np.float64]:
+        """Apparent right ascension of the Sun seen from Earth (hours)."""
+        if self._nodes is None:
+            return _sun_ra(self.t).hours
+        nodes_rad = np.unwrap(_sun_ra(self._node_time).radians)
+        return (_cubic(self._nodes, nodes_rad, self.t.tt) * 12.0 / np.pi) % 24.0
+
+    @functools.cached_property
+    def gmst(self) -> npt.NDArray[np.float64]:
+        """Greenwich Mean Sidereal Time (hours)."""
+        return self.t.gmst
+
+    @functools.cached_property
+    def teme_rotation(self) -> npt.NDArray[np.float64]:
+        """TEME -> GCRS rotation matrices, shape (3, 3, n).
+
+        Same construction as ``TEME.rotation_at``, from the interpolated
+        tables when in use.
+        """
+        if self._nodes is None:
+            return teme_rotation(self.t)
+        M, gast = self._orientation
+        theta, _ = theta_GMST1982(self.t.whole, self.t.ut1_fraction)
+        return _T(mxm(rot_z(theta - gast / 24.0 * tau), M))
+
+    @functools.cached_property
+    def itrs_rotation(self) -> npt.NDArray[np.float64]:
+        """GCRS -> ITRS rotation matrices, shape (3, 3, n).
+
+        Same construction as ``itrs.rotation_at``, from the interpolated
+        tables when in use.
+        """
+        if self._nodes is None:
+            return itrs.rotation_at(self.t)
+        M, gast = self._orientation
+        R = mxm(rot_z(-gast / 24.0 * tau), M)
+        if self.t.ts.polar_motion_table is not None:
+            R = mxm(self.t.polar_motion_matrix(), R)
+        return R
+
+    @functools.cached_property
+    def igrf_epoch(self) -> datetime.datetime:
+        """Default IGRF evaluation date: the midpoint of the grid."""
+        return self.t.utc_datetime()[len(self.t) // 2].replace(tzinfo=None)
+
+
+class ExtractionContext:
+    """Lazily computed per-object quantities shared between extractors.
+
+    Requesting several groups that need the same intermediate (the ITRS
+    state, the subpoint, osculating elements, the IGRF field) computes it
+    once. Grid-wide quantities live on :attr:`grid`.
+
+    Attributes:
+        grid: The shared :class:`TimeGrid`.
+        geocentric: Skyfield Geocentric for the object on ``grid.t``.
+        epoch: IGRF evaluation date, or None for ``grid.igrf_epoch``.
+    """
+
+    def __init__(
+        self,
+        grid: TimeGrid,
+        geocentric,
+        epoch: Optional[datetime.datetime] = None,
+    ) -> None:
+        self.grid = grid
+        self.geocentric = geocentric
+        self.epoch = epoch
+
+    @property
+    def t(self):
+        """Skyfield Time for the grid."""
+        return self.grid.t
+
+    @functools.cached_property
+    def itrs_xyz_au(self) -> npt.NDArray[np.float64]:
+        """ITRS position (au), shape (3, n)."""
+        return mxv(self.grid.itrs_rotation, self.geocentric.xyz.au)
+
+    @functools.cached_property
+    def itrs_velocity_au_per_d(self) -> npt.NDArray[np.float64]:
+        """ITRS velocity (au/day), including the Earth-rotation term."""
+        v = mxv(self.grid.itrs_rotation, self.geocentric.velocity.au_per_d)
+        return v + mxv(itrs._dRdt_times_RT_at(self.t), self.itrs_xyz_au)
+
+    @functools.cached_property
+    def subpoint(
+        self,
+    ) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """WGS84 latitude (deg), longitude (deg), and height (km)."""
+        lat, lon, height_au = geodetic_of(self.itrs_xyz_au, WGS84_A_KM / AU_KM)
+        return lat, lon, height_au * AU_KM
+
+    @functools.cached_property
+    def elements(self):
+        """Skyfield osculating elements of the orbit."""
+        return osculating_elements_of(self.geocentric)
+
+    @functools.cached_property
+    def igrf_enu(
+        self,
+    ) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """IGRF field (nT) at the subpoint in local east, north, up."""
+        import ppigrf
+
+        lat, lon, height_km = self.subpoint
+        epoch = self.epoch if self.epoch is not None else self.grid.igrf_epoch
+        Be, Bn, Bu = ppigrf.igrf(lon, lat, height_km, epoch)
+        return Be.ravel(), Bn.ravel(), Bu.ravel()
+
+
+# ---------------------------------------------------------------------------
+# Raw SGP4 backend
+# ---------------------------------------------------------------------------
+
+# Spacing of the nodes at which the TEME -> GCRS rotation is evaluated with
+# Skyfield before being interpolated onto the sample times. The rotation
+# only changes through precession, nutation, and the equation of the
+# equinoxes, so linear interpolation over one hour errs by ~1e-11 rad.
+_ROTATION_STEP_DAYS = 1.0 / 24.0
+
+
+class RawState:
+    """TEME state straight from SGP4, with other frames derived on demand.
+
+    Built by :func:`propagate_raw`. Derived frames are computed once on
+    first access and cached, so extractors sharing a state share the work.
+
+    Attributes:
+        jd: Whole UTC Julian dates passed to SGP4.
+        fr: Fractional UTC Julian dates passed to SGP4.
+        r: TEME position (km), shape (3, n).
+        v: TEME velocity (km/s), shape (3, n).
+    """
+
+    def __init__(
+        self,
+        jd: npt.NDArray[np.float64],
+        fr: npt.NDArray[np.float64],
+        r: npt.NDArray[np.float64],
+        v: npt.NDArray[np.float64],
+    ) -> None:
+        self.jd = jd
+        self.fr = fr
+        self.r = r
+        self.v = v
+
+    def __getitem__(self, index: Union[slice, npt.NDArray]) -> "RawState":
+        """The state at a subset of the samples."""
+        return RawState(
+            self.jd[index], self.fr[index], self.r[:, index], self.v[:, index]
+        )
+
+    @functools.cached_property
+    def gcrs(self) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """GCRS position (km) and velocity (km/s), shape (3, n).
+
+        The TEME -> GCRS rotation is evaluated on an hourly grid and
+        interpolated linearly onto each sample.
+        """
+        jd = self.jd + self.fr
+        n_nodes = max(2, int(np.ceil((jd.max() - jd.min()) / _ROTATION_STEP_DAYS)) + 1)
+        nodes = np.linspace(jd.min(), jd.max(), n_nodes)
+        R_nodes = _T(TEME.rotation_at(ts.ut1_jd(nodes)))
+        R = np.empty((3, 3, len(jd)))
+        for i in range(3):
+            for j in range(3):
+                R[i, j] = np.interp(jd, nodes, R_nodes[i, j])
+        return mxv(R, self.r), mxv(R, self.v)
+
+    @functools.cached_property
+    def itrs(self) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """ITRS position (km) and velocity (km/s), shape (3, n).
+
+        Uses the GMST 1982 rotation that defines TEME (AIAA 2006-6753),
+        treating UTC as UT1 and ignoring polar motion.
+        """
+        fr = cast(float, self.fr)  # TEME_to_ITRF broadcasts over arrays
+        r, v = TEME_to_ITRF(self.jd, self.r, self.v * DAY_S, fraction_ut1=fr)
+        return r, v / DAY_S
+
+    @functools.cached_property
+    def geodetic(
+        self,
+    ) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """WGS84 geodetic latitude (deg), longitude (deg), and height (km).
+
+        Uses the same fixed three-iteration solution as Skyfield's ``wgs84``.
+        """
+        return geodetic_of(self.itrs[0], WGS84_A_KM)
+
+
+def propagate_raw(
+    times: npt.NDArray[np.datetime64],
+    satellite: Union[EarthSatellite, "Propagator"],
+) -> RawState:
+    """Propagate with SGP4 directly from datetime64, bypassing Skyfield Time.
+
+    The (jd, fr) pair from :func:`~thistle.utils.jday_datetime64` goes
+    straight into ``sgp4_array``, so the input is treated as UTC for SGP4.
+    The Skyfield path treats it as UT1 instead, so the two differ by DUT1
+    (< 0.9 s) of along-track motion.
+
+    Args:
+        times: Array of datetime64 values (UTC).
+        satellite: A Skyfield EarthSatellite or a Propagator.
+
+    Returns:
+        The raw TEME state for every time.
+    """
+    jd, fr = jday_datetime64(times)
+    if isinstance(satellite, EarthSatellite):
+        _, r, v = satellite.model.sgp4_array(jd, fr)
+        return RawState(jd, fr, r.T, v.T)
+    r, v = satellite.propagate_teme(times)
+    return RawState(jd, fr, r, v)
+
+
+def extract_range_raw(state: RawState, sites) -> GenerateResult:
+    """Compute slant range and range rate from a raw SGP4 state.
+
+    Works in ITRS, where ground sites are fixed. The range rate is the
+    same in any frame because the rotation term is perpendicular to the
+    line of sight.
+
+    Args:
+        state: A :class:`RawState` from :func:`propagate_raw`.
+        sites: List of (suffix, lat, lon, alt) tuples.
+
+    Returns:
+        Dict with range_{suffix} (m) and range_rate_{suffix} (m/s) per site.
+    """
+    r_sat, v_sat = state.itrs
+    result: GenerateResult = {}
+    for suffix, lat, lon, alt in sites:
+        ground = cast(npt.NDArray, wgs84.latlon(lat, lon, elevation_m=alt).itrs_xyz.km)
+        r = (r_sat - ground[:, np.newaxis]) * 1000.0
+        slant_range = np.sqrt(np.sum(r**2, axis=0))
+        range_rate = np.sum(r * v_sat * 1000.0, axis=0) / slant_range
+        result[f"range_{suffix}"] = slant_range
+        result[f"range_rate_{suffix}"] = range_rate
+    return result
+
+
 # ---------------------------------------------------------------------------
 # Range extraction
 # ---------------------------------------------------------------------------
@@ -98,16 +570,32 @@ def extract_range(t, geocentric, sites) -> GenerateResult:
     Returns:
         Dict with range_{suffix} (m) and range_rate_{suffix} (m/s) per site.
     """
+    return extract_site_range(ExtractionContext(TimeGrid(t), geocentric), sites)
+
+
+def extract_site_range(ctx: ExtractionContext, sites) -> GenerateResult:
+    """Compute slant range and range rate using a shared extraction context.
+
+    Works in ITRS, where ground sites are fixed, so the ITRS rotation is
+    the one already cached on the context. The range rate is the same as
+    in GCRS because the Earth-rotation term is perpendicular to the line
+    of sight.
+
+    Args:
+        ctx: Extraction context for the satellite.
+        sites: List of (suffix, lat, lon, alt) tuples.
+
+    Returns:
+        Dict with range_{suffix} (m) and range_rate_{suffix} (m/s) per site.
+    """
+    r_sat = ctx.itrs_xyz_au
+    v_sat = ctx.itrs_velocity_au_per_d * AU_PER_DAY_TO_M_PER_S
     result: GenerateResult = {}
     for suffix, lat, lon, alt in sites:
-        ground = wgs84.latlon(lat, lon, elevation_m=alt).at(t)
-        r = (cast(npt.NDArray, geocentric.xyz.au) - cast(npt.NDArray, ground.xyz.au)) * AU_TO_M
-        v = (
-            cast(npt.NDArray, geocentric.velocity.au_per_d)
-            - cast(npt.NDArray, ground.velocity.au_per_d)
-        ) * AU_PER_DAY_TO_M_PER_S
+        ground = cast(npt.NDArray, wgs84.latlon(lat, lon, elevation_m=alt).itrs_xyz.au)
+        r = (r_sat - ground[:, np.newaxis]) * AU_TO_M
         slant_range = np.sqrt(np.sum(r**2, axis=0))
-        range_rate = np.sum(r * v, axis=0) / slant_range
+        range_rate = np.sum(r * v_sat, axis=0) / slant_range
         result[f"range_{suffix}"] = slant_range
         result[f"range_rate_{suffix}"] = range_rate
     return result
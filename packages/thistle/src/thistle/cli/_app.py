@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import itertools
 import json
 import math
 import pathlib
@@ -33,7 +34,14 @@ from thistle.cli._helpers import (
 )
 
 from thistle.cli import _db
+from thistle.cli._output import (
+    BINARY_FORMATS,
+    OutputFormat,
+    grid_time_unit,
+    open_writer,
+)
 from thistle.cli._config import (
+    CACHE_DIR_ENV,
     TLE_DIR_ENV,
     TLE_EXT_ENV,
     find_candidate_file,
@@ -48,7 +56,8 @@ app = typer.Typer(
     "to pass NORAD catalog IDs (e.g. 25544 or A0001) instead of file paths; "
     f"{TLE_EXT_ENV} sets their extension (default .tle). With 'thistle[db]' "
     "installed and THISTLE_DB_* configured, IDs not found there fall back to "
-    "the thistle-db database. See 'thistle config'.",
+    f"the thistle-db database. {CACHE_DIR_ENV} caches TLE switching "
+    "transitions between runs. See 'thistle config'.",
     no_args_is_help=True,
     add_completion=False,
     context_settings={"help_option_names": ["-h", "--help"]},
@@ -92,6 +101,7 @@ class SwitchStrategy(str, Enum):
     epoch = "epoch"
     midpoint = "midpoint"
     tca = "tca"
+    blend = "blend"
 
 
 class PlotPreset(str, Enum):
@@ -178,6 +188,10 @@ def find_tle(
         bool,
         typer.Option("--unique", help="Only output each unique TLE once"),
     ] = False,
+    chunk: Annotated[
+        int,
+        typer.Option("--chunk", help="Timestamps per batch"),
+    ] = 10000,
 ) -> None:
     """Find the correct TLE for given timestamps read from stdin."""
     from thistle import Propagator, read_tle as read_tle_file
@@ -193,35 +207,47 @@ def find_tle(
         print(f"Error: no TLEs found in {file}", file=sys.stderr)
         raise typer.Exit(code=2)
 
-    propagator = Propagator(tles, method=switch.value)
+    propagator = Propagator(
+        tles, method=switch.value, cache_dir=load_config().cache_dir
+    )
 
     warn_if_tty(sys.stdin, "find-tle")
 
     seen: Optional[set[tuple[str, str]]] = set() if unique else None
 
-    for raw_line in sys.stdin:
-        time_str = raw_line.strip()
-        if not time_str:
-            continue
+    while True:
+        raw_lines = list(itertools.islice(sys.stdin, chunk))
+        if not raw_lines:
+            break
 
-        try:
-            dt = datetime.fromisoformat(time_str)
-        except ValueError:
-            print(
-                f"Warning: skipping unparseable time: {time_str}",
-                file=sys.stderr,
-            )
-            continue
+        times: list[datetime] = []
+        for raw_line in raw_lines:
+            time_str = raw_line.strip()
+            if not time_str:
+                continue
 
-        line1, line2 = propagator.find_tle(dt)
+            try:
+                times.append(datetime.fromisoformat(time_str).replace(tzinfo=None))
+            except ValueError:
+                print(
+                    f"Warning: skipping unparseable time: {time_str}",
+                    file=sys.stderr,
+                )
 
-        if seen is not None:
-            key = (line1, line2)
-            if key in seen:
-                continue
-            seen.add(key)
+        if not times:
+            continue
 
-        sys.stdout.write(line1 + "\n" + line2 + "\n")
+        out: list[str] = []
+        for line1, line2 in propagator.find_tles(
+            np.array(times, dtype="datetime64[us]")
+        ):
+            if seen is not None:
+                key = (line1, line2)
+                if key in seen:
+                    continue
+                seen.add(key)
+            out.append(line1 + "\n" + line2 + "\n")
+        sys.stdout.write("".join(out))
 
 
 # ---------------------------------------------------------------------------
@@ -725,7 +751,9 @@ def groundtrack_cmd(
             if not tles:
                 print(f"Warning: no TLEs found in {resolved}", file=sys.stderr)
                 return None
-            propagators[resolved] = Propagator(tles, method="midpoint")
+            propagators[resolved] = Propagator(
+                tles, method="midpoint", cache_dir=load_config().cache_dir
+            )
         return propagators[resolved]
 
     from thistle.cli._map import trace_lla
@@ -807,6 +835,7 @@ def config_cmd(
                     "tle_dir_source": dir_source,
                     "tle_ext": cfg.tle_ext,
                     "tle_ext_source": ext_source or "default",
+                    "cache_dir": str(cfg.cache_dir) if cfg.cache_dir else None,
                     **db,
                 },
                 indent=2,
@@ -818,6 +847,10 @@ def config_cmd(
         else:
             print(f"tle_dir: (not set)  (set {TLE_DIR_ENV} to enable ID lookup)")
         print(f"tle_ext: {cfg.tle_ext}  (from {ext_source or 'default'})")
+        if cfg.cache_dir is not None:
+            print(f"cache_dir: {cfg.cache_dir}  (from {CACHE_DIR_ENV})")
+        else:
+            print(f"cache_dir: (not set)  (set {CACHE_DIR_ENV} to cache transitions)")
         if not db["db_installed"]:
             print("db_fallback: thistle-db not installed  (pip install 'thistle[db]')")
         elif not db["db_configured"]:
@@ -1152,10 +1185,34 @@ def propagate(
         int,
         typer.Option("--chunk", help="Timestamps per batch"),
     ] = 10000,
+    start: Annotated[
+        Optional[str],
+        typer.Option("--start", help="Grid start (ISO 8601); replaces stdin timestamps"),
+    ] = None,
+    stop: Annotated[
+        Optional[str],
+        typer.Option("--stop", help="Grid stop (ISO 8601, exclusive)"),
+    ] = None,
+    step: Annotated[
+        float,
+        typer.Option("--step", help="Grid step in seconds (with --start/--stop)"),
+    ] = 60.0,
     align: Annotated[
         bool,
         typer.Option("--align", help="Adaptively align output columns"),
     ] = False,
+    fmt: Annotated[
+        OutputFormat,
+        typer.Option(
+            "--format",
+            help="Output format. parquet/arrow need the 'arrow' extra; "
+            "binary formats keep full precision and native dtypes.",
+        ),
+    ] = OutputFormat.text,
+    output: Annotated[
+        Optional[pathlib.Path],
+        typer.Option("-o", "--output", help="Write output to file (default: stdout)"),
+    ] = None,
     eci: Annotated[bool, typer.Option("--eci", help="ECI position/velocity")] = False,
     ecef: Annotated[bool, typer.Option("--ecef", help="ECEF position/velocity")] = False,
     lla: Annotated[bool, typer.Option("--lla", help="Latitude/longitude/altitude")] = False,
@@ -1172,7 +1229,11 @@ def propagate(
         typer.Option("--site", help="Ground site: NAME:LAT:LON[:ALT] (repeatable)"),
     ] = None,
 ) -> None:
-    """Propagate TLEs and generate orbital data from stdin timestamps."""
+    """Propagate TLEs and generate orbital data from stdin timestamps.
+
+    With --start and --stop, samples a regular grid every --step seconds
+    instead of reading timestamps from stdin.
+    """
     flag_map = {
         "eci": eci, "ecef": ecef, "lla": lla, "keplerian": keplerian,
         "equinoctial": equinoctial, "sunlight": sunlight, "beta": beta,
@@ -1198,7 +1259,21 @@ def propagate(
                 print(f"Error: {e}", file=sys.stderr)
                 raise typer.Exit(code=2)
 
-    from thistle import Propagator, generate, read_tle as read_tle_file
+    grid: Optional[tuple[datetime, datetime]] = None
+    if start is not None or stop is not None:
+        if start is None or stop is None:
+            print("Error: --start and --stop must be given together", file=sys.stderr)
+            raise typer.Exit(code=2)
+        if step <= 0:
+            print(f"Error: --step must be positive, got {step}", file=sys.stderr)
+            raise typer.Exit(code=2)
+        try:
+            grid = (datetime.fromisoformat(start), datetime.fromisoformat(stop))
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            raise typer.Exit(code=2)
+
+    from thistle import Propagator, generate, generate_iter, read_tle as read_tle_file
 
     file = _resolve_tle_path(file)
     try:
@@ -1211,10 +1286,35 @@ def propagate(
         print(f"Error: no TLEs found in {file}", file=sys.stderr)
         raise typer.Exit(code=2)
 
-    propagator = Propagator(tles, method=switch.value)
+    propagator = Propagator(
+        tles, method=switch.value, cache_dir=load_config().cache_dir
+    )
 
-    out_delim = delimiter if delimiter is not None else " "
-    header_emitted = False
+    if fmt in BINARY_FORMATS and output is None and sys.stdout.isatty():
+        print(
+            f"Error: refusing to write {fmt.value} to a terminal (use -o FILE)",
+            file=sys.stderr,
+        )
+        raise typer.Exit(code=2)
+
+    try:
+        unit = grid_time_unit(grid[0], step) if grid is not None else None
+        writer = open_writer(fmt, output, delimiter, print_header, align, unit)
+    except ImportError:
+        print(
+            f"Error: --format {fmt.value} requires pyarrow.\n"
+            "Install with: pip install 'thistle[arrow]'",
+            file=sys.stderr,
+        )
+        raise typer.Exit(code=2)
+
+    if grid is not None:
+        for data in generate_iter(
+            grid[0], grid[1], step, propagator, groups, chunk=chunk, sites=sites_dict
+        ):
+            writer.write(data)
+        writer.close()
+        return
 
     warn_if_tty(sys.stdin, "propagate")
 
@@ -1224,41 +1324,6 @@ def propagate(
             if not line:
                 break
 
-    def _emit_header(data_keys: list[str]) -> None:
-        nonlocal header_emitted
-        if header_emitted or not print_header:
-            return
-        fields = ["time"] + [k for k in data_keys if k != "times"]
-        sys.stdout.write(out_delim.join(fields) + "\n")
-        header_emitted = True
-
-    def _emit_rows(data: dict[str, np.ndarray], times_iso: list[str]) -> None:
-        keys = [k for k in data.keys() if k != "times"]
-        _emit_header(keys)
-
-        n = len(times_iso)
-        rows: list[list[str]] = []
-        for i in range(n):
-            fields = [times_iso[i]]
-            for k in keys:
-                val = data[k][i]
-                if isinstance(val, (np.floating, float)):
-                    fields.append(f"{val:g}")
-                elif isinstance(val, (np.integer, int)):
-                    fields.append(str(int(val)))
-                else:
-                    fields.append(str(val))
-            rows.append(fields)
-
-        if align:
-            writer = AlignedWriter(out_delim)
-            for row in rows:
-                writer.add_row(row)
-            writer.flush()
-        else:
-            for row in rows:
-                sys.stdout.write(out_delim.join(row) + "\n")
-
     while True:
         chunk_times: list[np.datetime64] = []
         chunk_iso: list[str] = []
@@ -1288,4 +1353,6 @@ def propagate(
 
         times_arr = np.array(chunk_times, dtype="datetime64[ns]")
         data = generate(times_arr, propagator, groups, sites=sites_dict)
-        _emit_rows(data, chunk_iso)
+        writer.write(data, chunk_iso)
+
+    writer.close()
@@ -5,6 +5,9 @@ Settings (env vars only, no config file):
 - ``THISTLE_TLE_DIR``: directory of per-object TLE files, enabling catalog-ID
   file arguments (``thistle plot 25544`` instead of a path).
 - ``THISTLE_TLE_EXT``: filename extension for those files (default ``.tle``).
+- ``THISTLE_CACHE_DIR``: directory for cached TLE switching transitions, so
+  repeated runs against the same TLE file skip recomputing them (TCA in
+  particular). Unset disables the cache.
 """
 
 from __future__ import annotations
@@ -17,6 +20,7 @@ from typing import Optional
 
 TLE_DIR_ENV = "THISTLE_TLE_DIR"
 TLE_EXT_ENV = "THISTLE_TLE_EXT"
+CACHE_DIR_ENV = "THISTLE_CACHE_DIR"
 DEFAULT_EXT = ".tle"
 
 # All digits, or Alpha-5: satnums >= 100000 encode the leading digits as a
@@ -28,6 +32,7 @@ _CATALOG_ID_RE = re.compile(r"^(\d{1,9}|[A-HJ-NP-Za-hj-np-z]\d{4})$")
 class CliConfig:
     tle_dir: Optional[pathlib.Path]
     tle_ext: str
+    cache_dir: Optional[pathlib.Path] = None
 
 
 def load_config() -> CliConfig:
@@ -36,9 +41,11 @@ def load_config() -> CliConfig:
     ext = os.environ.get(TLE_EXT_ENV, DEFAULT_EXT)
     if ext and not ext.startswith("."):
         ext = "." + ext
+    cache_val = os.environ.get(CACHE_DIR_ENV)
     return CliConfig(
         tle_dir=pathlib.Path(dir_val) if dir_val else None,
         tle_ext=ext,
+        cache_dir=pathlib.Path(cache_val) if cache_val else None,
     )
 
 
@@ -5,7 +5,8 @@ from __future__ import annotations
 import math
 import sys
 from datetime import datetime, timedelta
-from typing import TextIO
+from itertools import repeat
+from typing import Iterable, Sequence, TextIO
 
 import numpy as np
 from sgp4.api import Satrec
@@ -285,11 +286,17 @@ def parse_tle_epochs(source: TextIO) -> list[tuple[str, str, Satrec]]:
 class AlignedWriter:
     """Buffers rows and flushes with aligned columns."""
 
-    def __init__(self, delimiter: str, numeric: list[bool] | None = None):
+    def __init__(
+        self,
+        delimiter: str,
+        numeric: list[bool] | None = None,
+        stream: TextIO | None = None,
+    ):
         self._delim = delimiter
         self._rows: list[list[str]] = []
         self._widths: list[int] = []
         self._numeric = numeric
+        self._stream = stream
 
     def add_row(self, fields: list[str]) -> None:
         for i, f in enumerate(fields):
@@ -302,18 +309,51 @@ class AlignedWriter:
         self._rows.append(fields)
 
     def flush(self) -> None:
-        for row in self._rows:
-            parts: list[str] = []
-            for i, f in enumerate(row):
-                w = self._widths[i] if i < len(self._widths) else len(f)
-                if self._numeric and i < len(self._numeric) and self._numeric[i]:
-                    parts.append(f.rjust(w))
-                else:
-                    parts.append(f.ljust(w))
-            sys.stdout.write(self._delim.join(parts).rstrip() + "\n")
+        if not self._rows:
+            return
+        stream = self._stream if self._stream is not None else sys.stdout
+        delim, widths, numeric = self._delim, self._widths, self._numeric
+        if len({len(row) for row in self._rows}) == 1:
+            columns = list(zip(*self._rows))
+            stream.write(join_columns(columns, delim, widths, numeric))
+        else:
+            for row in self._rows:
+                stream.write(join_columns([[f] for f in row], delim, widths, numeric))
         self._rows.clear()
 
 
+def join_columns(
+    columns: Sequence[Sequence[str]],
+    delimiter: str,
+    widths: Sequence[int] | None = None,
+    numeric: Sequence[bool] | None = None,
+) -> str:
+    """Join equal-length string columns into newline-terminated rows.
+
+    With ``widths``, each column is padded to its width (right-justified
+    where ``numeric`` is set, left-justified otherwise). The last column is
+    never left-padded so rows carry no trailing whitespace. Padding and
+    joining run column-wise through ``map``, so the per-row cost stays in C.
+    """
+    if not columns or not len(columns[0]):
+        return ""
+    cells: Sequence[Iterable[str]] = columns
+    if widths is not None:
+        last = len(columns) - 1
+        padded: list[Iterable[str]] = []
+        for i, col in enumerate(columns):
+            right = bool(numeric and i < len(numeric) and numeric[i])
+            w = widths[i] if i < len(widths) else 0
+            if right:
+                padded.append(map(str.rjust, col, repeat(w)))
+            elif i < last:
+                padded.append(map(str.ljust, col, repeat(w)))
+            else:
+                padded.append(col)
+        cells = padded
+    return "\n".join(map(delimiter.join, zip(*cells))) + "\n"
+
+
 def read_and_emit_tles(
     source: TextIO,
     writer: AlignedWriter,
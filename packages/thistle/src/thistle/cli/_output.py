@@ -0,0 +1,248 @@
+"""Column writers for ``thistle propagate`` output.
+
+Each writer receives the column dict returned by :func:`thistle.generate`
+one chunk at a time. The text writers need nothing beyond NumPy; Parquet
+and Arrow import pyarrow (the ``arrow`` extra) only when selected.
+"""
+
+from __future__ import annotations
+
+import datetime
+import pathlib
+import sys
+from enum import Enum
+from typing import IO, Any, Literal, Optional
+
+import numpy as np
+
+from thistle.cli._helpers import join_columns
+
+
+class OutputFormat(str, Enum):
+    text = "text"
+    csv = "csv"
+    parquet = "parquet"
+    arrow = "arrow"
+    npz = "npz"
+
+
+BINARY_FORMATS = {OutputFormat.parquet, OutputFormat.arrow, OutputFormat.npz}
+
+TimeUnit = Literal["s", "ms", "us", "ns"]
+
+
+class TextWriter:
+    """Writes delimited text rows, formatting one column at a time.
+
+    Floats use ``%g``, integers their decimal form. Each chunk is written
+    with a single ``write`` call. With ``align``, column widths are a
+    running maximum (seeded from the header), so rows stream out as each
+    chunk arrives; a column only widens when a later chunk carries a
+    longer value.
+
+    Times print at *time_unit*; without one, the unit is picked from the
+    first chunk and kept for the rest of the run, so every row carries the
+    same number of fractional digits.
+    """
+
+    def __init__(
+        self,
+        stream: IO[str],
+        delimiter: str,
+        print_header: bool = False,
+        align: bool = False,
+        time_unit: Optional[TimeUnit] = None,
+    ):
+        self._stream = stream
+        self._delim = delimiter
+        self._print_header = print_header
+        self._align = align
+        self._widths: Optional[list[int]] = None
+        self._time_unit: Optional[TimeUnit] = time_unit
+
+    def write(
+        self, data: dict[str, np.ndarray], times_iso: Optional[list[str]] = None
+    ) -> None:
+        keys = [k for k in data.keys() if k != "times"]
+        if times_iso is None:
+            if self._time_unit is None and len(data["times"]):
+                self._time_unit = time_unit(data["times"])
+            times_iso = iso_times(data["times"], self._time_unit)
+        columns = [times_iso] + [format_column(data[k]) for k in keys]
+
+        header = None
+        if self._widths is None:
+            names = ["time"] + keys
+            self._widths = [len(name) for name in names]
+            if self._print_header:
+                header = [[name] for name in names]
+
+        if not self._align:
+            if header is not None:
+                self._stream.write(join_columns(header, self._delim))
+            self._stream.write(join_columns(columns, self._delim))
+            return
+
+        for i, col in enumerate(columns):
+            if col:
+                self._widths[i] = max(self._widths[i], max(map(len, col)))
+        text = join_columns(columns, self._delim, self._widths)
+        if header is not None:
+            text = join_columns(header, self._delim, self._widths) + text
+        self._stream.write(text)
+
+    def close(self) -> None:
+        if self._stream is sys.stdout:
+            self._stream.flush()
+        else:
+            self._stream.close()
+
+
+def format_column(values: np.ndarray) -> list[str]:
+    """Format a NumPy column as text: ``%g`` for floats, decimal for integers."""
+    if values.dtype.kind == "f":
+        return list(map("{:g}".format, values.tolist()))
+    if values.dtype.kind == "M":
+        return iso_times(values)
+    return list(map(str, values.tolist()))
+
+
+def time_unit(times: np.ndarray) -> TimeUnit:
+    """The coarsest unit (s, ms, us or ns) that represents every time exactly."""
+    ticks = times.astype("datetime64[ns]").view(np.int64)
+    if not np.any(ticks % 10**9):
+        return "s"
+    if not np.any(ticks % 10**6):
+        return "ms"
+    if not np.any(ticks % 10**3):
+        return "us"
+    return "ns"
+
+
+def grid_time_unit(start: datetime.datetime, step: float) -> TimeUnit:
+    """The :func:`time_unit` for every time of a ``start + k * step`` grid.
+
+    Built the way :func:`thistle.generate_iter` builds its grid. If the
+    first two samples are exact at a unit, every later sample is too, so
+    the unit is known before any chunk is propagated.
+    """
+    from thistle.utils import ONE_SECOND_IN_TIME_SCALE, validate_datetime64
+
+    t0 = validate_datetime64(start)
+    return time_unit(t0 + np.arange(2) * (step * ONE_SECOND_IN_TIME_SCALE))
+
+
+def iso_times(times: np.ndarray, unit: Optional[TimeUnit] = None) -> list[str]:
+    """ISO 8601 strings for a datetime64 array.
+
+    Whole-second values print as ``YYYY-MM-DDTHH:MM:SS``; sub-second values
+    add fractional digits down to *unit* (by default :func:`time_unit`,
+    just enough for every element).
+    """
+    ns = times.astype("datetime64[ns]")
+    if unit is None:
+        unit = time_unit(ns)
+    return np.datetime_as_string(ns, unit=unit).tolist()
+
+
+class ArrowWriter:
+    """Streams each chunk as one Arrow record batch or Parquet row group.
+
+    Columns keep their NumPy dtypes (float64 positions, float32 angles,
+    int8 sunlight flags); the ``times`` array becomes a ``time`` timestamp
+    column. No per-row Python work is done.
+    """
+
+    def __init__(self, sink: IO[bytes], parquet: bool):
+        self._sink = sink
+        self._parquet = parquet
+        self._writer = None
+
+    def write(
+        self, data: dict[str, np.ndarray], times_iso: Optional[list[str]] = None
+    ) -> None:
+        import pyarrow as pa
+
+        columns = {"time": data["times"]}
+        columns.update((k, v) for k, v in data.items() if k != "times")
+        table = pa.table(columns)
+        if self._writer is None:
+            if self._parquet:
+                import pyarrow.parquet as pq
+
+                self._writer = pq.ParquetWriter(self._sink, table.schema)
+            else:
+                self._writer = pa.ipc.new_stream(self._sink, table.schema)
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        _close_sink(self._sink)
+
+
+class NpzWriter:
+    """Collects every chunk and writes one ``.npz`` archive on close.
+
+    The NPZ container cannot be appended to, so unlike the other formats
+    this one holds the full output in memory until the end.
+    """
+
+    def __init__(self, sink: IO[bytes]):
+        self._sink = sink
+        self._chunks: list[dict[str, np.ndarray]] = []
+
+    def write(
+        self, data: dict[str, np.ndarray], times_iso: Optional[list[str]] = None
+    ) -> None:
+        self._chunks.append(data)
+
+    def close(self) -> None:
+        if self._chunks:
+            keys = list(self._chunks[0])
+            arrays: dict[str, Any] = {
+                ("time" if k == "times" else k): np.concatenate(
+                    [c[k] for c in self._chunks]
+                )
+                for k in keys
+            }
+            np.savez(self._sink, **arrays)
+        _close_sink(self._sink)
+
+
+def _close_sink(sink: IO[bytes]) -> None:
+    if sink is sys.stdout.buffer:
+        sink.flush()
+    else:
+        sink.close()
+
+
+def open_writer(
+    fmt: OutputFormat,
+    output: Optional[pathlib.Path],
+    delimiter: Optional[str],
+    print_header: bool,
+    align: bool,
+    time_unit: Optional[TimeUnit] = None,
+):
+    """Build the writer for *fmt*, writing to *output* or stdout.
+
+    The writer owns *output* and closes it in ``close()``. *time_unit*
+    fixes the fractional-second precision of text output.
+
+    Raises:
+        ImportError: If a pyarrow-backed format is requested without pyarrow.
+    """
+    if fmt in (OutputFormat.text, OutputFormat.csv):
+        default = "," if fmt is OutputFormat.csv else " "
+        delim = delimiter if delimiter is not None else default
+        stream = open(output, "w") if output is not None else sys.stdout
+        return TextWriter(stream, delim, print_header, align, time_unit)
+
+    if fmt is not OutputFormat.npz:
+        import pyarrow  # noqa: F401 -- fail before creating the output file
+
+    sink = open(output, "wb") if output is not None else sys.stdout.buffer
+    if fmt is OutputFormat.npz:
+        return NpzWriter(sink)
+    return ArrowWriter(sink, parquet=fmt is OutputFormat.parquet)
@@ -1,48 +1,556 @@
 """Functions for finding satellite events: passes, node crossings, sunlit/eclipse and ascending/descending periods."""
 
-from typing import Optional, Union, cast
+import concurrent.futures
+import functools
+from typing import Any, Callable, Literal, Optional, Sequence, Union, cast, get_args
 
 import numpy as np
 import numpy.typing as npt
-import skyfield.timelib
-from skyfield import almanac
+from sgp4.api import Satrec, SatrecArray
+from sgp4.earth_gravity import wgs72
+from sgp4.exporter import export_tle
 from skyfield.api import EarthSatellite, wgs84
+from skyfield.constants import ERAD
+from skyfield.functions import mxv
+from skyfield.geometry import intersect_line_and_sphere
 
-from thistle._core import eph, ts
-from thistle.utils import jday_datetime64, time_to_dt64
+from thistle._core import RawState, Sites, eph, propagate_raw, teme_rotation, ts
+from thistle.tle_array import TLEArray
+from thistle.utils import jday_datetime64, validate_datetime64
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from thistle.propagator import Propagator
 
+EventKind = Literal[
+    "passes", "node_crossings", "sunlit", "eclipse", "ascending", "descending"
+]
+
 
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+# Coarse sampling step of the event search. Events closer together than
+# this can be missed, as with Skyfield's find_discrete at the same step.
+_SEARCH_STEP = np.timedelta64(60, "s")
+
+# Bisection stops once every bracket is this narrow.
+_SEARCH_TOLERANCE = np.timedelta64(1, "ms")
+
+# Passes are searched over a window padded by this much on each side, so
+# passes clipped at the window edges keep their true rise and set times.
+_PASS_PAD = np.timedelta64(100, "m")
+
+# Site-samples per block when evaluating all ground sites on the coarse
+# grid, bounding the (3, n_sites, block) temporaries to a few tens of MB.
+_SITE_BLOCK = 1 << 20
+
+# Slack on the geometric prefilter of find_catalog_passes, covering the
+# difference between the mean elements and the osculating SGP4 orbit.
+_PREFILTER_MARGIN_DEG = 1.0
+
+# find_catalog_passes first screens every satellite at this many grid
+# samples apart, to skip the stretches where it cannot be near the site.
+_SCREEN_STRIDE = 10
+
+_EARTH_ROTATION_RATE = 7.292115e-5  # rad/s
+
+# With workers, each worker gets several chunks so that uneven chunks still
+# balance. Chunks are at least a day long, as each repeats the grid setup
+# and, for passes, searches 100 minutes past both of its ends.
+_CHUNKS_PER_WORKER = 4
+_MIN_CHUNK = np.timedelta64(1, "D")
+
+_CATALOG_PASS_DTYPE = np.dtype(
+    [
+        ("index", np.intp),
+        ("satnum", np.int32),
+        ("start", "datetime64[us]"),
+        ("stop", "datetime64[us]"),
+        ("peak_time", "datetime64[us]"),
+        ("peak_elevation", np.float64),
+    ]
+)
+
+# Spacing of the nodes at which the TEME -> GCRS rotation and the Sun
+# position are evaluated with Skyfield, once per search window, before being
+# interpolated linearly onto the predicate samples (as RawState.gcrs does).
+# The Sun error, ~10 km at 1 au, moves shadow boundaries by under 1 mm.
+_TABLE_STEP_DAYS = 1.0 / 24.0
+
+
+class _WindowTables:
+    """Hourly Skyfield tables shared by every state in a search window."""
+
+    def __init__(self, start: np.datetime64, stop: np.datetime64) -> None:
+        jd, fr = jday_datetime64(np.array([start, stop], dtype="datetime64[us]"))
+        lo, hi = jd + fr
+        n_nodes = max(2, int(np.ceil((hi - lo) / _TABLE_STEP_DAYS)) + 1)
+        self.nodes = np.linspace(lo, hi, n_nodes)
+
+    @functools.cached_property
+    def _node_time(self):
+        return ts.ut1_jd(self.nodes)
+
+    @functools.cached_property
+    def teme_rotation(self) -> npt.NDArray[np.float64]:
+        """TEME -> GCRS rotation at each node, shape (3, 3, n_nodes)."""
+        return teme_rotation(self._node_time)
+
+    @functools.cached_property
+    def sun_m(self) -> npt.NDArray[np.float64]:
+        """GCRS position of the Sun (m) at each node, shape (3, n_nodes)."""
+        return (eph["sun"] - eph["earth"]).at(self._node_time).xyz.m
+
+    def interp(
+        self, jd: npt.NDArray[np.float64], table: npt.NDArray[np.float64]
+    ) -> npt.NDArray[np.float64]:
+        """Interpolate a node table (nodes on the last axis) linearly to *jd*."""
+        flat = table.reshape(-1, len(self.nodes))
+        out = np.array([np.interp(jd, self.nodes, row) for row in flat])
+        return out.reshape(table.shape[:-1] + (len(jd),))
+
+
+class _WindowState(RawState):
+    """Raw SGP4 state whose GCRS rotation and Sun come from window tables."""
+
+    def __init__(self, state: RawState, tables: _WindowTables) -> None:
+        super().__init__(state.jd, state.fr, state.r, state.v)
+        self.tables = tables
+
+    def __getitem__(self, index: Union[slice, npt.NDArray]) -> "_WindowState":
+        return _WindowState(super().__getitem__(index), self.tables)
+
+    @functools.cached_property
+    def gcrs(self) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """GCRS position (km) and velocity (km/s), shape (3, n)."""
+        R = self.tables.interp(self.jd + self.fr, self.tables.teme_rotation)
+        return mxv(R, self.r), mxv(R, self.v)
+
+    @functools.cached_property
+    def sun_m(self) -> npt.NDArray[np.float64]:
+        """GCRS position of the Sun (m), shape (3, n)."""
+        return self.tables.interp(self.jd + self.fr, self.tables.sun_m)
+
+
+Predicate = Callable[[_WindowState], npt.NDArray[np.bool_]]
+
+
+def _is_north(state: _WindowState) -> npt.NDArray[np.bool_]:
+    # Geodetic latitude has the sign of z, which TEME shares with ITRS
+    return state.r[2] >= 0
+
+
+def _is_sunlit(state: _WindowState) -> npt.NDArray[np.bool_]:
+    # Same test as Skyfield's ICRF.is_sunlit
+    earth_m = -state.gcrs[0] * 1000.0
+    _, far = intersect_line_and_sphere(state.sun_m + earth_m, earth_m, ERAD)
+    return np.nan_to_num(far) <= 0
+
+
+def _is_ascending(state: _WindowState) -> npt.NDArray[np.bool_]:
+    return state.gcrs[1][2] > 0
 
-def _to_skyfield(time: np.datetime64) -> skyfield.timelib.Time:
-    """Convert a single datetime64 to a scalar Skyfield Time."""
-    jd, fr = jday_datetime64(np.atleast_1d(time))
-    return ts.ut1_jd(float(jd[0]) + float(fr[0]))
 
+class _GroundSites:
+    """ITRS positions and zenith directions of ground sites.
 
-def _split_window(
+    Without *rows*, the methods evaluate every site at every sample and
+    return (n_sites, n) arrays. With *rows*, sample ``i`` is evaluated for
+    site ``rows[i]`` only and the result has shape (n,).
+    """
+
+    def __init__(
+        self, sites: Sequence[tuple[float, float, float]], min_elevation: float
+    ) -> None:
+        lat, lon, alt = np.asarray(sites, dtype=np.float64).reshape(-1, 3).T
+        height = cast(float, alt)  # latlon broadcasts over arrays
+        self.xyz = wgs84.latlon(lat, lon, elevation_m=height).itrs_xyz.km
+        lat_r, lon_r = np.radians(lat), np.radians(lon)
+        self.up = np.array(
+            [
+                np.cos(lat_r) * np.cos(lon_r),
+                np.cos(lat_r) * np.sin(lon_r),
+                np.sin(lat_r),
+            ]
+        )
+        self.sin_min = np.sin(np.radians(min_elevation))
+
+    def __len__(self) -> int:
+        return self.xyz.shape[1]
+
+    def _line_of_sight(
+        self, state: RawState, rows: Optional[npt.NDArray[np.intp]]
+    ) -> tuple[npt.NDArray[np.float64], ...]:
+        """Site-to-satellite vector, its rate and the site zenith."""
+        r, v = state.itrs
+        if rows is None:
+            rho = r[:, np.newaxis, :] - self.xyz[:, :, np.newaxis]
+            return rho, v[:, np.newaxis, :], self.up[:, :, np.newaxis]
+        return r - self.xyz[:, rows], v, self.up[:, rows]
+
+    def elevation(
+        self, state: RawState, rows: Optional[npt.NDArray[np.intp]] = None
+    ) -> npt.NDArray[np.float64]:
+        """Geometric elevation (deg) of the satellite above the horizon."""
+        rho, _, up = self._line_of_sight(state, rows)
+        sin_el = np.sum(up * rho, axis=0) / np.linalg.norm(rho, axis=0)
+        return np.degrees(np.arcsin(sin_el))
+
+    def visible(
+        self, state: RawState, rows: Optional[npt.NDArray[np.intp]] = None
+    ) -> npt.NDArray[np.bool_]:
+        """Whether the elevation is at least the minimum."""
+        rho, _, up = self._line_of_sight(state, rows)
+        return np.sum(up * rho, axis=0) >= self.sin_min * np.linalg.norm(rho, axis=0)
+
+    def rising(
+        self, state: RawState, rows: Optional[npt.NDArray[np.intp]] = None
+    ) -> npt.NDArray[np.bool_]:
+        """Whether the elevation is increasing."""
+        rho, rho_dot, up = self._line_of_sight(state, rows)
+        # Sign of d/dt (up . rho / |rho|), scaled by |rho|^3 > 0
+        range_sq = np.sum(rho * rho, axis=0)
+        range_rate = np.sum(rho * rho_dot, axis=0)
+        up_rate = np.sum(up * rho_dot, axis=0)
+        return up_rate * range_sq > np.sum(up * rho, axis=0) * range_rate
+
+
+def _search_grid(
     start: np.datetime64,
     stop: np.datetime64,
-    propagator: "Propagator",
-) -> list[tuple[np.datetime64, np.datetime64, EarthSatellite]]:
-    """Split a time window into sub-windows at TLE transition boundaries."""
-    transitions = propagator.switcher.transitions
-    inner = transitions[(transitions > start) & (transitions < stop)]
-    boundaries = np.concatenate([[start], inner, [stop]])
-    result = []
-    for i in range(len(boundaries) - 1):
-        sub_start, sub_stop = boundaries[i], boundaries[i + 1]
-        sat = propagator.find_satellite(sub_start + (sub_stop - sub_start) // 2)
-        result.append((sub_start, sub_stop, sat))
-    return result
+    pad: np.timedelta64,
+    limits: Optional[tuple[np.datetime64, np.datetime64]] = None,
+) -> npt.NDArray[np.datetime64]:
+    """Coarse datetime64[us] grid over the padded window, with start and stop.
+
+    With *limits*, the padding stops at those bounds, which must contain
+    [start, stop].
+    """
+    start = validate_datetime64(start)
+    stop = validate_datetime64(stop)
+    lo, hi = start - pad, stop + pad
+    if limits is not None:
+        lo, hi = max(lo, limits[0]), min(hi, limits[1])
+    grid = np.arange(lo, hi, _SEARCH_STEP, dtype="datetime64[us]")
+    return np.unique(np.concatenate([grid, [start, stop, hi]]))
+
+
+def _bisect(
+    grid: npt.NDArray[np.datetime64],
+    propagate: Callable[[npt.NDArray[np.datetime64]], Any],
+    jobs: Sequence[tuple[Predicate, npt.NDArray[np.intp], npt.NDArray[np.bool_]]],
+    tolerance: np.timedelta64 = _SEARCH_TOLERANCE,
+) -> list[npt.NDArray[np.datetime64]]:
+    """Refine the brackets of several predicates together.
+
+    Each job is ``(predicate, index, after)``: the predicate changes to
+    ``after`` between ``grid[index]`` and ``grid[index + 1]``. Every
+    iteration propagates once, at the midpoints of all brackets of all
+    jobs, and evaluates each predicate on its own brackets, so the number of
+    propagations grows with log2(step / tolerance) rather than with the
+    number of events or predicates. *propagate* may return any state that
+    the predicates accept and that slices like an array.
+
+    Returns:
+        For each job, the datetime64[us] event times: the first microsecond
+        at which ``after`` holds, to within *tolerance*.
+    """
+    ticks = grid.astype(np.int64)
+    bounds = np.cumsum([0] + [len(index) for _, index, _ in jobs])
+    slices = [slice(a, b) for a, b in zip(bounds[:-1].tolist(), bounds[1:].tolist())]
+    lo = np.concatenate([ticks[index] for _, index, _ in jobs] + [[]])
+    hi = np.concatenate([ticks[index + 1] for _, index, _ in jobs] + [[]])
+    lo, hi = lo.astype(np.int64), hi.astype(np.int64)
+    after = np.concatenate([a for _, _, a in jobs] + [[]]).astype(bool)
+
+    tol = tolerance.astype("timedelta64[us]").astype(np.int64)
+    while len(lo) and np.max(hi - lo) > tol:
+        mid = lo + (hi - lo) // 2
+        state = propagate(mid.astype("datetime64[us]"))
+        switched = np.zeros(len(mid), dtype=bool)
+        for (predicate, _, _), sl in zip(jobs, slices):
+            if sl.start < sl.stop:
+                switched[sl] = predicate(state[sl]) == after[sl]
+        hi = np.where(switched, mid, hi)
+        lo = np.where(switched, lo, mid)
+
+    return [hi[sl].astype("datetime64[us]") for sl in slices]
+
+
+def _changes(
+    values: npt.NDArray[np.bool_],
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.bool_]]:
+    """Grid indices *i* where ``values`` changes between i and i + 1."""
+    index = np.flatnonzero(values[1:] != values[:-1])
+    return index, values[index + 1]
+
+
+def _pair_edges(
+    start: np.datetime64,
+    stop: np.datetime64,
+    edges: npt.NDArray[np.datetime64],
+    rises: npt.NDArray[np.bool_],
+    visible_at_first: bool,
+) -> list[tuple[np.datetime64, np.datetime64]]:
+    """Pair one site's rise and set times into passes overlapping [start, stop].
+
+    A pass already up at the start of the search keeps *start* as its rise
+    and one still up at the end gets *stop* as its set.
+    """
+    intervals = []
+    rise: Optional[np.datetime64] = start if visible_at_first else None
+    for dt, is_rise in zip(edges, rises):
+        if is_rise:
+            rise = dt
+        elif rise is not None:
+            intervals.append((rise, dt))
+            rise = None
+    if rise is not None:
+        intervals.append((rise, stop))
+    return [(r, s) for r, s in intervals if s > start and r < stop]
+
+
+def _peak_times(
+    rise: npt.NDArray[np.datetime64],
+    set_: npt.NDArray[np.datetime64],
+    culminations: npt.NDArray[np.datetime64],
+    elevation: npt.NDArray[np.float64],
+) -> npt.NDArray[np.datetime64]:
+    """Per pass, the highest culmination inside it, or its rise if none is."""
+    peaks = rise.copy()
+    index = np.searchsorted(rise, culminations, side="right") - 1
+    inside = index >= 0
+    inside[inside] = culminations[inside] <= set_[index[inside]]
+    index, culminations = index[inside], culminations[inside]
+    if len(index):
+        # Sorted by pass then elevation, the last of each pass is its highest
+        order = np.lexsort((elevation[inside], index))
+        last = order[np.append(index[order][1:] != index[order][:-1], True)]
+        peaks[index[last]] = culminations[last]
+    return peaks
+
+
+def _pass_brackets(
+    visible: npt.NDArray[np.bool_], rising: npt.NDArray[np.bool_]
+) -> tuple[
+    tuple[npt.NDArray[np.intp], npt.NDArray[np.intp], npt.NDArray[np.bool_]],
+    tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]],
+]:
+    """Pass brackets in (n_rows, n_grid) visibility and elevation-rate matrices.
+
+    Returns:
+        ``(rows, index, rises)`` of the rise and set brackets, and
+        ``(rows, index)`` of the culminations (rising -> falling) next to a
+        visible sample. Both are sorted by row, then time.
+    """
+    edge_rows, edge_index = np.nonzero(visible[:, 1:] != visible[:, :-1])
+    rises = visible[edge_rows, edge_index + 1]
+    culm_rows, culm_index = np.nonzero(
+        rising[:, :-1] & ~rising[:, 1:] & (visible[:, :-1] | visible[:, 1:])
+    )
+    return (edge_rows, edge_index, rises), (culm_rows, culm_index)
+
+
+def _assemble_passes(
+    start: np.datetime64,
+    stop: np.datetime64,
+    elevation: Callable[
+        [npt.NDArray[np.datetime64], npt.NDArray[np.intp]], npt.NDArray[np.float64]
+    ],
+    visible_at_first: npt.NDArray[np.bool_],
+    edges: tuple[
+        npt.NDArray[np.datetime64], npt.NDArray[np.intp], npt.NDArray[np.bool_]
+    ],
+    culminations: tuple[npt.NDArray[np.datetime64], npt.NDArray[np.intp]],
+) -> list[list[dict]]:
+    """Build the pass dicts of every row (a site, or a satellite).
+
+    Args:
+        start: Start of the time window.
+        stop: End of the time window.
+        elevation: Elevation (deg) at given times, each for the given row.
+        visible_at_first: Per row, whether the search started in a pass.
+        edges: Rise and set times, their rows and whether each is a rise.
+        culminations: Elevation maxima times and their rows.
+
+    Returns:
+        Per row, the passes as dicts.
+    """
+    edge_times, edge_rows, rises = edges
+    culm_times, culm_rows = culminations
+    n_rows = len(visible_at_first)
+    culm_el = elevation(culm_times, culm_rows) if len(culm_times) else np.empty(0)
+
+    # Both event lists are sorted by row, then time
+    rows = np.arange(n_rows + 1)
+    edge_bounds = np.searchsorted(edge_rows, rows).tolist()
+    culm_bounds = np.searchsorted(culm_rows, rows).tolist()
+
+    intervals, peak_times, peak_rows = [], [], []
+    for k in range(n_rows):
+        edge = slice(edge_bounds[k], edge_bounds[k + 1])
+        row_intervals = _pair_edges(
+            start, stop, edge_times[edge], rises[edge], bool(visible_at_first[k])
+        )
+        culm = slice(culm_bounds[k], culm_bounds[k + 1])
+        rise_k = np.array([r for r, _ in row_intervals], dtype="datetime64[us]")
+        set_k = np.array([s for _, s in row_intervals], dtype="datetime64[us]")
+        peak_times.append(_peak_times(rise_k, set_k, culm_times[culm], culm_el[culm]))
+        peak_rows.append(np.full(len(row_intervals), k, dtype=np.intp))
+        intervals.append(row_intervals)
+
+    peak_times = np.concatenate(peak_times)
+    peak_rows = np.concatenate(peak_rows)
+    peak_el = elevation(peak_times, peak_rows) if len(peak_times) else np.empty(0)
+
+    passes: list[list[dict]] = []
+    offset = 0
+    for row_intervals in intervals:
+        n = len(row_intervals)
+        passes.append(
+            [
+                {"start": r, "stop": s, "peak_time": t, "peak_elevation": el}
+                for (r, s), t, el in zip(
+                    row_intervals,
+                    peak_times[offset : offset + n],
+                    peak_el[offset : offset + n].tolist(),
+                )
+            ]
+        )
+        offset += n
+    return passes
+
+
+def _mean_orbits(
+    satellites: Union[TLEArray, Sequence[EarthSatellite]],
+) -> tuple[npt.NDArray, ...]:
+    """Catalog number, inclination (rad), mean motion (rad/min) and eccentricity."""
+    if isinstance(satellites, TLEArray):
+        inc = np.radians(satellites.inc)
+        mean_motion = satellites.mm * (2.0 * np.pi / 1440.0)
+        return satellites.satnum, inc, mean_motion, satellites.ecc
+    models = [satellite.model for satellite in satellites]
+    return (
+        np.array([m.satnum for m in models], dtype=np.int32),
+        np.array([m.inclo for m in models], dtype=np.float64),
+        np.array([m.no_kozai for m in models], dtype=np.float64),
+        np.array([m.ecco for m in models], dtype=np.float64),
+    )
+
+
+def _reach_angles(
+    ground: _GroundSites,
+    min_elevation: float,
+    mean_motion: npt.NDArray[np.float64],
+    ecc: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """Largest site to satellite central angle (rad) at which each orbit is up.
+
+    At apogee radius the satellite is above *min_elevation* within an Earth
+    central angle ``arccos(R cos(el) / r_apogee) - el`` of the site; closer
+    to the Earth the angle is smaller. NaN for orbits whose apogee is too
+    low to ever be seen. Includes the prefilter margin.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        a = wgs72.radiusearthkm * (wgs72.xke / mean_motion) ** (2.0 / 3.0)
+        site_r = np.linalg.norm(ground.xyz[:, 0])
+        el = np.radians(min_elevation)
+        reach = np.arccos(site_r * np.cos(el) / (a * (1.0 + ecc))) - el
+    return reach + np.radians(_PREFILTER_MARGIN_DEG)
+
+
+def _can_reach(
+    ground: _GroundSites, reach: npt.NDArray[np.float64], inc: npt.NDArray[np.float64]
+) -> npt.NDArray[np.bool_]:
+    """Whether each orbit can rise above the minimum elevation at the site.
+
+    The ground track never goes further from the equator than the
+    inclination, so a site further from it than that plus the reach angle
+    never sees the satellite.
+    """
+    site_lat = np.arcsin(ground.xyz[2, 0] / np.linalg.norm(ground.xyz[:, 0]))
+    max_lat = np.minimum(inc, np.pi - inc)
+    return abs(site_lat) <= max_lat + reach
+
+
+def _screen(
+    satrecs: Sequence[Satrec],
+    grid: npt.NDArray[np.datetime64],
+    ground: _GroundSites,
+    reach: npt.NDArray[np.float64],
+    mean_motion: npt.NDArray[np.float64],
+    ecc: npt.NDArray[np.float64],
+) -> npt.NDArray[np.bool_]:
+    """Grid samples of each satellite that can be in, or next to, a pass.
+
+    Satellites are propagated together every ``_SCREEN_STRIDE`` grid
+    samples. The direction to a satellite turns no faster than its orbital
+    angular rate at perigee plus the Earth rotation rate, which bounds from
+    below its central angle from the site between two screening samples.
+    Intervals where that bound exceeds the reach angle cannot hold a pass;
+    the rest, widened by one interval on each side, are kept.
+
+    Returns:
+        An (n_satellites, n_grid) mask.
+    """
+    coarse = np.arange(0, len(grid), _SCREEN_STRIDE)
+    coarse = np.unique(np.append(coarse, len(grid) - 1))
+    jd, fr = jday_datetime64(grid[coarse])
+    site = ground.xyz[:, 0] / np.linalg.norm(ground.xyz[:, 0])
+    angle = np.empty((len(satrecs), len(coarse)))
+    block = max(1, _SITE_BLOCK // len(coarse))
+    for i in range(0, len(satrecs), block):
+        _, r, v = SatrecArray(satrecs[i : i + block]).sgp4(jd, fr)
+        n = len(r)
+        state = RawState(
+            np.tile(jd, n), np.tile(fr, n), r.reshape(-1, 3).T, v.reshape(-1, 3).T
+        )
+        r_itrs = state.itrs[0]
+        cos_angle = site @ r_itrs / np.linalg.norm(r_itrs, axis=0)
+        angle[i : i + n] = np.arccos(np.clip(cos_angle, -1.0, 1.0)).reshape(n, -1)
+
+    # Perigee angular rate n (1 + e)^2 / (1 - e^2)^1.5, with 10% slack
+    rate = mean_motion / 60.0 * (1.0 + ecc) ** 2 / (1.0 - ecc**2) ** 1.5
+    rate = 1.1 * rate + _EARTH_ROTATION_RATE
+    dt = np.diff(grid[coarse]) / np.timedelta64(1, "s")
+    closest = (angle[:, :-1] + angle[:, 1:] - rate[:, None] * dt) / 2.0
+    near = closest <= reach[:, None]
+    near[:, 1:] |= near[:, :-1].copy()
+    near[:, :-1] |= near[:, 1:].copy()
+
+    interval = np.searchsorted(coarse, np.arange(len(grid)), side="right") - 1
+    return near[:, np.minimum(interval, len(coarse) - 2)]
+
+
+def _propagate_rows(
+    satrecs: Sequence[Satrec],
+    rows: npt.NDArray[np.intp],
+    times: npt.NDArray[np.datetime64],
+) -> RawState:
+    """Propagate satellite ``satrecs[rows[i]]`` to ``times[i]``, for every i."""
+    jd, fr = jday_datetime64(times)
+    order = np.argsort(rows, kind="stable")
+    bounds = np.searchsorted(rows[order], np.arange(len(satrecs) + 1)).tolist()
+    # Contiguous runs of each satellite's samples, in row order
+    jd_sorted, fr_sorted = jd[order], fr[order]
+    r = np.empty((len(times), 3))
+    v = np.empty((len(times), 3))
+    for k in np.flatnonzero(np.diff(bounds)).tolist():
+        run = slice(bounds[k], bounds[k + 1])
+        _, r[run], v[run] = satrecs[k].sgp4_array(jd_sorted[run], fr_sorted[run])
+    r_out = np.empty((3, len(times)))
+    v_out = np.empty((3, len(times)))
+    r_out[:, order] = r.T
+    v_out[:, order] = v.T
+    return RawState(jd, fr, r_out, v_out)
+
+
+def _validate_workers(workers: Optional[int]) -> None:
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
 
 
 def _merge_periods(periods: list[dict]) -> list[dict]:
@@ -58,15 +566,175 @@ def _merge_periods(periods: list[dict]) -> list[dict]:
     return merged
 
 
-def _peak_elevation(
-    peak_time: np.datetime64,
-    satellite: EarthSatellite,
-    topos: object,
-) -> float:
-    """Compute the elevation angle at a given time."""
-    t = _to_skyfield(peak_time)
-    alt_deg, _, _ = (satellite - topos).at(t).altaz()
-    return float(cast(float, alt_deg.degrees))
+def _merge_passes(passes: list[dict]) -> list[dict]:
+    """Merge consecutive passes that overlap or touch, keeping the higher peak.
+
+    A pass crossing a chunk boundary is found by both chunks, each with
+    the rise and set times refined on its own grid.
+    """
+    if not passes:
+        return passes
+    merged = [passes[0]]
+    for p in passes[1:]:
+        last = merged[-1]
+        if p["start"] <= last["stop"]:
+            peak = p if p["peak_elevation"] > last["peak_elevation"] else last
+            merged[-1] = {
+                "start": min(last["start"], p["start"]),
+                "stop": max(last["stop"], p["stop"]),
+                "peak_time": peak["peak_time"],
+                "peak_elevation": peak["peak_elevation"],
+            }
+        else:
+            merged.append(p)
+    return merged
+
+
+def _time_chunks(
+    start: np.datetime64, stop: np.datetime64, workers: int
+) -> list[tuple[np.datetime64, np.datetime64]]:
+    """Split [start, stop] into consecutive chunks for *workers* processes."""
+    first = validate_datetime64(start)
+    span = validate_datetime64(stop) - first
+    n = min(workers * _CHUNKS_PER_WORKER, max(1, int(span // _MIN_CHUNK)))
+    edges = [start]
+    edges += [first + span * k // n for k in range(1, n)]
+    edges.append(stop)
+    return list(zip(edges[:-1], edges[1:]))
+
+
+def _covered_windows(
+    start: np.datetime64,
+    stop: np.datetime64,
+    satellite: Union[EarthSatellite, "Propagator"],
+) -> list[tuple[np.datetime64, np.datetime64, Optional[tuple]]]:
+    """Covered parts of [start, stop], each with the coverage interval holding it.
+
+    A Propagator built with ``max_age`` only propagates inside its
+    :meth:`~thistle.propagator.Propagator.coverage`. Returns
+    ``(start, stop, limits)`` windows, where *limits* bounds the padded
+    search grid to the last covered microsecond, or None without max_age.
+    """
+    if isinstance(satellite, EarthSatellite) or satellite.max_age is None:
+        return [(start, stop, None)]
+    start, stop = validate_datetime64(start), validate_datetime64(stop)
+    windows = []
+    for lo, hi in satellite.coverage():
+        last = hi - np.timedelta64(1, "us")  # coverage is [lo, hi)
+        a, b = max(start, lo), min(stop, last)
+        if a < b:
+            windows.append((a, b, (lo, last)))
+    return windows
+
+
+def _portable(
+    satellite: Union[EarthSatellite, "Propagator"],
+) -> Union[tuple[str, str], "Propagator"]:
+    """A picklable stand-in for *satellite*: TLE lines for an EarthSatellite."""
+    if isinstance(satellite, EarthSatellite):
+        return export_tle(satellite.model)
+    return satellite
+
+
+def _find_events_chunk(
+    satellite: Union[tuple[str, str], "Propagator"],
+    start: np.datetime64,
+    stop: np.datetime64,
+    kinds: Sequence[EventKind],
+    sites: Optional[Sites],
+    min_elevation: float,
+) -> dict[str, list[dict]]:
+    """Worker entry point: find events over one chunk of the window."""
+    if isinstance(satellite, tuple):
+        target = EarthSatellite(*satellite, ts=ts)
+    else:
+        target = satellite
+    return find_events(start, stop, target, kinds, sites, min_elevation)
+
+
+def _find_events_parallel(
+    chunks: list[tuple[np.datetime64, np.datetime64]],
+    satellite: Union[EarthSatellite, "Propagator"],
+    kinds: Sequence[EventKind],
+    sites: Optional[Sites],
+    min_elevation: float,
+    workers: int,
+) -> dict[str, list[dict]]:
+    """Search each chunk in a process pool and stitch the results.
+
+    Periods cut at a chunk boundary are joined back together, and a pass
+    found by the chunks on both sides of a boundary is kept once.
+    """
+    payload = _portable(satellite)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(
+                _find_events_chunk, payload, a, b, list(kinds), sites, min_elevation
+            )
+            for a, b in chunks
+        ]
+        parts = [future.result() for future in futures]
+
+    result: dict[str, list[dict]] = {}
+    for key in parts[0]:
+        joined = [event for part in parts for event in part[key]]
+        if key.startswith("passes_"):
+            result[key] = _merge_passes(joined)
+        elif key == "node_crossings":
+            result[key] = joined
+        else:
+            result[key] = _merge_periods(joined)
+    return result
+
+
+def _find_catalog_chunk(
+    tles: Union[TLEArray, list[tuple[str, str]]],
+    start: np.datetime64,
+    stop: np.datetime64,
+    site: tuple[float, float, float],
+    min_elevation: float,
+) -> npt.NDArray:
+    """Worker entry point: find the passes of one group of satellites."""
+    if not isinstance(tles, TLEArray):
+        tles = TLEArray(tles)
+    return find_catalog_passes(start, stop, tles, *site, min_elevation=min_elevation)
+
+
+def _find_catalog_passes_parallel(
+    start: np.datetime64,
+    stop: np.datetime64,
+    satellites: Union[TLEArray, Sequence[EarthSatellite]],
+    candidates: npt.NDArray[np.intp],
+    site: tuple[float, float, float],
+    min_elevation: float,
+    workers: int,
+) -> npt.NDArray:
+    """Search groups of candidate satellites in a process pool.
+
+    Only TLE fields (or lines, for EarthSatellites) are sent to the
+    workers; each group's pass indices are mapped back to *satellites*.
+    """
+    groups = np.array_split(
+        candidates, min(workers * _CHUNKS_PER_WORKER, len(candidates))
+    )
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = []
+        for group in groups:
+            if isinstance(satellites, TLEArray):
+                tles = satellites[group]
+            else:
+                tles = [export_tle(satellites[i].model) for i in group.tolist()]
+            futures.append(
+                pool.submit(_find_catalog_chunk, tles, start, stop, site, min_elevation)
+            )
+        parts = []
+        for group, future in zip(groups, futures):
+            part = future.result()
+            part["index"] = group[part["index"]]
+            parts.append(part)
+
+    result = np.concatenate(parts)
+    return result[np.argsort(result["start"], kind="stable")]
 
 
 def _group_periods(
@@ -100,6 +768,200 @@ def _group_periods(
 # ---------------------------------------------------------------------------
 
 
+_PERIOD_KINDS = ("sunlit", "eclipse", "ascending", "descending")
+
+
+def _search_window(
+    start: np.datetime64,
+    stop: np.datetime64,
+    satellite: Union[EarthSatellite, "Propagator"],
+    kinds: Sequence[EventKind],
+    site_list: list,
+    min_elevation: float,
+    limits: Optional[tuple[np.datetime64, np.datetime64]],
+) -> dict[str, list[dict]]:
+    """Serial event search over one window, as described in :func:`find_events`.
+
+    *limits* bounds the padded search grid, as in :func:`_search_grid`, so
+    that every sample and bracket lies inside one coverage interval.
+    """
+    pad = _PASS_PAD if site_list else np.timedelta64(0, "us")
+    grid = _search_grid(start, stop, pad, limits)
+    tables = _WindowTables(grid[0], grid[-1])
+
+    def propagate(times: npt.NDArray[np.datetime64]) -> _WindowState:
+        return _WindowState(propagate_raw(times, satellite), tables)
+
+    predicates: dict[str, Predicate] = {}
+    if "node_crossings" in kinds:
+        predicates["north"] = _is_north
+    if {"sunlit", "eclipse"} & set(kinds):
+        predicates["sunlit"] = _is_sunlit
+    if {"ascending", "descending"} & set(kinds):
+        predicates["ascending"] = _is_ascending
+
+    state = propagate(grid)
+    values = {name: predicate(state) for name, predicate in predicates.items()}
+
+    # Keep the brackets that matter, then refine them all together. Each
+    # job is (predicate, grid index of the bracket, value after the change).
+    inside = (grid[:-1] >= start) & (grid[1:] <= stop)
+    jobs = {}
+    for name, vals in values.items():
+        index, after = _changes(vals)
+        keep = inside[index]
+        jobs[name] = (predicates[name], index[keep], after[keep])
+
+    # With sites, the pass jobs join the bisection below and site_passes
+    # assembles the ``passes_{suffix}`` entries from its results.
+    site_passes: Optional[Callable[[dict], dict[str, list[dict]]]] = None
+    if site_list:
+        ground = _GroundSites([site[1:] for site in site_list], min_elevation)
+        # (n_sites, n_grid) matrices, in blocks to bound the temporaries
+        block = max(1, _SITE_BLOCK // len(ground))
+        visible = np.empty((len(ground), len(grid)), dtype=bool)
+        rising = np.empty((len(ground), len(grid)), dtype=bool)
+        for i in range(0, len(grid), block):
+            part = state[i : i + block]
+            visible[:, i : i + block] = ground.visible(part)
+            rising[:, i : i + block] = ground.rising(part)
+
+        edges, culminations = _pass_brackets(visible, rising)
+        edge_rows, culm_rows = edges[0], culminations[0]
+        jobs["visible"] = (
+            functools.partial(ground.visible, rows=edge_rows),
+            edges[1],
+            edges[2],
+        )
+        jobs["culminations"] = (
+            functools.partial(ground.rising, rows=culm_rows),
+            culminations[1],
+            np.zeros(len(culm_rows), dtype=bool),
+        )
+
+        def assemble(found: dict) -> dict[str, list[dict]]:
+            passes = _assemble_passes(
+                start,
+                stop,
+                lambda times, rows: ground.elevation(
+                    propagate_raw(times, satellite), rows
+                ),
+                visible[:, 0],
+                (found["visible"], edge_rows, jobs["visible"][2]),
+                (found["culminations"], culm_rows),
+            )
+            return {
+                f"passes_{suffix}": row
+                for (suffix, *_), row in zip(site_list, passes)
+            }
+
+        site_passes = assemble
+
+    found = dict(zip(jobs, _bisect(grid, propagate, list(jobs.values()))))
+    events = {name: (found[name], job[2]) for name, job in jobs.items()}
+
+    at_start = int(np.searchsorted(grid, validate_datetime64(start)))
+    result: dict[str, list[dict]] = {}
+    for kind in kinds:
+        if kind == "node_crossings":
+            times, ascending = events["north"]
+            longitudes = propagate(times).geodetic[1] if len(times) else []
+            result[kind] = [
+                {"start": dt, "stop": dt, "longitude": lon, "ascending": val}
+                for dt, lon, val in zip(
+                    times, np.asarray(longitudes).tolist(), ascending.tolist()
+                )
+            ]
+        elif kind in _PERIOD_KINDS:
+            name = "sunlit" if kind in ("sunlit", "eclipse") else "ascending"
+            times, after = events[name]
+            initial = bool(values[name][at_start])
+            if kind in ("eclipse", "descending"):
+                after, initial = ~after, not initial
+            result[kind] = _group_periods(start, stop, times, after, initial)
+
+    if site_passes is not None:
+        result.update(site_passes(found))
+    return result
+
+
+def find_events(
+    start: np.datetime64,
+    stop: np.datetime64,
+    satellite: Union[EarthSatellite, "Propagator"],
+    kinds: Sequence[EventKind],
+    sites: Optional[Sites] = None,
+    min_elevation: float = 5.0,
+    workers: Optional[int] = None,
+) -> dict[str, list[dict]]:
+    """Find several kinds of events in one search over a time window.
+
+    The satellite is propagated once on a coarse grid over the window, every
+    requested predicate is evaluated on that shared state, and all brackets
+    where any predicate changes are refined together, one propagation per
+    bisection step. Asking for several kinds at once therefore costs little
+    more than asking for one. Only brackets that can affect the results are
+    refined: those inside the window for periods and node crossings, and
+    for passes the visibility edges plus the elevation maxima of passes.
+
+    With a Propagator built with ``max_age``, only its
+    :meth:`~thistle.propagator.Propagator.coverage` is searched, one
+    covered interval at a time. No event is reported inside a gap, and
+    periods and passes that run into a gap are clipped at its edge, the
+    way they are clipped at *start* and *stop*.
+
+    Args:
+        start: Start of the time window.
+        stop: End of the time window.
+        satellite: A Skyfield EarthSatellite or Propagator object.
+        kinds: Event kinds to find: "passes", "node_crossings", "sunlit",
+            "eclipse", "ascending" and/or "descending".
+        sites: Ground sites for "passes", as for :func:`thistle.generate`.
+        min_elevation: Minimum elevation angle for passes (deg).
+        workers: Number of worker processes. When greater than 1, windows
+            longer than a day are split into chunks searched in a process
+            pool. Periods cut at chunk boundaries are joined and passes
+            found on both sides are kept once, so results match the serial
+            search to within its 1 ms tolerance. ``None`` or 1 runs serially.
+
+    Returns:
+        A dict of event lists, keyed by kind; passes over each site are
+        keyed ``passes_{suffix}``, with suffix the site name or index.
+        Entries are as returned by the single-kind functions.
+
+    Raises:
+        ValueError: If start >= stop, a kind is unknown, passes are
+            requested without sites, or *workers* is less than 1.
+    """
+    if start >= stop:
+        raise ValueError("start must be before stop")
+    unknown = set(kinds) - set(get_args(EventKind))
+    if unknown:
+        raise ValueError(f"Unknown event kinds: {sorted(unknown)}")
+    _validate_workers(workers)
+
+    from thistle.orbit_data import _normalize_sites
+
+    site_list = (_normalize_sites(sites) or []) if "passes" in kinds else []
+    if "passes" in kinds and not site_list:
+        raise ValueError("passes require at least one site")
+
+    if workers is not None and workers > 1:
+        chunks = _time_chunks(start, stop, workers)
+        if len(chunks) > 1:
+            return _find_events_parallel(
+                chunks, satellite, kinds, sites, min_elevation, workers
+            )
+
+    parts = [
+        _search_window(a, b, satellite, kinds, site_list, min_elevation, limits)
+        for a, b, limits in _covered_windows(start, stop, satellite)
+    ]
+    keys = [kind for kind in kinds if kind != "passes"]
+    keys += [f"passes_{suffix}" for suffix, *_ in site_list]
+    return {key: [event for part in parts for event in part[key]] for key in keys}
+
+
 def find_passes(
     start: np.datetime64,
     stop: np.datetime64,
@@ -108,13 +970,14 @@ def find_passes(
     lon: float,
     alt: float = 0.0,
     min_elevation: float = 5.0,
+    workers: Optional[int] = None,
 ) -> list[dict]:
     """Find satellite passes over a ground site within a time window.
 
-    Uses Skyfield's event detection with a padded search window to
+    The search runs over a window padded by 100 minutes on each side to
     capture true rise/set times for passes clipped at the boundaries.
-    Incomplete passes at the edges use the window boundary as the
-    missing rise or set time.
+    A pass already up at the start of the padded window uses *start* as
+    its rise time and one still up at the end uses *stop* as its set time.
 
     Args:
         start: Start of the time window.
@@ -124,6 +987,7 @@ def find_passes(
         lon: Ground site geodetic longitude (deg).
         alt: Ground site altitude above the WGS84 ellipsoid (m).
         min_elevation: Minimum elevation angle (deg).
+        workers: Number of worker processes, as in :func:`find_events`.
 
     Returns:
         A list of dicts with keys: start, stop, peak_time, peak_elevation.
@@ -131,88 +995,179 @@ def find_passes(
     Raises:
         ValueError: If start >= stop.
     """
-    if start >= stop:
-        raise ValueError("start must be before stop")
-
-    from thistle.propagator import Propagator
+    return find_events(
+        start,
+        stop,
+        satellite,
+        ["passes"],
+        sites=[(lat, lon, alt)],
+        min_elevation=min_elevation,
+        workers=workers,
+    )["passes_0"]
+
+
+def find_passes_multi(
+    start: np.datetime64,
+    stop: np.datetime64,
+    satellite: Union[EarthSatellite, "Propagator"],
+    sites: Sites,
+    min_elevation: float = 5.0,
+    workers: Optional[int] = None,
+) -> dict[str, list[dict]]:
+    """Find satellite passes over many ground sites within a time window.
 
-    if isinstance(satellite, Propagator):
-        passes: list[dict] = []
-        for sub_start, sub_stop, sat in _split_window(start, stop, satellite):
-            passes.extend(
-                find_passes(sub_start, sub_stop, sat, lat, lon, alt, min_elevation)
-            )
-        return passes
+    The satellite is propagated once for all sites: elevation tests run on
+    (n_sites, n_times) arrays against precomputed site ITRS vectors, and the
+    rise, culmination and set times of every site are refined together.
+    Results match :func:`find_passes` called for each site.
 
-    topos = wgs84.latlon(lat, lon, elevation_m=alt)
+    Args:
+        start: Start of the time window.
+        stop: End of the time window.
+        satellite: A Skyfield EarthSatellite or Propagator object.
+        sites: Ground sites as ``(lat, lon)`` or ``(lat, lon, alt)`` tuples,
+            in a list or in a dict keyed by name.
+        min_elevation: Minimum elevation angle (deg).
+        workers: Number of worker processes, as in :func:`find_events`.
 
-    # Pad by 100 min to capture full passes clipped at boundaries
-    pad = np.timedelta64(100, "m")
-    t0 = _to_skyfield(start - pad)
-    t1 = _to_skyfield(stop + pad)
+    Returns:
+        A dict mapping each site name (or list index, as a string) to its
+        passes, as returned by :func:`find_passes`.
 
-    event_times, event_types = satellite.find_events(
-        topos,
-        t0,
-        t1,
-        altitude_degrees=min_elevation,
+    Raises:
+        ValueError: If start >= stop or *sites* is empty.
+    """
+    events = find_events(
+        start,
+        stop,
+        satellite,
+        ["passes"],
+        sites=sites,
+        min_elevation=min_elevation,
+        workers=workers,
     )
+    return {key[len("passes_") :]: passes for key, passes in events.items()}
 
-    if len(event_times) == 0:
-        return []
 
-    event_dt64 = time_to_dt64(event_times)
+def find_catalog_passes(
+    start: np.datetime64,
+    stop: np.datetime64,
+    satellites: Union[TLEArray, Sequence[EarthSatellite]],
+    lat: float,
+    lon: float,
+    alt: float = 0.0,
+    min_elevation: float = 5.0,
+    workers: Optional[int] = None,
+) -> npt.NDArray:
+    """Find the passes of every satellite in a catalog over one ground site.
+
+    Satellites whose orbits can never reach *min_elevation* at the site are
+    dropped first, from their inclination and apogee alone. The rest are
+    propagated together with ``SatrecArray`` every 10 minutes, which rules
+    out the stretches where each is too far from the site to be seen. Only
+    the remaining samples of the 1-minute search grid are propagated, and
+    only brackets where a satellite rises, sets or culminates are refined.
+    Passes match :func:`find_passes` for each satellite.
+
+    Args:
+        start: Start of the time window.
+        stop: End of the time window.
+        satellites: A TLEArray, or a sequence of Skyfield EarthSatellites.
+        lat: Ground site geodetic latitude (deg).
+        lon: Ground site geodetic longitude (deg).
+        alt: Ground site altitude above the WGS84 ellipsoid (m).
+        min_elevation: Minimum elevation angle (deg).
+        workers: Number of worker processes. When greater than 1, the
+            satellites left after the geometric prefilter are split into
+            groups searched in a process pool. Results match the serial
+            search. ``None`` or 1 runs serially.
 
-    # Group events into passes
-    passes = []
-    rise: Optional[np.datetime64] = None
-    peak: Optional[np.datetime64] = None
+    Returns:
+        A structured array with one element per pass, sorted by start time,
+        with fields ``index`` (position in *satellites*), ``satnum``,
+        ``start``, ``stop``, ``peak_time`` (datetime64[us]) and
+        ``peak_elevation`` (deg).
 
-    for dt, etype in zip(event_dt64, event_types):
-        if etype == 0:  # rise
-            rise = dt
-            peak = None
-        elif etype == 1:  # culminate
-            peak = dt
-        elif etype == 2:  # set
-            rise_t = rise if rise is not None else start
-            peak_t = peak if peak is not None else rise_t
-            set_t = dt
-
-            # Only include passes that overlap the requested window
-            if set_t > start and rise_t < stop:
-                # Compute peak elevation; discard near-grazing passes
-                # where find_events produced spurious events
-                peak_el = _peak_elevation(peak_t, satellite, topos)
-                if peak_el >= min_elevation:
-                    passes.append({
-                        "start": rise_t,
-                        "stop": set_t,
-                        "peak_time": peak_t,
-                        "peak_elevation": peak_el,
-                    })
-            rise = None
-            peak = None
-
-    # Handle trailing incomplete pass (rise or culminate without set)
-    if rise is not None and rise < stop:
-        peak_t = peak if peak is not None else rise
-        peak_el = _peak_elevation(peak_t, satellite, topos)
-        if peak_el >= min_elevation:
-            passes.append({
-                "start": rise,
-                "stop": stop,
-                "peak_time": peak_t,
-                "peak_elevation": peak_el,
-            })
+    Raises:
+        ValueError: If start >= stop or *workers* is less than 1.
+    """
+    if start >= stop:
+        raise ValueError("start must be before stop")
+    _validate_workers(workers)
+
+    ground = _GroundSites([(lat, lon, alt)], min_elevation)
+    satnum, inc, mean_motion, ecc = _mean_orbits(satellites)
+    reach = _reach_angles(ground, min_elevation, mean_motion, ecc)
+    candidates = np.flatnonzero(_can_reach(ground, reach, inc))
+    if workers is not None and workers > 1 and len(candidates) > 1:
+        return _find_catalog_passes_parallel(
+            start, stop, satellites, candidates, (lat, lon, alt), min_elevation, workers
+        )
+    if isinstance(satellites, TLEArray):
+        satrecs = [satellites.satrec(i) for i in candidates.tolist()]
+    else:
+        satrecs = [satellites[i].model for i in candidates.tolist()]
+    if not satrecs:
+        return np.empty(0, dtype=_CATALOG_PASS_DTYPE)
+
+    # (n_candidates, n_grid) matrices, evaluated only at screened samples
+    grid = _search_grid(start, stop, _PASS_PAD)
+    near = _screen(
+        satrecs,
+        grid,
+        ground,
+        reach[candidates],
+        mean_motion[candidates],
+        ecc[candidates],
+    )
+    visible = np.zeros(near.shape, dtype=bool)
+    rising = np.zeros(near.shape, dtype=bool)
+    rows, cols = np.nonzero(near)
+    for i in range(0, len(rows), _SITE_BLOCK):
+        block = slice(i, i + _SITE_BLOCK)
+        state = _propagate_rows(satrecs, rows[block], grid[cols[block]])
+        visible[rows[block], cols[block]] = ground.visible(state)[0]
+        rising[rows[block], cols[block]] = ground.rising(state)[0]
+
+    edges, culminations = _pass_brackets(visible, rising)
+    owners = np.concatenate([edges[0], culminations[0]])
+    edge_times, culm_times = _bisect(
+        grid,
+        lambda times: _propagate_rows(satrecs, owners, times),
+        [
+            (lambda state: ground.visible(state)[0], edges[1], edges[2]),
+            (
+                lambda state: ground.rising(state)[0],
+                culminations[1],
+                np.zeros(len(culminations[0]), dtype=bool),
+            ),
+        ],
+    )
+    passes = _assemble_passes(
+        start,
+        stop,
+        lambda times, rows: ground.elevation(_propagate_rows(satrecs, rows, times))[0],
+        visible[:, 0],
+        (edge_times, edges[0], edges[2]),
+        (culm_times, culminations[0]),
+    )
 
-    return passes
+    result = np.array(
+        [
+            (i, satnum[i], p["start"], p["stop"], p["peak_time"], p["peak_elevation"])
+            for i, row_passes in zip(candidates.tolist(), passes)
+            for p in row_passes
+        ],
+        dtype=_CATALOG_PASS_DTYPE,
+    )
+    return result[np.argsort(result["start"], kind="stable")]
 
 
 def find_node_crossings(
     start: np.datetime64,
     stop: np.datetime64,
     satellite: Union[EarthSatellite, "Propagator"],
+    workers: Optional[int] = None,
 ) -> list[dict]:
     """Find orbital node crossings (equator crossings) within a time window.
 
@@ -220,6 +1175,7 @@ def find_node_crossings(
         start: Start of the time window.
         stop: End of the time window.
         satellite: A Skyfield EarthSatellite or Propagator object.
+        workers: Number of worker processes, as in :func:`find_events`.
 
     Returns:
         A list of dicts with keys: start, stop, longitude, ascending.
@@ -227,48 +1183,16 @@ def find_node_crossings(
     Raises:
         ValueError: If start >= stop.
     """
-    if start >= stop:
-        raise ValueError("start must be before stop")
-
-    from thistle.propagator import Propagator
-
-    if isinstance(satellite, Propagator):
-        crossings: list[dict] = []
-        for sub_start, sub_stop, sat in _split_window(start, stop, satellite):
-            crossings.extend(find_node_crossings(sub_start, sub_stop, sat))
-        return crossings
-
-    t0 = _to_skyfield(start)
-    t1 = _to_skyfield(stop)
-
-    def _is_north(t: skyfield.timelib.Time) -> npt.NDArray:
-        geo = satellite.at(t)
-        lat = cast(npt.NDArray, wgs84.subpoint(geo).latitude.degrees)
-        return np.array(lat) >= 0
-
-    _is_north.step_days = 1 / 1440  # type: ignore[attr-defined]
-
-    event_times, event_values = almanac.find_discrete(t0, t1, _is_north)
-    event_dt64 = time_to_dt64(event_times)
-
-    crossings = []
-    for dt, t_sky, val in zip(event_dt64, event_times, event_values):
-        geo = satellite.at(t_sky)
-        lon = float(cast(npt.NDArray, wgs84.subpoint(geo).longitude.degrees))
-        crossings.append({
-            "start": dt,
-            "stop": dt,
-            "longitude": lon,
-            "ascending": bool(val),
-        })
-
-    return crossings
+    return find_events(start, stop, satellite, ["node_crossings"], workers=workers)[
+        "node_crossings"
+    ]
 
 
 def find_sunlit_periods(
     start: np.datetime64,
     stop: np.datetime64,
     satellite: Union[EarthSatellite, "Propagator"],
+    workers: Optional[int] = None,
 ) -> list[dict]:
     """Find periods when the satellite is in sunlight within a time window.
 
@@ -276,6 +1200,7 @@ def find_sunlit_periods(
         start: Start of the time window.
         stop: End of the time window.
         satellite: A Skyfield EarthSatellite or Propagator object.
+        workers: Number of worker processes, as in :func:`find_events`.
 
     Returns:
         A list of dicts with keys: start, stop.
@@ -283,42 +1208,14 @@ def find_sunlit_periods(
     Raises:
         ValueError: If start >= stop.
     """
-    if start >= stop:
-        raise ValueError("start must be before stop")
-
-    from thistle.propagator import Propagator
-
-    if isinstance(satellite, Propagator):
-        periods: list[dict] = []
-        for sub_start, sub_stop, sat in _split_window(start, stop, satellite):
-            periods.extend(find_sunlit_periods(sub_start, sub_stop, sat))
-        return _merge_periods(periods)
-
-    t0 = _to_skyfield(start)
-    t1 = _to_skyfield(stop)
-
-    def _is_sunlit(t: skyfield.timelib.Time) -> npt.NDArray:
-        return np.array(satellite.at(t).is_sunlit(eph))
-
-    _is_sunlit.step_days = 1 / 1440  # type: ignore[attr-defined]
-
-    event_times, event_values = almanac.find_discrete(t0, t1, _is_sunlit)
-    event_dt64 = (
-        time_to_dt64(event_times)
-        if len(event_times)
-        else np.array([], dtype="datetime64[us]")
-    )
-
-    # Determine state at start
-    sunlit_at_start = bool(satellite.at(t0).is_sunlit(eph))
-
-    return _group_periods(start, stop, event_dt64, event_values, sunlit_at_start)
+    return find_events(start, stop, satellite, ["sunlit"], workers=workers)["sunlit"]
 
 
 def find_eclipse_periods(
     start: np.datetime64,
     stop: np.datetime64,
     satellite: Union[EarthSatellite, "Propagator"],
+    workers: Optional[int] = None,
 ) -> list[dict]:
     """Find periods when the satellite is in Earth's shadow within a time window.
 
@@ -326,6 +1223,7 @@ def find_eclipse_periods(
         start: Start of the time window.
         stop: End of the time window.
         satellite: A Skyfield EarthSatellite or Propagator object.
+        workers: Number of worker processes, as in :func:`find_events`.
 
     Returns:
         A list of dicts with keys: start, stop.
@@ -333,43 +1231,14 @@ def find_eclipse_periods(
     Raises:
         ValueError: If start >= stop.
     """
-    if start >= stop:
-        raise ValueError("start must be before stop")
-
-    from thistle.propagator import Propagator
-
-    if isinstance(satellite, Propagator):
-        periods: list[dict] = []
-        for sub_start, sub_stop, sat in _split_window(start, stop, satellite):
-            periods.extend(find_eclipse_periods(sub_start, sub_stop, sat))
-        return _merge_periods(periods)
-
-    t0 = _to_skyfield(start)
-    t1 = _to_skyfield(stop)
-
-    def _is_sunlit(t: skyfield.timelib.Time) -> npt.NDArray:
-        return np.array(satellite.at(t).is_sunlit(eph))
-
-    _is_sunlit.step_days = 1 / 1440  # type: ignore[attr-defined]
-
-    event_times, event_values = almanac.find_discrete(t0, t1, _is_sunlit)
-    event_dt64 = (
-        time_to_dt64(event_times)
-        if len(event_times)
-        else np.array([], dtype="datetime64[us]")
-    )
-
-    # Eclipse is the inverse of sunlit
-    eclipse_at_start = not bool(satellite.at(t0).is_sunlit(eph))
-    inv_values = ~np.array(event_values, dtype=bool)
-
-    return _group_periods(start, stop, event_dt64, inv_values, eclipse_at_start)
+    return find_events(start, stop, satellite, ["eclipse"], workers=workers)["eclipse"]
 
 
 def find_ascending_periods(
     start: np.datetime64,
     stop: np.datetime64,
     satellite: Union[EarthSatellite, "Propagator"],
+    workers: Optional[int] = None,
 ) -> list[dict]:
     """Find periods when the satellite latitude is increasing (moving northward).
 
@@ -380,6 +1249,7 @@ def find_ascending_periods(
         start: Start of the time window.
         stop: End of the time window.
         satellite: A Skyfield EarthSatellite or Propagator object.
+        workers: Number of worker processes, as in :func:`find_events`.
 
     Returns:
         A list of dicts with keys: start, stop.
@@ -387,42 +1257,16 @@ def find_ascending_periods(
     Raises:
         ValueError: If start >= stop.
     """
-    if start >= stop:
-        raise ValueError("start must be before stop")
-
-    from thistle.propagator import Propagator
-
-    if isinstance(satellite, Propagator):
-        periods: list[dict] = []
-        for sub_start, sub_stop, sat in _split_window(start, stop, satellite):
-            periods.extend(find_ascending_periods(sub_start, sub_stop, sat))
-        return _merge_periods(periods)
-
-    t0 = _to_skyfield(start)
-    t1 = _to_skyfield(stop)
-
-    def _is_ascending(t: skyfield.timelib.Time) -> npt.NDArray:
-        vz = cast(npt.NDArray, satellite.at(t).velocity.km_per_s)
-        return np.array(vz[2]) > 0
-
-    _is_ascending.step_days = 1 / 1440  # type: ignore[attr-defined]
-
-    event_times, event_values = almanac.find_discrete(t0, t1, _is_ascending)
-    event_dt64 = (
-        time_to_dt64(event_times)
-        if len(event_times)
-        else np.array([], dtype="datetime64[us]")
-    )
-
-    ascending_at_start = bool(_is_ascending(t0))
-
-    return _group_periods(start, stop, event_dt64, event_values, ascending_at_start)
+    return find_events(start, stop, satellite, ["ascending"], workers=workers)[
+        "ascending"
+    ]
 
 
 def find_descending_periods(
     start: np.datetime64,
     stop: np.datetime64,
     satellite: Union[EarthSatellite, "Propagator"],
+    workers: Optional[int] = None,
 ) -> list[dict]:
     """Find periods when the satellite latitude is decreasing (moving southward).
 
@@ -433,6 +1277,7 @@ def find_descending_periods(
         start: Start of the time window.
         stop: End of the time window.
         satellite: A Skyfield EarthSatellite or Propagator object.
+        workers: Number of worker processes, as in :func:`find_events`.
 
     Returns:
         A list of dicts with keys: start, stop.
@@ -440,34 +1285,6 @@ def find_descending_periods(
     Raises:
         ValueError: If start >= stop.
     """
-    if start >= stop:
-        raise ValueError("start must be before stop")
-
-    from thistle.propagator import Propagator
-
-    if isinstance(satellite, Propagator):
-        periods: list[dict] = []
-        for sub_start, sub_stop, sat in _split_window(start, stop, satellite):
-            periods.extend(find_descending_periods(sub_start, sub_stop, sat))
-        return _merge_periods(periods)
-
-    t0 = _to_skyfield(start)
-    t1 = _to_skyfield(stop)
-
-    def _is_ascending(t: skyfield.timelib.Time) -> npt.NDArray:
-        vz = cast(npt.NDArray, satellite.at(t).velocity.km_per_s)
-        return np.array(vz[2]) > 0
-
-    _is_ascending.step_days = 1 / 1440  # type: ignore[attr-defined]
-
-    event_times, event_values = almanac.find_discrete(t0, t1, _is_ascending)
-    event_dt64 = (
-        time_to_dt64(event_times)
-        if len(event_times)
-        else np.array([], dtype="datetime64[us]")
-    )
-
-    descending_at_start = not bool(_is_ascending(t0))
-    inv_values = ~np.array(event_values, dtype=bool)
-
-    return _group_periods(start, stop, event_dt64, inv_values, descending_at_start)
+    return find_events(start, stop, satellite, ["descending"], workers=workers)[
+        "descending"
+    ]
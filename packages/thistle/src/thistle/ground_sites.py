@@ -1,6 +1,6 @@
 """Ground site visibility geometry on the WGS84 ellipsoid."""
 
-from typing import Union, cast
+from typing import Optional, Union, cast
 
 import numpy as np
 import numpy.typing as npt
@@ -77,6 +77,7 @@ def _generate_range_single(
     lat: float,
     lon: float,
     alt: float = 0.0,
+    out: Optional[GenerateResult] = None,
 ) -> GenerateResult:
     """Generate slant range and range rate for a single site and satellite.
 
@@ -86,6 +87,8 @@ def _generate_range_single(
         lat: Ground site geodetic latitude (deg).
         lon: Ground site geodetic longitude (deg).
         alt: Ground site altitude above the WGS84 ellipsoid (m).
+        out: Optional dict of ``range`` and ``range_rate`` arrays (or views)
+            of length ``len(times)`` to write the results into.
 
     Returns:
         A dict with keys: range (m), range_rate (m/s).
@@ -99,8 +102,9 @@ def _generate_range_single(
     r = cast(npt.NDArray, topo_pos.xyz.au) * AU_TO_M
     v = cast(npt.NDArray, topo_pos.velocity.au_per_d) * AU_PER_DAY_TO_M_PER_S
 
-    slant_range = np.sqrt(np.sum(r**2, axis=0))
-    range_rate = np.sum(r * v, axis=0) / slant_range
+    out = out if out is not None else {}
+    slant_range = np.sqrt(np.sum(r**2, axis=0), out=out.get("range"))
+    range_rate = np.divide(np.sum(r * v, axis=0), slant_range, out=out.get("range_rate"))
 
     return {"range": slant_range, "range_rate": range_rate}
 
@@ -167,25 +171,24 @@ def _generate_range_propagator(
 ) -> GenerateResult:
     """Generate range/range_rate using a Propagator with TLE switching.
 
-    Splits the time array into segments and processes each with the
-    appropriate satellite, then merges results.
+    The output arrays are allocated once; each TLE segment writes its
+    results straight into its slice of them (or is scattered into its
+    positions when *times* is unsorted). Samples outside the propagator's
+    coverage are left NaN.
     """
-    segments = propagator.segment_times(times)
-
-    segment_results = []
-    for t_slice, sat in segments:
-        seg_data = _generate_range_single(t_slice, sat, lat, lon, alt)
-        segment_results.append((len(t_slice), seg_data))
-
-    result: GenerateResult = {}
-    if segment_results:
-        for key in ("range", "range_rate"):
-            output = np.empty(len(times), dtype=np.float64)
-            offset = 0
-            for n, seg_data in segment_results:
-                output[offset : offset + n] = seg_data[key]
-                offset += n
-            result[key] = output
+    result: GenerateResult = {
+        "range": np.full(len(times), np.nan),
+        "range_rate": np.full(len(times), np.nan),
+    }
+    for idx, index in propagator._covered_slices(times):
+        satellite = propagator.satellites[idx]
+        if isinstance(index, slice):
+            views = {key: column[index] for key, column in result.items()}
+            _generate_range_single(times[index], satellite, lat, lon, alt, out=views)
+        else:
+            seg_data = _generate_range_single(times[index], satellite, lat, lon, alt)
+            for key, column in seg_data.items():
+                result[key][index] = column
 
     return result
 
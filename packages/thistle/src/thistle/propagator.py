@@ -6,22 +6,44 @@ selects the most appropriate one at each propagation time using a configurable
 """
 
 import abc
+import contextlib
 import datetime
-from typing import Literal, Union, get_args
+import hashlib
+import operator
+import os
+import pathlib
+import tempfile
+import warnings
+from collections import OrderedDict
+from typing import (
+    Callable,
+    Iterator,
+    Literal,
+    Sequence,
+    TypeVar,
+    Union,
+    cast,
+    get_args,
+    overload,
+)
 
 import numpy as np
 import numpy.typing as npt
 from sgp4.api import Satrec
 from sgp4.exporter import export_tle
 from skyfield.api import EarthSatellite, Time, Timescale, load
+from skyfield.constants import DAY_S
 from skyfield.positionlib import Distance, Geocentric, Velocity
 
-from thistle.typing import DateTime, TLETuple
+from thistle._core import sgp4_segments, sgp4_time, teme_to_gcrs
+from thistle.tle_array import TLEArray
+from thistle.typing import DateTime, PathLike, TLETuple
 from thistle.utils import (
-    DATETIME_MAX,
-    DATETIME_MIN,
+    DATETIME64_MAX,
+    DATETIME64_MIN,
     EPOCH_DTYPE,
     datetime_to_dt64,
+    jday_datetime64,
     time_to_dt64,
     validate_datetime64,
 )
@@ -33,7 +55,7 @@ except ImportError:
 
 UTC = datetime.timezone.utc
 
-SwitchingStrategies = Literal["epoch", "midpoint", "tca"]
+SwitchingStrategies = Literal["epoch", "midpoint", "tca", "blend"]
 """Valid switching strategy names for :class:`Propagator`."""
 
 
@@ -55,6 +77,272 @@ SwitchingStrategies = Literal["epoch", "midpoint", "tca"]
 # |-----~--|--~--|--~--|--~--|--~-----|
 # Transitions: n + 1
 # Segments: n
+#
+# Blend Switching (midpoint transitions, cross-faded within [ ])
+# -     A     B     C     D     E     +
+# |-----~-[|]-~-[|]-~-[|]-~-[|]-~-----|
+# Transitions: n + 1
+# Segments: n
+
+
+_T = TypeVar("_T")
+
+
+def _lru_get(
+    cache: "OrderedDict[int, _T]",
+    key: int,
+    maxsize: Union[int, None],
+    build: Callable[[], _T],
+) -> _T:
+    """Return ``cache[key]``, building and inserting it on a miss."""
+    value = cache.get(key)
+    if value is None:
+        value = build()
+        cache[key] = value
+        if maxsize is not None and len(cache) > maxsize:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(key)
+    return value
+
+
+def _parse_epochs(
+    tles: Union[list[TLETuple], TLEArray], ts: Timescale
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.datetime64]]:
+    """TT Julian dates and UTC datetime64 epochs from the line 1 epoch field.
+
+    Both match what ``EarthSatellite(line1, line2).epoch`` gives (``.tt``
+    and ``.utc_datetime()``), computed with one vectorized Skyfield call.
+    """
+    if not len(tles):
+        return np.empty(0), np.empty(0, dtype=EPOCH_DTYPE)
+    if isinstance(tles, TLEArray):
+        two_digit = tles.epoch_year.astype(np.int64)
+        days = tles.epoch_days
+    else:
+        two_digit = np.array([int(line1[18:20]) for line1, _ in tles])
+        days = np.array([float(line1[20:32]) for line1, _ in tles])
+    year = np.where(two_digit < 57, two_digit + 2000, two_digit + 1900)
+    t = ts.utc(year, 1, days)  # type: ignore[arg-type]
+    return np.atleast_1d(t.tt), time_to_dt64(t)
+
+
+class SatelliteList(Sequence[EarthSatellite]):
+    """Epoch-sorted TLEs whose satellite objects are built on first use.
+
+    Only the epoch field of each line 1 is parsed up front. The
+    :class:`EarthSatellite` for a TLE (or just its :class:`Satrec`, for
+    propagation) is created when first accessed and kept in a
+    least-recently-used cache of at most *maxsize* objects, so a long TLE
+    history costs little more than its text until its TLEs are actually
+    used. Indexing returns EarthSatellite objects like a plain list;
+    slicing returns another SatelliteList.
+
+    The TLEs are kept as given: a list of line tuples, or a
+    :class:`~thistle.tle_array.TLEArray` for the most compact storage.
+
+    Attributes:
+        tles: (line1, line2) tuples, or a TLEArray, sorted by epoch.
+        tt: TT Julian date epochs, equal to ``EarthSatellite.epoch.tt``.
+        epochs: UTC epochs as datetime64, equal to the datetime64 of
+            ``EarthSatellite.epoch.utc_datetime()``.
+        ts: Skyfield Timescale for building satellites.
+        maxsize: Cache bound per object kind, or None for no bound.
+    """
+
+    tles: Union[list[TLETuple], TLEArray]
+    tt: npt.NDArray[np.float64]
+    epochs: npt.NDArray[np.datetime64]
+    ts: Timescale
+    maxsize: Union[int, None]
+
+    def __init__(
+        self,
+        tles: Union[Sequence[TLETuple], TLEArray],
+        ts: Timescale,
+        maxsize: Union[int, None] = 1024,
+    ) -> None:
+        """Sort *tles* by epoch without building any satellites.
+
+        Args:
+            tles: (line1, line2) TLE tuples or a TLEArray, in any order.
+                TLEs with equal epochs keep their input order.
+            ts: Skyfield Timescale for building satellites.
+            maxsize: Maximum number of EarthSatellite objects, and
+                separately of bare Satrec objects, kept in memory. None
+                keeps every object once built.
+        """
+        if not isinstance(tles, TLEArray):
+            tles = list(tles)
+        tt, epochs = _parse_epochs(tles, ts)
+        order = np.argsort(tt, kind="stable")
+        self._init(_take(tles, order), tt[order], epochs[order], ts, maxsize)
+
+    def _init(
+        self,
+        tles: Union[list[TLETuple], TLEArray],
+        tt: npt.NDArray[np.float64],
+        epochs: npt.NDArray[np.datetime64],
+        ts: Timescale,
+        maxsize: Union[int, None],
+    ) -> None:
+        self.tles = tles
+        self.tt = tt
+        self.epochs = epochs
+        self.ts = ts
+        self.maxsize = maxsize
+        self._satellites: OrderedDict[int, EarthSatellite] = OrderedDict()
+        self._satrecs: OrderedDict[int, Satrec] = OrderedDict()
+
+    @classmethod
+    def _sorted(
+        cls,
+        tles: Union[list[TLETuple], TLEArray],
+        tt: npt.NDArray[np.float64],
+        epochs: npt.NDArray[np.datetime64],
+        ts: Timescale,
+        maxsize: Union[int, None],
+    ) -> "SatelliteList":
+        self = cls.__new__(cls)
+        self._init(tles, tt, epochs, ts, maxsize)
+        return self
+
+    def __getstate__(self) -> dict:
+        # Satrec objects cannot be pickled; they are rebuilt on demand
+        state = self.__dict__.copy()
+        state["_satellites"] = OrderedDict()
+        state["_satrecs"] = OrderedDict()
+        return state
+
+    def __len__(self) -> int:
+        return len(self.tles)
+
+    @overload
+    def __getitem__(self, index: int) -> EarthSatellite: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "SatelliteList": ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._sorted(
+                self.tles[index],
+                self.tt[index],
+                self.epochs[index],
+                self.ts,
+                self.maxsize,
+            )
+        i = self._position(index)
+        return _lru_get(
+            self._satellites,
+            i,
+            self.maxsize,
+            lambda: EarthSatellite(*self.tles[i], ts=self.ts),
+        )
+
+    def __iter__(self) -> Iterator[EarthSatellite]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def _position(self, index: int) -> int:
+        i = operator.index(index)
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("SatelliteList index out of range")
+        return i
+
+    def satrec(self, index: int) -> Satrec:
+        """The Satrec of TLE *index*, without building an EarthSatellite."""
+        i = self._position(index)
+        satellite = self._satellites.get(i)
+        if satellite is not None:
+            return satellite.model
+        return _lru_get(
+            self._satrecs,
+            i,
+            self.maxsize,
+            lambda: Satrec.twoline2rv(*self.tles[i]),
+        )
+
+    def merge(
+        self, other: "SatelliteList"
+    ) -> tuple["SatelliteList", npt.NDArray[np.intp]]:
+        """Insert *other* in epoch order, after existing TLEs with equal epochs.
+
+        Objects already built for this list carry over to the result, and
+        *other*'s TLEs are converted to this list's storage type.
+
+        Returns:
+            The merged list and the positions of *other*'s TLEs in it.
+        """
+        at = np.searchsorted(self.tt, other.tt, side="right")
+        inserted = at + np.arange(len(other))
+        n = len(self) + len(other)
+        is_new = np.zeros(n, dtype=bool)
+        is_new[inserted] = True
+        kept = np.flatnonzero(~is_new)
+
+        source = np.empty(n, dtype=np.intp)
+        source[kept] = np.arange(len(self))
+        source[inserted] = len(self) + np.arange(len(other))
+        if isinstance(self.tles, TLEArray):
+            other_tles = other.tles
+            if not isinstance(other_tles, TLEArray):
+                other_tles = TLEArray(other_tles)
+            tles = _take(TLEArray.concatenate([self.tles, other_tles]), source)
+        else:
+            tles = _take(self.tles + list(other.tles), source)
+        tt = np.empty(n)
+        tt[kept] = self.tt
+        tt[inserted] = other.tt
+        epochs = np.empty(n, dtype=EPOCH_DTYPE)
+        epochs[kept] = self.epochs
+        epochs[inserted] = other.epochs
+
+        merged = self._sorted(tles, tt, epochs, self.ts, self.maxsize)
+        for i, satellite in self._satellites.items():
+            merged._satellites[int(kept[i])] = satellite
+        for i, satrec in self._satrecs.items():
+            merged._satrecs[int(kept[i])] = satrec
+        return merged, inserted
+
+
+def _take(
+    tles: Union[list[TLETuple], TLEArray], index: npt.NDArray[np.intp]
+) -> Union[list[TLETuple], TLEArray]:
+    """Reorder a TLE list or TLEArray by integer *index*."""
+    if isinstance(tles, TLEArray):
+        return tles[index]
+    return [tles[i] for i in index.tolist()]
+
+
+def _epochs(
+    satellites: Sequence[EarthSatellite],
+    index: Union[npt.NDArray[np.intp], None] = None,
+) -> npt.NDArray[np.datetime64]:
+    """UTC epochs (datetime64) of *satellites*, or of those at *index*."""
+    if isinstance(satellites, SatelliteList):
+        return satellites.epochs if index is None else satellites.epochs[index]
+    if index is not None:
+        satellites = [satellites[i] for i in index.tolist()]
+    utc = [cast(datetime.datetime, sat.epoch.utc_datetime()) for sat in satellites]
+    return np.array([datetime_to_dt64(dt) for dt in utc], dtype=EPOCH_DTYPE)
+
+
+def _satrec(satellites: Sequence[EarthSatellite], index: int) -> Satrec:
+    """Satrec of ``satellites[index]``, unbuilt EarthSatellite permitting."""
+    if isinstance(satellites, SatelliteList):
+        return satellites.satrec(index)
+    return satellites[index].model
+
+
+def _midpoints(
+    a: npt.NDArray[np.datetime64], b: npt.NDArray[np.datetime64]
+) -> npt.NDArray[np.datetime64]:
+    """Midpoints of datetime64[us] pairs, rounded half-even like ``timedelta / 2``."""
+    q, r = np.divmod((b - a).astype(np.int64), 2)
+    return a + (q + r * (q & 1)).astype("timedelta64[us]")
 
 
 class SwitchingStrategy(abc.ABC):
@@ -64,31 +352,86 @@ class SwitchingStrategy(abc.ABC):
     are computed.
 
     Attributes:
-        satellites: EarthSatellite objects sorted by epoch.
+        satellites: EarthSatellite objects sorted by epoch. Inside a
+            :class:`Propagator` this is a :class:`SatelliteList`, which
+            builds each satellite on first access.
         transitions: Boundary times separating each satellite's validity
             window. Set by ``compute_transitions``.
+        blends: Whether :meth:`blend` modifies states. Code paths that
+            propagate one TLE segment at a time cannot blend and fall back
+            to the hard transitions.
     """
 
-    satellites: list[EarthSatellite]
+    satellites: Sequence[EarthSatellite]
     transitions: npt.NDArray[np.datetime64]
+    blends: bool = False
 
     def __init__(
         self,
-        satellites: list[EarthSatellite],
+        satellites: Sequence[EarthSatellite],
     ) -> None:
         """Initialize the strategy with a list of satellites.
 
         Args:
             satellites: EarthSatellite objects to manage. They will be
-                sorted by epoch internally.
+                sorted by epoch internally; a :class:`SatelliteList` is
+                already sorted and is kept as is.
         """
-        self.satellites = sorted(satellites, key=lambda sat: sat.epoch.utc_datetime())
+        if isinstance(satellites, SatelliteList):
+            self.satellites = satellites
+        else:
+            self.satellites = sorted(satellites, key=lambda sat: sat.epoch.utc_datetime())
 
     @abc.abstractmethod
     def compute_transitions(self) -> None:
         """Compute the transition boundary array and store it in ``self.transitions``."""
         ...
 
+    def update_transitions(self, inserted: npt.NDArray[np.intp]) -> None:
+        """Refresh ``self.transitions`` after satellites were inserted.
+
+        ``self.satellites`` already holds the new satellites at the sorted
+        positions *inserted*; ``self.transitions`` still describes the list
+        before insertion. The default recomputes everything; the built-in
+        strategies recompute only the boundaries next to an insertion.
+
+        Args:
+            inserted: Positions of the new satellites in ``self.satellites``.
+        """
+        self.compute_transitions()
+
+    def cache_token(self) -> Union[str, None]:
+        """Identify the strategy and its parameters for the transition cache.
+
+        Two strategies with equal tokens must produce the same transitions
+        for the same TLEs. The default of None opts out of caching, so
+        custom strategies are never served stale results. The built-in
+        strategies only return their token for their own exact class, so a
+        subclass is not cached unless it overrides this method too.
+        """
+        return None
+
+    def blend(
+        self,
+        times: npt.NDArray[np.datetime64],
+        jd: npt.NDArray[np.float64],
+        fr: npt.NDArray[np.float64],
+        r: npt.NDArray[np.float64],
+        v: npt.NDArray[np.float64],
+    ) -> None:
+        """Adjust hard-switched TEME states in place near transitions.
+
+        :class:`Propagator` calls this after propagating every sample with
+        the TLE that ``transitions`` assigns it. The default does nothing.
+
+        Args:
+            times: Sample times used for TLE assignment.
+            jd: Whole UTC Julian dates of the samples, for SGP4.
+            fr: Fractional UTC Julian dates of the samples, for SGP4.
+            r: TEME position (km), shape (3, n); updated in place.
+            v: TEME velocity (km/s), shape (3, n); updated in place.
+        """
+
 
 class EpochSwitchStrategy(SwitchingStrategy):
     """Switching based on the TLE epoch.
@@ -98,16 +441,26 @@ class EpochSwitchStrategy(SwitchingStrategy):
     epoch time.
     """
 
+    def cache_token(self) -> Union[str, None]:
+        """Epoch transitions depend on the TLEs alone."""
+        if type(self) is not EpochSwitchStrategy:
+            return None
+        return "epoch"
+
+    def update_transitions(self, inserted: npt.NDArray[np.intp]) -> None:
+        """Recompute the epoch boundaries next to the inserted satellites."""
+
+        def boundaries(index: npt.NDArray[np.intp]) -> npt.NDArray[np.datetime64]:
+            return _epochs(self.satellites, index)
+
+        _merge_transitions(self, inserted, boundaries)
+
     def compute_transitions(self) -> None:
         """Compute transitions at each satellite's epoch time."""
-        transitions = [
-            sat.epoch.utc_datetime().replace(tzinfo=None) for sat in self.satellites
-        ]
-        transitions = [DATETIME_MIN] + transitions[1:] + [DATETIME_MAX]
-        self.transitions = np.array(
-            [datetime_to_dt64(dt) for dt in transitions],
-            dtype=EPOCH_DTYPE,
-        )
+        epochs = _epochs(self.satellites)
+        self.transitions = np.concatenate(
+            [[DATETIME64_MIN], epochs[1:], [DATETIME64_MAX]]
+        ).astype(EPOCH_DTYPE)
 
 
 class MidpointSwitchStrategy(SwitchingStrategy):
@@ -118,78 +471,283 @@ class MidpointSwitchStrategy(SwitchingStrategy):
     are placed at the temporal midpoint between consecutive epochs.
     """
 
+    def cache_token(self) -> Union[str, None]:
+        """Midpoint transitions depend on the TLEs alone."""
+        if type(self) is not MidpointSwitchStrategy:
+            return None
+        return "midpoint"
+
+    def update_transitions(self, inserted: npt.NDArray[np.intp]) -> None:
+        """Recompute the midpoints next to the inserted satellites."""
+
+        def boundaries(index: npt.NDArray[np.intp]) -> npt.NDArray[np.datetime64]:
+            return _midpoints(
+                _epochs(self.satellites, index - 1), _epochs(self.satellites, index)
+            )
+
+        _merge_transitions(self, inserted, boundaries)
+
     def compute_transitions(self) -> None:
         """Compute transitions at the midpoint between consecutive epochs."""
-        transitions = []
-        for sat_a, sat_b in pairwise(self.satellites):
-            time_a = sat_a.epoch.utc_datetime().replace(tzinfo=None)
-            time_b = sat_b.epoch.utc_datetime().replace(tzinfo=None)
+        epochs = _epochs(self.satellites)
+        self.transitions = np.concatenate(
+            [[DATETIME64_MIN], _midpoints(epochs[:-1], epochs[1:]), [DATETIME64_MAX]]
+        ).astype(EPOCH_DTYPE)
+
+
+def _merge_transitions(
+    strategy: SwitchingStrategy,
+    inserted: npt.NDArray[np.intp],
+    boundaries: Callable[[npt.NDArray[np.intp]], npt.NDArray[np.datetime64]],
+) -> None:
+    """Update ``strategy.transitions`` for satellites inserted at *inserted*.
+
+    Interior boundary ``k`` separates satellites ``k - 1`` and ``k``. It is
+    reused from the old transitions when neither neighbor is new (the two
+    were adjacent before the insertion) and recomputed with *boundaries*
+    otherwise, so the work scales with the number of insertions.
+    """
+    n = len(strategy.satellites)
+    inserted = np.asarray(inserted, dtype=np.intp)
+    old = getattr(strategy, "transitions", None)
+    if old is None or len(old) != n - len(inserted) + 1:
+        strategy.compute_transitions()
+        return
+
+    is_new = np.zeros(n, dtype=bool)
+    is_new[inserted] = True
+    old_index = np.arange(n) - np.cumsum(is_new)
+    interior = np.arange(1, n)
+    stale = is_new[interior - 1] | is_new[interior]
+
+    transitions = np.empty(n + 1, dtype=EPOCH_DTYPE)
+    transitions[0] = old[0]
+    transitions[-1] = old[-1]
+    keep = interior[~stale]
+    transitions[keep] = old[old_index[keep]]
+    fresh = interior[stale]
+    if len(fresh):
+        transitions[fresh] = boundaries(fresh)
+    strategy.transitions = transitions
+
+
+# Unix epoch as a UTC Julian date.
+_UNIX_EPOCH_JD = 2440587.5
+
+# Upper bound on stacked coarse-grid samples evaluated at once, so a long
+# history with wide epoch gaps does not allocate one enormous grid.
+_TCA_BATCH_SAMPLES = 1_000_000
+
+# Golden-section bracket reduction factor, 1 / phi.
+_INVPHI = (np.sqrt(5.0) - 1.0) / 2.0
+
+
+def _pair_separation(
+    satrecs: list[Satrec],
+    pair: npt.NDArray[np.intp],
+    jd: npt.NDArray[np.float64],
+    fr: npt.NDArray[np.float64],
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Relative TEME state of each neighboring TLE pair at stacked samples.
 
-            delta = time_b - time_a
-            midpoint = time_a + delta / 2
-            midpoint = datetime_to_dt64(midpoint)
-            transitions.append(midpoint)
+    Args:
+        satrecs: Epoch-sorted Satrecs; pair ``p`` is ``(satrecs[p], satrecs[p + 1])``.
+        pair: Non-decreasing pair index of every sample.
+        jd: Whole UTC Julian dates.
+        fr: Fractional UTC Julian dates.
 
-        transitions = [DATETIME_MIN] + transitions + [DATETIME_MAX]
-        self.transitions = np.array(transitions, dtype=EPOCH_DTYPE)
+    Returns:
+        A (dr, dv) tuple of position (km) and velocity (km/s) differences,
+        later TLE minus earlier, each with shape (3, n).
+    """
+    starts = np.flatnonzero(np.r_[True, pair[1:] != pair[:-1]])
+    stops = np.r_[starts[1:], len(pair)]
+    runs: list[tuple[int, int, int]] = list(
+        zip(pair[starts].tolist(), starts.tolist(), stops.tolist())
+    )
+    r_a, v_a = sgp4_segments(((satrecs[p], slice(lo, hi)) for p, lo, hi in runs), jd, fr)
+    r_b, v_b = sgp4_segments(((satrecs[p + 1], slice(lo, hi)) for p, lo, hi in runs), jd, fr)
+    return r_b - r_a, v_b - v_a
+
+
+def _coarse_tca(
+    satrecs: list[Satrec],
+    pairs: npt.NDArray[np.intp],
+    jd: npt.NDArray[np.float64],
+    fr: npt.NDArray[np.float64],
+    span: npt.NDArray[np.float64],
+    coarse_step: float,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Bracket each pair's closest approach on a stacked coarse grid.
+
+    Every pair's window ``[0, span]`` seconds after the earlier epoch is
+    sampled every ``coarse_step`` seconds (endpoints included), all pairs
+    evaluated together.
+
+    Returns:
+        (lo, best, hi) seconds after the earlier epoch: the sampled minimum
+        and the coarse samples on either side of it, clipped to the window.
+    """
+    count = np.maximum(2, (span / coarse_step).astype(np.int64) + 1)
+    offset = np.cumsum(count) - count
+    pair = np.repeat(pairs, count)
+    local = np.arange(len(pair)) - np.repeat(offset, count)
+    step = span / (count - 1)
+    t = local * np.repeat(step, count)
+
+    dr, _ = _pair_separation(satrecs, pair, jd[pair], fr[pair] + t / DAY_S)
+    dist_sq = np.sum(dr * dr, axis=0)
+    dist_sq[np.isnan(dist_sq)] = np.inf
+
+    # Per-pair argmin over the ragged runs: the first sample equal to the
+    # run's minimum.
+    best = np.minimum.reduceat(dist_sq, offset)
+    hit = np.flatnonzero(dist_sq == np.repeat(best, count))
+    first = np.searchsorted(hit, offset)
+    ci = local[hit[first]]
+    lo = np.maximum(ci - 1, 0) * step
+    hi = np.minimum(ci + 1, count - 1) * step
+    return lo, ci * step, hi
+
+
+def _search_tca(
+    satrecs: list[Satrec],
+    pairs: npt.NDArray[np.intp],
+    jd: npt.NDArray[np.float64],
+    fr: npt.NDArray[np.float64],
+    span: npt.NDArray[np.float64],
+    coarse_step: float,
+    tolerance: float,
+) -> npt.NDArray[np.float64]:
+    """Closest approach of the given pairs, in seconds after the earlier epoch."""
+    lo = np.empty(len(pairs))
+    hi = np.empty(len(pairs))
+    best = np.empty(len(pairs))
+    count = np.maximum(2, (span / coarse_step).astype(np.int64) + 1)
+    bounds = [0]
+    total = 0
+    for i, n in enumerate(count.tolist()):
+        if total and total + n > _TCA_BATCH_SAMPLES:
+            bounds.append(i)
+            total = 0
+        total += n
+    bounds.append(len(pairs))
+    for i, j in pairwise(bounds):
+        lo[i:j], best[i:j], hi[i:j] = _coarse_tca(
+            satrecs, pairs[i:j], jd, fr, span[i:j], coarse_step
+        )
+
+    def dist_sq(p: npt.NDArray[np.intp], t: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        dr, _ = _pair_separation(satrecs, p, jd[p], fr[p] + t / DAY_S)
+        out = np.sum(dr * dr, axis=0)
+        out[np.isnan(out)] = np.inf
+        return out
+
+    # Golden-section search on every bracket in lockstep: each iteration
+    # evaluates one new point per pair. The iteration count depends only on
+    # the widest possible bracket, so a pair's result does not depend on
+    # which other pairs are solved alongside it.
+    a, b = lo, hi
+    width = 2.0 * coarse_step
+    iterations = 0
+    if width > tolerance:
+        iterations = int(np.ceil(np.log(tolerance / width) / np.log(_INVPHI)))
+    c = b - _INVPHI * (b - a)
+    d = a + _INVPHI * (b - a)
+    fc = dist_sq(pairs, c)
+    fd = dist_sq(pairs, d)
+    for _ in range(iterations):
+        left = fc < fd
+        b = np.where(left, d, b)
+        a = np.where(left, a, c)
+        x = np.where(left, b - _INVPHI * (b - a), a + _INVPHI * (b - a))
+        fx = dist_sq(pairs, x)
+        c, d, fc, fd = (
+            np.where(left, x, d),
+            np.where(left, c, x),
+            np.where(left, fx, fd),
+            np.where(left, fc, fx),
+        )
+    x = (a + b) / 2.0
+
+    # The separation is not always unimodal within the bracket; never do
+    # worse than the best coarse sample.
+    better = dist_sq(pairs, x) <= dist_sq(pairs, best)
+    return np.where(better, x, best)
+
+
+def _find_tcas(
+    satrecs: list[Satrec],
+    coarse_step: float = 60.0,
+    tolerance: float = 1e-3,
+    pairs: Union[npt.NDArray[np.intp], None] = None,
+) -> npt.NDArray[np.datetime64]:
+    """Times of closest approach for every neighboring pair of TLEs.
+
+    The separation of each pair is sampled on a coarse grid across its
+    epoch window, with all pairs stacked into one grid so each Satrec is
+    propagated with a single vectorized call. The bracket around each
+    sampled minimum is then narrowed to *tolerance* seconds by a
+    golden-section search run on all pairs at once. Only positions are
+    used: SGP4 velocities are not exact derivatives of its positions, and
+    for nearly identical TLEs the range rate ``dr . dv`` can miss the
+    minimum by tens of seconds.
+
+    Args:
+        satrecs: Satrecs sorted by epoch.
+        coarse_step: Time step in seconds for the coarse search grid.
+        tolerance: Convergence tolerance in seconds for the refinement.
+        pairs: Indices ``p`` of the pairs ``(satrecs[p], satrecs[p + 1])``
+            to solve. Defaults to every neighboring pair.
+
+    Returns:
+        One UTC transition time per pair.
+    """
+    if pairs is None:
+        pairs = np.arange(max(len(satrecs) - 1, 0))
+    if len(pairs) == 0:
+        return np.array([], dtype=EPOCH_DTYPE)
+
+    epoch_jd = np.array([s.jdsatepoch for s in satrecs])
+    epoch_fr = np.array([s.jdsatepochF for s in satrecs])
+    jd = epoch_jd[:-1]
+    fr = epoch_fr[:-1]
+    span = ((epoch_jd[1:] - jd) + (epoch_fr[1:] - fr)) * DAY_S
+
+    # Pairs less than a second apart switch at the midpoint.
+    tca = span[pairs] / 2.0
+    search = np.flatnonzero(span[pairs] >= 1.0)
+
+    if len(search):
+        ids = pairs[search]
+        tca[search] = _search_tca(satrecs, ids, jd, fr, span[ids], coarse_step, tolerance)
+
+    micro = np.rint(fr[pairs] * DAY_S * 1e6 + tca * 1e6).astype(np.int64)
+    seconds = np.rint((jd[pairs] - _UNIX_EPOCH_JD) * DAY_S).astype(np.int64)
+    return (seconds * 1_000_000 + micro).astype(EPOCH_DTYPE)
 
 
 def _find_tca(
     sat_a: EarthSatellite,
     sat_b: EarthSatellite,
-    ts: Timescale,
     coarse_step: float = 60.0,
-    fine_step: float = 5.0,
+    tolerance: float = 1e-3,
 ) -> datetime.datetime:
     """Find the Time of Closest Approach between two satellite TLEs.
 
-    Uses a two-pass grid search over Julian dates: a coarse sweep across
-    the full epoch window followed by a finer sweep around the coarse
-    minimum. All time arithmetic is done in numpy with TT Julian dates
-    to avoid creating Python datetime objects.
+    A single-pair convenience wrapper around :func:`_find_tcas`.
 
     Args:
         sat_a: The earlier satellite (by epoch).
         sat_b: The later satellite (by epoch).
-        ts: Skyfield Timescale for building Time objects.
         coarse_step: Time step in seconds for the coarse search grid.
-        fine_step: Time step in seconds for the refinement search grid.
+        tolerance: Convergence tolerance in seconds for the refinement.
 
     Returns:
         The datetime (timezone-naive, UTC) of closest approach.
     """
-    tt_a = sat_a.epoch.tt
-    tt_b = sat_b.epoch.tt
-    delta_days = tt_b - tt_a
-    delta_seconds = delta_days * 86400.0
-
-    if delta_seconds < 1.0:  # less than 1 second apart
-        mid_tt = (tt_a + tt_b) / 2.0
-        return ts.tt_jd(mid_tt).utc_datetime().replace(tzinfo=None)
-
-    # Coarse grid search — use fixed time step
-    n_coarse = max(2, int(delta_seconds / coarse_step) + 1)
-    coarse_tt = np.linspace(tt_a, tt_b, n_coarse)
-    coarse_times = ts.tt_jd(coarse_tt)
-    diff = sat_a.at(coarse_times).xyz.au - sat_b.at(coarse_times).xyz.au
-    dist_sq = np.sum(diff**2, axis=0)
-    ci = int(np.argmin(dist_sq))
-
-    # Fine grid refinement around the coarse minimum
-    # Refine over +/- one coarse step centered on the minimum
-    coarse_step_jd = coarse_step / 86400.0
-    fine_start = max(tt_a, coarse_tt[ci] - coarse_step_jd)
-    fine_end = min(tt_b, coarse_tt[ci] + coarse_step_jd)
-    fine_window_seconds = (fine_end - fine_start) * 86400.0
-    n_fine = max(2, int(fine_window_seconds / fine_step) + 1)
-
-    fine_tt = np.linspace(fine_start, fine_end, n_fine)
-    fine_times = ts.tt_jd(fine_tt)
-    diff = sat_a.at(fine_times).xyz.au - sat_b.at(fine_times).xyz.au
-    dist_sq = np.sum(diff**2, axis=0)
-    fi = int(np.argmin(dist_sq))
-
-    return ts.tt_jd(fine_tt[fi]).utc_datetime().replace(tzinfo=None)
+    tca = _find_tcas([sat_a.model, sat_b.model], coarse_step, tolerance)[0]
+    return tca.item()
 
 
 class TCASwitchStrategy(SwitchingStrategy):
@@ -200,72 +758,261 @@ class TCASwitchStrategy(SwitchingStrategy):
     transitions.
 
     Attributes:
-        ts: Skyfield Timescale used for time conversions during TCA search.
+        ts: Skyfield Timescale of the managed satellites.
         coarse_step: Time step in seconds for the coarse TCA search.
-        fine_step: Time step in seconds for the fine TCA refinement.
+        tolerance: Convergence tolerance in seconds for the TCA refinement.
     """
 
     def __init__(
         self,
-        satellites: list[EarthSatellite],
+        satellites: Sequence[EarthSatellite],
         ts: Timescale,
         coarse_step: float = 60.0,
-        fine_step: float = 5.0,
+        fine_step: Union[float, None] = None,
+        *,
+        tolerance: float = 1e-3,
     ) -> None:
         """Initialize the TCA switching strategy.
 
         Args:
             satellites: EarthSatellite objects to manage.
-            ts: Skyfield Timescale for time conversions during TCA search.
+            ts: Skyfield Timescale of the managed satellites.
             coarse_step: Time step in seconds for the coarse search grid.
-            fine_step: Time step in seconds for the fine refinement grid.
+            fine_step: Deprecated and ignored; the refinement converges to
+                *tolerance* instead of sampling a fine grid.
+            tolerance: Convergence tolerance in seconds for the refinement.
         """
+        if fine_step is not None:
+            warnings.warn(
+                "TCASwitchStrategy fine_step is deprecated and ignored; "
+                "use tolerance instead",
+                DeprecationWarning,
+                stacklevel=2,
+            )
         super().__init__(satellites)
         self.ts = ts
         self.coarse_step = coarse_step
-        self.fine_step = fine_step
+        self.tolerance = tolerance
+
+    def cache_token(self) -> Union[str, None]:
+        """TCA transitions also depend on the search step and tolerance."""
+        if type(self) is not TCASwitchStrategy:
+            return None
+        return f"tca:{self.coarse_step!r}:{self.tolerance!r}"
+
+    def update_transitions(self, inserted: npt.NDArray[np.intp]) -> None:
+        """Search only the TLE pairs that include an inserted satellite."""
+
+        def boundaries(index: npt.NDArray[np.intp]) -> npt.NDArray[np.datetime64]:
+            satrecs = [
+                _satrec(self.satellites, j) for i in index.tolist() for j in (i - 1, i)
+            ]
+            return _find_tcas(
+                satrecs,
+                coarse_step=self.coarse_step,
+                tolerance=self.tolerance,
+                pairs=np.arange(0, len(satrecs), 2),
+            )
+
+        _merge_transitions(self, inserted, boundaries)
 
     def compute_transitions(self) -> None:
         """Compute transitions at the time of closest approach between consecutive TLEs."""
-        transitions = []
-        for sat_a, sat_b in pairwise(self.satellites):
-            tca = _find_tca(
-                sat_a,
-                sat_b,
-                self.ts,
-                coarse_step=self.coarse_step,
-                fine_step=self.fine_step,
-            )
-            transitions.append(datetime_to_dt64(tca))
+        tcas = _find_tcas(
+            [_satrec(self.satellites, i) for i in range(len(self.satellites))],
+            coarse_step=self.coarse_step,
+            tolerance=self.tolerance,
+        )
+        self.transitions = np.concatenate(
+            [[DATETIME64_MIN], tcas, [DATETIME64_MAX]]
+        ).astype(EPOCH_DTYPE)
+
+
+class BlendSwitchStrategy(MidpointSwitchStrategy):
+    """Midpoint switching with a smooth cross-fade between neighboring TLEs.
+
+    Within ``window`` seconds centered on each midpoint transition, both
+    adjacent TLEs are propagated and their TEME states are blended with the
+    quintic smoothstep weight ``s = 10x^3 - 15x^4 + 6x^5``, where x runs
+    from 0 to 1 across the window. Position is therefore continuous with
+    continuous first and second derivatives. The blended velocity includes
+    the ``ds/dt`` term, so it stays the exact time derivative of the
+    blended position. Windows shrink near closely spaced TLEs so that they
+    never overlap.
+
+    Only the samples inside a window are propagated a second time. Blending
+    applies to :meth:`Propagator.at`, :meth:`Propagator.propagate_teme`,
+    :func:`~thistle.generate` and :func:`~thistle.generate_many`. Lookups
+    and APIs that work one TLE segment at a time (``find_*``,
+    ``segment_times``, ``generate_range``, the event finders) use the hard
+    midpoint transitions, and ``generate(..., workers=N)`` runs serially.
+
+    Attributes:
+        window: Full width of each blend window in seconds.
+    """
+
+    blends = True
+
+    def __init__(
+        self,
+        satellites: Sequence[EarthSatellite],
+        window: float = 600.0,
+    ) -> None:
+        """Initialize the blending strategy.
+
+        Args:
+            satellites: EarthSatellite objects to manage.
+            window: Full width of each blend window in seconds. Zero
+                disables blending.
+        """
+        super().__init__(satellites)
+        self.window = window
+
+    def cache_token(self) -> Union[str, None]:
+        """Blending leaves the midpoint transitions unchanged."""
+        if type(self) is not BlendSwitchStrategy:
+            return None
+        return "midpoint"
+
+    def blend(
+        self,
+        times: npt.NDArray[np.datetime64],
+        jd: npt.NDArray[np.float64],
+        fr: npt.NDArray[np.float64],
+        r: npt.NDArray[np.float64],
+        v: npt.NDArray[np.float64],
+    ) -> None:
+        """Cross-fade the states of window samples between adjacent TLEs."""
+        n = len(self.satellites)
+        if n < 2 or self.window <= 0 or not len(times):
+            return
+
+        # Interior transition k separates satellites k and k + 1.
+        edges = self.transitions[1:-1]
+        half = _blend_half_widths(edges, self.window)
+        bins = np.searchsorted(self.transitions, times, side="right") - 1
+        bins = np.clip(bins, 0, n - 1)
+
+        # Samples just after the transition on their left: the assigned TLE
+        # is the later of the pair.
+        left = np.clip(bins - 1, 0, n - 2)
+        after = (times - edges[left]) / np.timedelta64(1, "s")
+        in_after = (bins >= 1) & (after < half[left])
+        # Samples just before the transition on their right: the assigned
+        # TLE is the earlier of the pair.
+        right = np.clip(bins, 0, n - 2)
+        before = (times - edges[right]) / np.timedelta64(1, "s")
+        in_before = (bins <= n - 2) & (-before <= half[right]) & (half[right] > 0)
+
+        pos_after = np.flatnonzero(in_after)
+        pos_before = np.flatnonzero(in_before)
+        pos = np.concatenate([pos_after, pos_before])
+        if not len(pos):
+            return
+        edge = np.concatenate([left[pos_after], right[pos_before]])
+        offset = np.concatenate([after[pos_after], before[pos_before]])
+        other = np.concatenate([bins[pos_after] - 1, bins[pos_before] + 1])
+        hard_is_later = np.concatenate(
+            [np.ones(len(pos_after), dtype=bool), np.zeros(len(pos_before), dtype=bool)]
+        )
+
+        # Propagate the other TLE of each pair, one SGP4 call per TLE.
+        order = np.argsort(other, kind="stable")
+        pos, edge, offset, other = pos[order], edge[order], offset[order], other[order]
+        hard_is_later = hard_is_later[order]
+        starts = np.flatnonzero(np.r_[True, other[1:] != other[:-1]])
+        stops = np.r_[starts[1:], len(other)]
+        r_other, v_other = sgp4_segments(
+            (
+                (_satrec(self.satellites, int(other[i])), slice(i, j))
+                for i, j in zip(starts.tolist(), stops.tolist())
+            ),
+            jd[pos],
+            fr[pos],
+        )
 
-        transitions = [DATETIME_MIN] + transitions + [DATETIME_MAX]
-        self.transitions = np.array(transitions, dtype=EPOCH_DTYPE)
+        r_hard, v_hard = r[:, pos], v[:, pos]
+        r_early = np.where(hard_is_later, r_other, r_hard)
+        r_late = np.where(hard_is_later, r_hard, r_other)
+        v_early = np.where(hard_is_later, v_other, v_hard)
+        v_late = np.where(hard_is_later, v_hard, v_other)
+
+        h = half[edge]
+        x = (offset + h) / (2.0 * h)
+        s = x**3 * (x * (6.0 * x - 15.0) + 10.0)
+        ds_dt = 30.0 * x**2 * (1.0 - x) ** 2 / (2.0 * h)
+        dr = r_late - r_early
+        r[:, pos] = r_early + s * dr
+        v[:, pos] = v_early + s * (v_late - v_early) + ds_dt * dr
+
+
+def _blend_half_widths(
+    edges: npt.NDArray[np.datetime64], window: float
+) -> npt.NDArray[np.float64]:
+    """Half-width (s) of each blend window, at most half the neighbor gaps."""
+    seconds = (edges - edges[0]) / np.timedelta64(1, "s")
+    gaps = np.diff(seconds)
+    nearest = np.minimum(np.r_[np.inf, gaps], np.r_[gaps, np.inf])
+    return np.minimum(window / 2.0, nearest / 2.0)
 
 
 def _slices_by_transitions(
     transitions: npt.NDArray[np.datetime64], times: npt.NDArray[np.datetime64]
-) -> list[tuple[int, npt.NDArray[np.intp]]]:
+) -> list[tuple[int, Union[slice, npt.NDArray[np.intp]]]]:
     """Split a time array into segments based on transition boundaries.
 
     Each segment maps to the satellite index whose validity window
-    contains those times.
+    contains those times. Sorted times are split by searching the
+    transitions into them, O(n_transitions log n_times), and each segment
+    is a contiguous slice. Unsorted times are stably sorted first and each
+    segment is an index array. Times outside the transitions are assigned
+    to the first or last satellite.
 
     Args:
         transitions: Sorted boundary times (length n + 1 for n satellites).
-        times: Sorted array of propagation times.
+        times: Array of propagation times, preferably sorted.
 
     Returns:
-        A list of (satellite_index, index_array) tuples, where
-        index_array contains the positions in ``times`` that fall
-        within that satellite's window.
+        A list of (satellite_index, index) tuples in satellite order, where
+        index (a slice for sorted input, otherwise an index array) selects
+        the positions in ``times`` that fall within that satellite's window.
     """
-    bins = np.searchsorted(transitions, times, side="right") - 1
-    indices = []
-    for idx in range(int(bins[0]), int(bins[-1]) + 1):
-        slice_ = np.nonzero(bins == idx)[0]
-        if len(slice_) > 0:
-            indices.append((idx, slice_))
-    return indices
+    times = np.asarray(times)
+    if len(times) > 1 and np.any(times[1:] < times[:-1]):
+        order = np.argsort(times, kind="stable")
+        return [
+            (idx, order[index])
+            for idx, index in _sorted_slices(transitions, times[order])
+        ]
+    return list(_sorted_slices(transitions, times))
+
+
+def _sorted_slices(
+    transitions: npt.NDArray[np.datetime64], times: npt.NDArray[np.datetime64]
+) -> list[tuple[int, slice]]:
+    """Contiguous per-satellite slices of sorted *times*."""
+    bounds = np.searchsorted(times, transitions, side="left")
+    bounds[0] = 0
+    bounds[-1] = len(times)
+    nonempty = np.flatnonzero(bounds[1:] > bounds[:-1])
+    return [
+        (idx, slice(bounds[idx], bounds[idx + 1]))
+        for idx in nonempty.tolist()
+    ]
+
+
+def _as_datetime64(
+    times: Union[DateTime, Sequence[DateTime], npt.ArrayLike],
+) -> npt.NDArray[np.datetime64]:
+    """Coerce a time or collection of times to a datetime64 array."""
+    if isinstance(times, (datetime.datetime, np.datetime64)):
+        return np.asarray(validate_datetime64(times))
+    times = np.asarray(times)
+    if times.dtype.kind == "M":
+        return times
+    return np.array(
+        [validate_datetime64(t) for t in times.ravel().tolist()], dtype=EPOCH_DTYPE
+    ).reshape(times.shape)
 
 
 def merge_geos(geos: list[Geocentric], ts: Timescale) -> Geocentric:
@@ -287,6 +1034,62 @@ def merge_geos(geos: list[Geocentric], ts: Timescale) -> Geocentric:
     return Geocentric(pos.au, vel.au_per_d, times, center, target)
 
 
+# Salted into every transition cache key. Bump it whenever the file format or
+# a built-in strategy's algorithm changes, so older entries are never reused.
+_CACHE_VERSION = 1
+
+
+def _cache_path(
+    cache_dir: PathLike, tles: Union[list[TLETuple], TLEArray], token: str
+) -> pathlib.Path:
+    """Transition cache file for epoch-sorted *tles* under strategy *token*."""
+    digest = hashlib.sha256(f"v{_CACHE_VERSION}:{token}".encode())
+    for line1, line2 in tles:
+        digest.update(f"\n{line1.rstrip()}\n{line2.rstrip()}".encode())
+    directory = pathlib.Path(os.fsdecode(cache_dir)).expanduser()
+    return directory / f"transitions-{digest.hexdigest()}.npy"
+
+
+def _load_transitions(
+    path: pathlib.Path, expected: int
+) -> Union[npt.NDArray[np.datetime64], None]:
+    """Read cached transitions, or None if missing, unreadable or mismatched."""
+    try:
+        transitions = np.load(path, allow_pickle=False)
+    except (OSError, ValueError):
+        return None
+    if transitions.dtype != EPOCH_DTYPE or transitions.shape != (expected,):
+        return None
+    return transitions
+
+
+def _store_transitions(
+    path: pathlib.Path, transitions: npt.NDArray[np.datetime64]
+) -> None:
+    """Write transitions atomically; a failed write only skips caching.
+
+    The temporary file is removed whenever it was not moved into place,
+    including when the write fails with an error other than OSError.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    except OSError:
+        return
+    replaced = False
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, transitions, allow_pickle=False)
+        os.replace(tmp, path)
+        replaced = True
+    except OSError:
+        pass
+    finally:
+        if not replaced:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+
+
 class Propagator:
     """Satellite propagator with automatic TLE switching.
 
@@ -295,29 +1098,39 @@ class Propagator:
     configured switching strategy.
 
     Attributes:
-        satellites: EarthSatellite objects created from the input TLEs.
+        satellites: The input TLEs sorted by epoch, as a
+            :class:`SatelliteList` that builds each EarthSatellite (or
+            Satrec) on first use.
         switcher: The active TLE switching strategy.
         ts: Skyfield timescale used for time conversions.
+        max_age: Maximum time in seconds between a sample and the epoch of
+            its assigned TLE, or None for no limit.
     """
 
-    satellites: list[EarthSatellite]
+    satellites: SatelliteList
     switcher: SwitchingStrategy
     ts: Timescale
+    max_age: Union[float, None]
 
     def __init__(
         self,
-        tles: list[TLETuple],
+        tles: Union[list[TLETuple], TLEArray],
         *,
         method: Union[SwitchingStrategies, SwitchingStrategy] = "epoch",
         start: Union[datetime.datetime, None] = None,
         stop: Union[datetime.datetime, None] = None,
+        cache_dir: Union[PathLike, None] = None,
+        max_loaded: Union[int, None] = 1024,
+        max_age: Union[float, None] = None,
     ) -> None:
         """Initialize the propagator.
 
         Args:
-            tles: List of (line1, line2) TLE tuples for a single satellite.
+            tles: List of (line1, line2) TLE tuples for a single satellite,
+                or a :class:`~thistle.tle_array.TLEArray` to keep them in
+                compact array form.
             method: TLE switching strategy. Either a strategy name
-                (``"epoch"``, ``"midpoint"``, ``"tca"``) or a
+                (``"epoch"``, ``"midpoint"``, ``"tca"``, ``"blend"``) or a
                 :class:`SwitchingStrategy` instance. When a strategy
                 instance is provided, its ``satellites`` are replaced
                 with the satellites built from *tles*.
@@ -325,18 +1138,39 @@ class Propagator:
                 to this time range will be kept.
             stop: Optional stop time to filter TLEs. Only TLEs relevant
                 to this time range will be kept.
+            cache_dir: Optional directory for cached transitions. Entries
+                are keyed by a hash of the kept TLE lines and the strategy's
+                :meth:`~SwitchingStrategy.cache_token`, so changed TLEs or
+                parameters never reuse a stale result. Strategies without a
+                token are always recomputed.
+            max_loaded: Maximum number of EarthSatellite objects, and
+                separately of Satrec objects, kept in memory. Only TLE
+                epochs are parsed up front; objects beyond this bound are
+                evicted least recently used first and rebuilt on demand.
+                None keeps every object once built.
+            max_age: Optional validity horizon in seconds. A sample is
+                covered only if it lies within this long of the epoch of the
+                TLE the strategy assigns it (``epoch - max_age <= t <
+                epoch + max_age``). Uncovered samples are not propagated;
+                see :meth:`coverage`. The event finders of
+                :mod:`thistle.events` search only the covered intervals.
+                None extrapolates every TLE across its whole switching
+                interval.
 
         Raises:
-            ValueError: If method is a string that is not a valid strategy name.
+            ValueError: If method is a string that is not a valid strategy
+                name, or max_age is not positive.
             TypeError: If method is neither a string nor a SwitchingStrategy.
         """
+        if max_age is not None and not max_age > 0:
+            raise ValueError(f"max_age must be positive, got {max_age}")
+        self.max_age = max_age
         self.ts = load.timescale()
-        self.satellites = [EarthSatellite(a, b, ts=self.ts) for a, b in tles]
-        self.satellites.sort(key=lambda s: s.epoch.tt)
+        self.satellites = SatelliteList(tles, self.ts, maxsize=max_loaded)
 
         # Filter satellites to time range if specified
         if start is not None or stop is not None:
-            epochs = np.array([s.epoch.tt for s in self.satellites])
+            epochs = self.satellites.tt
             lo = 0
             hi = len(self.satellites)
 
@@ -353,9 +1187,7 @@ class Propagator:
             self.satellites = self.satellites[lo:hi]
 
         if isinstance(method, SwitchingStrategy):
-            method.satellites = sorted(
-                self.satellites, key=lambda sat: sat.epoch.utc_datetime()
-            )
+            method.satellites = self.satellites
             self.switcher = method
         elif isinstance(method, str):
             strategy = method.lower()
@@ -365,6 +1197,8 @@ class Propagator:
                 self.switcher = MidpointSwitchStrategy(self.satellites)
             elif strategy == "tca":
                 self.switcher = TCASwitchStrategy(self.satellites, ts=self.ts)
+            elif strategy == "blend":
+                self.switcher = BlendSwitchStrategy(self.satellites)
             else:
                 msg = f"Switching method {strategy!r} must be in {get_args(SwitchingStrategies)!r}"
                 raise ValueError(msg)
@@ -374,7 +1208,41 @@ class Propagator:
                 f"got {type(method).__name__}"
             )
 
+        path = None
+        token = self.switcher.cache_token()
+        if cache_dir is not None and token is not None:
+            path = _cache_path(cache_dir, self.satellites.tles, token)
+            transitions = _load_transitions(path, len(self.satellites) + 1)
+            if transitions is not None:
+                self.switcher.transitions = transitions
+                return
+
         self.switcher.compute_transitions()
+        if path is not None:
+            _store_transitions(path, self.switcher.transitions)
+
+    def extend(self, tles: Union[list[TLETuple], TLEArray]) -> None:
+        """Add newly arrived TLEs without rebuilding the propagator.
+
+        The new satellites are inserted in epoch order (after any existing
+        TLE with the same epoch), and the switching strategy's
+        :meth:`~SwitchingStrategy.update_transitions` recomputes only the
+        transitions adjacent to them. The result matches constructing a
+        new Propagator from all the TLEs. ``start``/``stop`` filtering from
+        construction is not applied to the new TLEs.
+
+        Args:
+            tles: List of (line1, line2) TLE tuples, or a TLEArray, for the
+                same satellite.
+        """
+        new = SatelliteList(tles, self.ts, maxsize=self.satellites.maxsize)
+        if not len(new):
+            return
+        satellites, inserted = self.satellites.merge(new)
+
+        self.satellites = satellites
+        self.switcher.satellites = satellites
+        self.switcher.update_transitions(inserted)
 
     def find_satellite(self, time: DateTime) -> EarthSatellite:
         """Find the appropriate satellite for a given time.
@@ -386,10 +1254,7 @@ class Propagator:
             The EarthSatellite whose TLE is most appropriate for the
             given time according to the switching strategy.
         """
-        time = validate_datetime64(time)
-        indices = _slices_by_transitions(self.switcher.transitions, np.atleast_1d(time))
-        idx, _ = indices[0]
-        return self.satellites[idx]
+        return self.satellites[self._find_index(time)]
 
     def find_satrec(self, time: DateTime) -> Satrec:
         """Find the appropriate Satrec for a given time.
@@ -401,8 +1266,28 @@ class Propagator:
             The sgp4 Satrec whose TLE is most appropriate for the
             given time according to the switching strategy.
         """
-        time = validate_datetime64(time)
-        return self.find_satellite(time).model
+        return self.satellites.satrec(self._find_index(time))
+
+    def _find_index(self, time: DateTime) -> int:
+        """Index into ``self.satellites`` of the TLE assigned to *time*."""
+        return int(self.find_satellite_index(validate_datetime64(time)))
+
+    def find_satellite_index(
+        self, times: Union[DateTime, Sequence[DateTime], npt.ArrayLike]
+    ) -> npt.NDArray[np.intp]:
+        """Resolve many times to TLEs with a single ``np.searchsorted``.
+
+        Args:
+            times: A datetime64 array (any unit, any order), a sequence of
+                datetimes, or a single time. Timezone information on
+                datetimes is dropped, as in :meth:`find_satellite`.
+
+        Returns:
+            Indices into ``self.satellites``, with the shape of *times*.
+        """
+        times = _as_datetime64(times)
+        bins = np.searchsorted(self.switcher.transitions, times, side="right") - 1
+        return np.clip(bins, 0, len(self.satellites) - 1)
 
     def find_tle(self, time: DateTime) -> TLETuple:
         """Find the appropriate TLE lines for a given time.
@@ -414,30 +1299,192 @@ class Propagator:
             A (line1, line2) tuple of TLE strings for the most appropriate
             TLE according to the switching strategy.
         """
-        satrec = self.find_satrec(time)
-        return export_tle(satrec)
+        return self._tle_lines(self._find_index(time))
+
+    def find_tles(
+        self, times: Union[DateTime, Sequence[DateTime], npt.ArrayLike]
+    ) -> list[TLETuple]:
+        """Find the TLE lines for each of many times.
+
+        Each distinct TLE is formatted once, however many times map to it,
+        so this scales to millions of timestamps.
+
+        Args:
+            times: Query times, as accepted by :meth:`find_satellite_index`.
+
+        Returns:
+            One (line1, line2) tuple per time, in input order, equal to
+            :meth:`find_tle` of that time.
+        """
+        indices = self.find_satellite_index(times).ravel()
+        unique, inverse = np.unique(indices, return_inverse=True)
+        lines = [self._tle_lines(idx) for idx in unique.tolist()]
+        return [lines[i] for i in inverse.ravel().tolist()]
+
+    def _tle_lines(self, idx: int) -> TLETuple:
+        if isinstance(self.satellites.tles, TLEArray):
+            # Rebuilt in export_tle format, without creating a Satrec
+            return self.satellites.tles[idx]
+        return export_tle(self.satellites.satrec(idx))
+
+    def coverage(self) -> npt.NDArray[np.datetime64]:
+        """Time intervals in which some TLE is within ``max_age`` of epoch.
+
+        Each TLE covers the part of its switching interval that lies within
+        ``max_age`` of its epoch. Adjacent covered pieces are merged.
+
+        Returns:
+            A (k, 2) array of ``[start, stop)`` datetime64 intervals in time
+            order, with k = 0 if no TLE covers any time. Without
+            ``max_age`` this is the single interval
+            ``[DATETIME64_MIN, DATETIME64_MAX)``.
+        """
+        lo, hi = self._coverage_bounds()
+        keep = lo < hi
+        lo, hi = lo[keep], hi[keep]
+        if not len(lo):
+            return np.empty((0, 2), dtype=EPOCH_DTYPE)
+        # Merge pieces that touch at a transition
+        starts = np.r_[True, lo[1:] != hi[:-1]]
+        stops = np.r_[starts[1:], True]
+        return np.stack([lo[starts], hi[stops]], axis=1)
+
+    def gaps(self) -> npt.NDArray[np.datetime64]:
+        """Time intervals that no TLE covers, the complement of :meth:`coverage`.
+
+        Returns:
+            A (k, 2) array of ``[start, stop)`` datetime64 intervals in time
+            order, empty without ``max_age``.
+        """
+        covered = self.coverage()
+        starts = np.r_[np.array([DATETIME64_MIN], dtype=EPOCH_DTYPE), covered[:, 1]]
+        stops = np.r_[covered[:, 0], np.array([DATETIME64_MAX], dtype=EPOCH_DTYPE)]
+        keep = starts < stops
+        return np.stack([starts[keep], stops[keep]], axis=1)
+
+    def covered(
+        self, times: Union[DateTime, Sequence[DateTime], npt.ArrayLike]
+    ) -> npt.NDArray[np.bool_]:
+        """Whether each time is within ``max_age`` of its assigned TLE's epoch.
+
+        Args:
+            times: Query times, as accepted by :meth:`find_satellite_index`.
+
+        Returns:
+            A boolean array with the shape of *times*; all True without
+            ``max_age``.
+        """
+        times = _as_datetime64(times)
+        if self.max_age is None:
+            return np.ones(times.shape, dtype=bool)
+        lo, hi = self._coverage_bounds()
+        bins = self.find_satellite_index(times)
+        return (times >= lo[bins]) & (times < hi[bins])
+
+    def _coverage_bounds(
+        self,
+    ) -> tuple[npt.NDArray[np.datetime64], npt.NDArray[np.datetime64]]:
+        """Per-TLE ``[lo, hi)`` covered part of each switching interval."""
+        transitions = self.switcher.transitions.astype(EPOCH_DTYPE)
+        lo, hi = transitions[:-1], transitions[1:]
+        if self.max_age is None:
+            return lo, hi
+        age = np.timedelta64(round(self.max_age * 1e6), "us")
+        epochs = self.satellites.epochs
+        return np.maximum(lo, epochs - age), np.minimum(hi, epochs + age)
+
+    def _covered_slices(
+        self, times: npt.NDArray[np.datetime64]
+    ) -> list[tuple[int, Union[slice, npt.NDArray[np.intp]]]]:
+        """:func:`_slices_by_transitions` restricted to covered samples."""
+        slices = _slices_by_transitions(self.switcher.transitions, times)
+        if self.max_age is None:
+            return slices
+        lo, hi = self._coverage_bounds()
+        covered = []
+        for idx, index in slices:
+            part = times[index]
+            if isinstance(index, slice):
+                # Sorted segment: the covered samples are a contiguous run
+                a, b = np.searchsorted(part, [lo[idx], hi[idx]]).tolist()
+                index = slice(index.start + a, index.start + b)
+                if a == b:
+                    continue
+            else:
+                index = index[(part >= lo[idx]) & (part < hi[idx])]
+                if not len(index):
+                    continue
+            covered.append((idx, index))
+        return covered
 
-    def at(self, tt: Time) -> Geocentric:
+    def at(
+        self,
+        tt: Time,
+        times: Union[npt.NDArray[np.datetime64], None] = None,
+    ) -> Geocentric:
         """Propagate satellite position at the given time(s).
 
         Automatically switches between TLEs based on the configured
         strategy to produce the most accurate position across the time
-        range.
+        range. Every sample is propagated against its assigned TLE with one
+        vectorized SGP4 call per segment, and a single TEME to GCRS rotation
+        is applied to the whole array; the result matches calling
+        ``EarthSatellite.at()`` per segment.
 
         Args:
             tt: A skyfield Time object, scalar or array.
+            times: Optional datetime64 equivalents of ``tt`` used to assign
+                samples to TLEs. Defaults to converting ``tt``; pass the
+                original array when ``tt`` was built from datetime64 values
+                so switching is decided on the exact input times.
 
         Returns:
             A Geocentric position combining results from all TLE
-            segments.
+            segments, in the same order as ``tt``.
         """
-        dt64 = time_to_dt64(tt)
-        indices = _slices_by_transitions(self.switcher.transitions, dt64)
-        geos = []
-        for idx, slice_ in indices:
-            g = self.satellites[idx].at(tt[slice_])
-            geos.append(g)
-        return merge_geos(geos, self.ts)
+        if times is None:
+            times = time_to_dt64(tt)
+        jd, fr = sgp4_time(tt)
+        r, v = teme_to_gcrs(tt, *self._teme(jd, fr, np.atleast_1d(times)))
+        if not tt.shape:
+            r, v = r[:, 0], v[:, 0]
+        return Geocentric(r, v, tt, 399, self.satellites[0].target)
+
+    def propagate_teme(
+        self, times: npt.NDArray[np.datetime64]
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Evaluate raw SGP4 state at datetime64 times, bypassing Skyfield.
+
+        The times are treated as UTC and converted straight to the Julian
+        dates SGP4 expects; no Skyfield Time or position objects are built.
+
+        Args:
+            times: Array of datetime64 values (UTC).
+
+        Returns:
+            A (r, v) tuple of TEME position (km) and velocity (km/s)
+            arrays with shape (3, n).
+        """
+        jd, fr = jday_datetime64(times)
+        return self._teme(jd, fr, times)
+
+    def _teme(
+        self,
+        jd: npt.NDArray[np.float64],
+        fr: npt.NDArray[np.float64],
+        times: npt.NDArray[np.datetime64],
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Evaluate SGP4 with each sample assigned to its TLE by ``times``.
+
+        Samples outside :meth:`coverage` are not propagated and come back NaN.
+        """
+        segments = (
+            (self.satellites.satrec(idx), index)
+            for idx, index in self._covered_slices(times)
+        )
+        r, v = sgp4_segments(segments, jd, fr)
+        self.switcher.blend(times, jd, fr, r, v)
+        return r, v
 
     def segment_times(
         self, times: npt.NDArray[np.datetime64]
@@ -446,9 +1493,11 @@ class Propagator:
 
         Each segment pairs a contiguous slice of the input times with the
         EarthSatellite that should be used for propagation in that interval.
+        For sorted input the slices are views of *times*, not copies.
 
         Args:
-            times: Sorted array of datetime64 values.
+            times: Sorted array of datetime64 values. Unsorted input is
+                accepted; its segments are then copies in time order.
 
         Returns:
             A list of (time_slice, satellite) tuples, ordered
@@ -0,0 +1,295 @@
+"""Compact struct-of-arrays storage for large TLE collections.
+
+A :class:`TLEArray` keeps every numeric field of a TLE in its own NumPy
+array, about 100 bytes per element set instead of the kilobytes taken by a
+Skyfield ``EarthSatellite``. TLE lines, ``Satrec`` objects and
+``SatrecArray`` objects are rebuilt from the arrays on demand.
+"""
+
+from typing import Iterable, Iterator, Sequence, Union, overload
+
+import numpy as np
+import numpy.typing as npt
+from sgp4.alpha5 import from_alpha5, to_alpha5
+from sgp4.api import Satrec, SatrecArray
+from sgp4.io import compute_checksum
+
+from thistle.typing import TLETuple
+
+# (name, dtype) of every stored field, in TLE column order.
+_FIELDS = (
+    ("satnum", np.int32),
+    ("classification", "S1"),
+    ("intldesg", "S8"),
+    ("epoch_year", np.uint8),
+    ("epoch_days", np.float64),
+    ("ndot", np.float64),
+    ("nddot", np.float64),
+    ("bstar", np.float64),
+    ("ephtype", np.uint8),
+    ("elnum", np.uint16),
+    ("inc", np.float64),
+    ("raan", np.float64),
+    ("ecc", np.float64),
+    ("aop", np.float64),
+    ("ma", np.float64),
+    ("mm", np.float64),
+    ("revnum", np.uint32),
+)
+
+_LINE_LENGTH = 69
+
+
+def _char_matrix(lines: list[str]) -> npt.NDArray[np.bytes_]:
+    """Lines as an (n, 69) array of single bytes, space padded."""
+    data = np.array([line.ljust(_LINE_LENGTH) for line in lines], dtype="U69")
+    chars = data.astype(f"S{_LINE_LENGTH}").view("S1")
+    return chars.reshape(len(lines), _LINE_LENGTH)
+
+
+def _column(
+    chars: npt.NDArray[np.bytes_], start: int, stop: int
+) -> npt.NDArray[np.bytes_]:
+    """Fixed-width text field ``line[start:stop]`` of every line."""
+    field = np.ascontiguousarray(chars[:, start:stop])
+    return field.view(f"S{stop - start}").ravel()
+
+
+def _int_column(
+    chars: npt.NDArray[np.bytes_], start: int, stop: int, dtype: npt.DTypeLike
+) -> npt.NDArray:
+    """Integer field; blank fields read as zero."""
+    col = _column(chars, start, stop)
+    col = np.where(np.char.strip(col) == b"", b"0", col)
+    return col.astype(np.int64).astype(dtype)
+
+
+def _exp_column(chars: npt.NDArray[np.bytes_], start: int) -> npt.NDArray[np.float64]:
+    """Field in the ``±nnnnn±e`` implied-decimal exponent format."""
+    mantissa = np.char.add(
+        np.char.replace(_column(chars, start, start + 1), b" ", b"+"),
+        np.char.add(b".", _column(chars, start + 1, start + 6)),
+    )
+    exponent = np.char.replace(_column(chars, start + 6, start + 8), b" ", b"+")
+    return np.char.add(np.char.add(mantissa, b"e"), exponent).astype(np.float64)
+
+
+def _parse_lines(tles: list[TLETuple]) -> dict[str, npt.NDArray]:
+    """Parse every field of *tles* column-wise into arrays."""
+    line1 = _char_matrix([tle[0] for tle in tles])
+    line2 = _char_matrix([tle[1] for tle in tles])
+
+    satnum = _column(line1, 2, 7)
+    try:
+        satnum = satnum.astype(np.int64)
+    except ValueError:
+        satnum = np.array([from_alpha5(s.decode().strip()) for s in satnum.tolist()])
+
+    return {
+        "satnum": satnum.astype(np.int32),
+        "classification": _column(line1, 7, 8),
+        "intldesg": np.char.strip(_column(line1, 9, 17)),
+        "epoch_year": _int_column(line1, 18, 20, np.uint8),
+        "epoch_days": _column(line1, 20, 32).astype(np.float64),
+        "ndot": _column(line1, 33, 43).astype(np.float64),
+        "nddot": _exp_column(line1, 44),
+        "bstar": _exp_column(line1, 53),
+        "ephtype": _int_column(line1, 62, 63, np.uint8),
+        "elnum": _int_column(line1, 64, 68, np.uint16),
+        "inc": _column(line2, 8, 16).astype(np.float64),
+        "raan": _column(line2, 17, 25).astype(np.float64),
+        "ecc": _column(line2, 26, 33).astype(np.int64) / 1e7,
+        "aop": _column(line2, 34, 42).astype(np.float64),
+        "ma": _column(line2, 43, 51).astype(np.float64),
+        "mm": _column(line2, 52, 63).astype(np.float64),
+        "revnum": _int_column(line2, 63, 68, np.uint32),
+    }
+
+
+def _abbreviate(value: float, zero_exponent: str) -> str:
+    """Format an implied-decimal exponent field the way ``export_tle`` does."""
+    return (
+        "{0: 4.4e} ".format(value * 10.0)
+        .replace(".", "")
+        .replace("e+00", zero_exponent)
+        .replace("e-0", "-")
+        .replace("e+0", "+")
+    )
+
+
+class TLEArray(Sequence[TLETuple]):
+    """Struct-of-arrays store of many TLEs.
+
+    Each TLE field is held in a parallel NumPy array, so a whole catalog
+    history fits in memory at about 100 bytes per element set. Parsing is
+    column-wise over all lines at once. Indexing with an integer rebuilds
+    that TLE's lines, in the same format as :func:`sgp4.exporter.export_tle`;
+    slicing or indexing with an integer array returns another TLEArray.
+    ``Satrec.twoline2rv`` of rebuilt lines gives the same Satrec as the
+    original lines.
+
+    Field arrays use TLE units: ``epoch_year`` is the two-digit year,
+    ``epoch_days`` the fractional day of year, ``ndot`` and ``nddot`` the
+    mean motion derivative terms (rev/day^2 and rev/day^3), ``bstar`` the
+    drag term (1/earth radii), ``inc``, ``raan``, ``aop`` and ``ma`` in
+    degrees, ``ecc`` dimensionless and ``mm`` in rev/day.
+
+    Attributes:
+        satnum: Catalog numbers (Alpha-5 numbers decoded).
+        classification: Classification characters.
+        intldesg: International designators.
+        epoch_year: Two-digit epoch years.
+        epoch_days: Epoch days of year.
+        ndot: First derivative of mean motion over two.
+        nddot: Second derivative of mean motion over six.
+        bstar: B* drag terms.
+        ephtype: Ephemeris types.
+        elnum: Element set numbers.
+        inc: Inclinations.
+        raan: Right ascensions of the ascending node.
+        ecc: Eccentricities.
+        aop: Arguments of perigee.
+        ma: Mean anomalies.
+        mm: Mean motions.
+        revnum: Revolution numbers at epoch.
+    """
+
+    satnum: npt.NDArray[np.int32]
+    classification: npt.NDArray[np.bytes_]
+    intldesg: npt.NDArray[np.bytes_]
+    epoch_year: npt.NDArray[np.uint8]
+    epoch_days: npt.NDArray[np.float64]
+    ndot: npt.NDArray[np.float64]
+    nddot: npt.NDArray[np.float64]
+    bstar: npt.NDArray[np.float64]
+    ephtype: npt.NDArray[np.uint8]
+    elnum: npt.NDArray[np.uint16]
+    inc: npt.NDArray[np.float64]
+    raan: npt.NDArray[np.float64]
+    ecc: npt.NDArray[np.float64]
+    aop: npt.NDArray[np.float64]
+    ma: npt.NDArray[np.float64]
+    mm: npt.NDArray[np.float64]
+    revnum: npt.NDArray[np.uint32]
+
+    def __init__(self, tles: Iterable[TLETuple] = ()) -> None:
+        """Parse TLE lines into field arrays.
+
+        Args:
+            tles: (line1, line2) TLE tuples. Lines may omit the checksum.
+
+        Raises:
+            ValueError: If a numeric field cannot be parsed.
+        """
+        tles = list(tles)
+        if tles:
+            fields = _parse_lines(tles)
+        else:
+            fields = {name: np.empty(0, dtype=dtype) for name, dtype in _FIELDS}
+        self._set_fields(fields)
+
+    def _set_fields(self, fields: dict[str, npt.NDArray]) -> None:
+        for name, dtype in _FIELDS:
+            setattr(self, name, np.asarray(fields[name], dtype=dtype))
+
+    @classmethod
+    def _from_fields(cls, fields: dict[str, npt.NDArray]) -> "TLEArray":
+        self = cls.__new__(cls)
+        self._set_fields(fields)
+        return self
+
+    @classmethod
+    def concatenate(cls, arrays: Sequence["TLEArray"]) -> "TLEArray":
+        """Join several TLEArrays end to end."""
+        if not arrays:
+            return cls()
+        return cls._from_fields(
+            {
+                name: np.concatenate([getattr(a, name) for a in arrays])
+                for name, _ in _FIELDS
+            }
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Total bytes held by the field arrays."""
+        return sum(getattr(self, name).nbytes for name, _ in _FIELDS)
+
+    def __len__(self) -> int:
+        return len(self.satnum)
+
+    @overload
+    def __getitem__(self, index: int) -> TLETuple: ...
+
+    @overload
+    def __getitem__(self, index: Union[slice, npt.NDArray]) -> "TLEArray": ...
+
+    def __getitem__(self, index):
+        if isinstance(index, (slice, np.ndarray, list)):
+            return self._from_fields(
+                {name: getattr(self, name)[index] for name, _ in _FIELDS}
+            )
+        return self._lines(int(index))
+
+    def __iter__(self) -> Iterator[TLETuple]:
+        for i in range(len(self)):
+            yield self._lines(i)
+
+    def _lines(self, i: int, checksum: bool = True) -> TLETuple:
+        """Rebuild the (line1, line2) text of TLE *i*.
+
+        With ``checksum=False`` the lines stop at column 68, which is all
+        ``Satrec.twoline2rv`` reads, and the checksums are not computed.
+        """
+        satnum = to_alpha5(int(self.satnum[i]))
+        classification = self.classification[i].decode().strip() or "U"
+        line1 = "".join(
+            [
+                "1 ",
+                satnum,
+                classification,
+                " ",
+                "{0:8} ".format(self.intldesg[i].decode()),
+                "{:02d}".format(int(self.epoch_year[i])),
+                "{:012.8f} ".format(self.epoch_days[i]),
+                "{0: 8.8f}".format(self.ndot[i]).replace("0", "", 1) + " ",
+                _abbreviate(float(self.nddot[i]), "-0"),
+                _abbreviate(float(self.bstar[i]), "+0"),
+                "{0} {1:4}".format(int(self.ephtype[i]), int(self.elnum[i])),
+            ]
+        )
+        line2 = "".join(
+            [
+                "2 ",
+                satnum,
+                " {0:8.4f} ".format(self.inc[i]),
+                "{0:8.4f}".format(self.raan[i]).rjust(8, " ") + " ",
+                "{0:8.7f}".format(self.ecc[i]).replace("0.", "") + " ",
+                "{0:8.4f}".format(self.aop[i]).rjust(8, " ") + " ",
+                "{0:8.4f}".format(self.ma[i]).rjust(8, " ") + " ",
+                "{0:11.8f}".format(self.mm[i]).rjust(8, " "),
+                str(int(self.revnum[i])).rjust(5),
+            ]
+        )
+        if not checksum:
+            return line1, line2
+        return (
+            line1 + str(compute_checksum(line1)),
+            line2 + str(compute_checksum(line2)),
+        )
+
+    def satrec(self, index: int) -> Satrec:
+        """Build the Satrec of TLE *index*."""
+        return Satrec.twoline2rv(*self._lines(int(index), checksum=False))
+
+    def satrecs(self, index: Union[npt.ArrayLike, None] = None) -> SatrecArray:
+        """Build a SatrecArray of all TLEs, or of those at *index*.
+
+        Args:
+            index: Optional integer indices selecting the TLEs.
+
+        Returns:
+            A SatrecArray for vectorized propagation of the selection.
+        """
+        indices = range(len(self)) if index is None else np.asarray(index).tolist()
+        return SatrecArray([self.satrec(i) for i in indices])
@@ -2,7 +2,7 @@
 
 import datetime
 import itertools
-from typing import Any, Callable, Iterable, Sequence, TypeVar, Union, cast
+from typing import Any, Callable, Iterable, TypeVar, Union
 
 import numpy as np
 import numpy.typing as npt
@@ -128,6 +128,9 @@ DATETIME64_MAX = np.datetime64(DATETIME_MAX, TIME_SCALE)
 JDAY_1957 = 2435839.5
 """Julian date of 1957-01-01 00:00:00 UTC."""
 
+# Offset from skyfield's "seconds since JD 0.0" count to the Unix epoch.
+_JD0_TO_UNIX_SECONDS = 43_200 - 2_440_588 * 86_400
+
 
 def datetime_to_dt64(dt: datetime.datetime) -> np.datetime64:
     """Convert a datetime to a numpy datetime64 in microseconds.
@@ -274,7 +277,9 @@ def dt64_to_time(
 def time_to_dt64(time: skyfield.timelib.Time) -> npt.NDArray[np.datetime64]:
     """Convert a skyfield Time to a datetime64 array.
 
-    Leap seconds are folded into the resulting datetimes.
+    Leap seconds are folded into the resulting datetimes. Values are rounded
+    to the nearest microsecond the same way ``Time.utc_datetime()`` rounds
+    them, but without building a Python datetime per element.
 
     Args:
         time: A skyfield Time object (array).
@@ -282,15 +287,12 @@ def time_to_dt64(time: skyfield.timelib.Time) -> npt.NDArray[np.datetime64]:
     Returns:
         An array of datetime64 values with microsecond resolution.
     """
-    dt_arr, ls_arr = time.utc_datetime_and_leap_second()
-    dt = [
-        a.replace(tzinfo=None) + datetime.timedelta(seconds=int(b))
-        for a, b in zip(
-            cast(Sequence[datetime.datetime], dt_arr),
-            cast(Sequence[float], ls_arr),
-        )
-    ]
-    return np.array(dt, dtype=EPOCH_DTYPE)
+    # Whole UTC seconds since JD 0.0 (noon) plus a [0, 1) fraction; a leap
+    # second counts as the following second, as in the datetime path.
+    seconds, fraction, _ = time._utc_seconds(0.5e-6)
+    seconds = np.atleast_1d(seconds).astype(np.int64) + _JD0_TO_UNIX_SECONDS
+    micro = (np.atleast_1d(fraction) * 1e6).astype(np.int64)
+    return (seconds * 1_000_000 + micro).astype(EPOCH_DTYPE)
 
 
 def tle_epoch(tle: TLETuple) -> float:
@@ -171,6 +171,14 @@ def test_find_tle_unique(runner, tle_file):
     assert result.stdout.count("\n") == 2
 
 
+def test_find_tle_chunks(runner, tle_file):
+    inp = "2024-01-01T12:00:00\nbad\n\n2024-01-01T13:00:00\n2024-01-01T14:00:00\n"
+    result = runner.invoke(app, ["find-tle", str(tle_file), "--chunk", "2"], input=inp)
+    assert result.exit_code == 0
+    assert result.stdout.count("\n") == 6
+    assert "skipping unparseable time: bad" in result.stderr
+
+
 # ---- revnum ---------------------------------------------------------------
 
 # Vanguard 1, epoch 2025-01-31, revnum 47569 (from tests/thistle/data/leo.tle)
@@ -625,6 +633,129 @@ def test_propagate_requires_group(runner, tle_file):
     assert result.exit_code == 2
 
 
+PROPAGATE_TIMES = "".join(f"2024-01-01T12:{m:02d}:00\n" for m in range(5))
+
+
+def test_propagate_csv(runner, tle_file):
+    result = runner.invoke(
+        app,
+        ["propagate", str(tle_file), "--lla", "--format", "csv", "--print-header"],
+        input=PROPAGATE_TIMES,
+    )
+    assert result.exit_code == 0
+    lines = result.stdout.splitlines()
+    assert lines[0] == "time,lat,lon,alt"
+    assert len(lines) == 6
+    assert lines[1].startswith("2024-01-01T12:00:00,")
+
+
+def test_propagate_align_across_chunks(runner, tle_file):
+    result = runner.invoke(
+        app,
+        ["propagate", str(tle_file), "--lla", "--align", "--print-header",
+         "--chunk", "2"],
+        input=PROPAGATE_TIMES,
+    )
+    assert result.exit_code == 0
+    lines = result.stdout.splitlines()
+    assert len(lines) == 6
+    assert lines[0].startswith("time" + " " * 16 + "lat")
+    assert all(line[19] == " " and line[20] != " " for line in lines)
+
+
+def test_text_writer_keeps_first_chunk_time_unit():
+    import io
+
+    import numpy as np
+
+    from thistle.cli._output import TextWriter
+
+    stream = io.StringIO()
+    writer = TextWriter(stream, ",")
+    t0 = np.datetime64("2024-01-01T12:00:00", "ms")
+    writer.write({"times": t0 + np.array([0, 500]), "x": np.zeros(2)})
+    writer.write({"times": t0 + np.array([1000, 2000]), "x": np.zeros(2)})
+    times = [line.split(",")[0] for line in stream.getvalue().splitlines()]
+    assert times == [
+        "2024-01-01T12:00:00.000",
+        "2024-01-01T12:00:00.500",
+        "2024-01-01T12:00:01.000",
+        "2024-01-01T12:00:02.000",
+    ]
+
+
+def test_propagate_time_grid(runner, tle_file):
+    stdin = runner.invoke(app, ["propagate", str(tle_file), "--lla"], input=PROPAGATE_TIMES)
+    grid = runner.invoke(
+        app,
+        ["propagate", str(tle_file), "--lla", "--start", "2024-01-01T12:00:00",
+         "--stop", "2024-01-01T12:05:00", "--step", "60", "--chunk", "2"],
+    )
+    assert grid.exit_code == 0
+    assert grid.stdout == stdin.stdout
+
+
+def test_propagate_time_grid_unit_from_step(runner, tle_file):
+    result = runner.invoke(
+        app,
+        ["propagate", str(tle_file), "--lla", "--start", "2024-01-01T12:00:00",
+         "--stop", "2024-01-01T12:00:03", "--step", "1.5", "--chunk", "1"],
+    )
+    assert result.exit_code == 0
+    times = [line.split()[0] for line in result.stdout.splitlines()]
+    assert times == ["2024-01-01T12:00:00.000", "2024-01-01T12:00:01.500"]
+
+
+def test_propagate_time_grid_requires_stop(runner, tle_file):
+    result = runner.invoke(
+        app, ["propagate", str(tle_file), "--lla", "--start", "2024-01-01T12:00:00"]
+    )
+    assert result.exit_code == 2
+
+
+def test_propagate_npz(runner, tle_file, tmp_path):
+    import numpy as np
+
+    out = tmp_path / "out.npz"
+    result = runner.invoke(
+        app,
+        ["propagate", str(tle_file), "--eci", "--sunlight", "--format", "npz",
+         "-o", str(out), "--chunk", "2"],
+        input=PROPAGATE_TIMES,
+    )
+    assert result.exit_code == 0
+    data = np.load(out)
+    assert data["time"].shape == (5,)
+    assert data["time"][0] == np.datetime64("2024-01-01T12:00:00")
+    assert data["eci_x"].dtype == np.float64
+    assert data["sun"].dtype == np.int8
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+def test_propagate_arrow_formats(runner, tle_file, tmp_path, fmt):
+    pa = pytest.importorskip("pyarrow")
+
+    out = tmp_path / f"out.{fmt}"
+    result = runner.invoke(
+        app,
+        ["propagate", str(tle_file), "--lla", "--format", fmt, "-o", str(out),
+         "--chunk", "2"],
+        input=PROPAGATE_TIMES,
+    )
+    assert result.exit_code == 0
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(out)
+        assert pq.ParquetFile(out).num_row_groups == 3
+    else:
+        with pa.ipc.open_stream(str(out)) as reader:
+            table = reader.read_all()
+    assert table.column_names == ["time", "lat", "lon", "alt"]
+    assert table.num_rows == 5
+    assert table.schema.field("lat").type == pa.float32()
+
+
 # ---- groundtrack -----------------------------------------------------------
 
 SPEC_LINE = "2024-01-01T12:00:00 2024-01-01T13:30:00"
@@ -881,6 +1012,19 @@ def test_config_json(runner, tle_dir):
     assert data["tle_dir_source"] == "THISTLE_TLE_DIR"
     assert data["tle_ext"] == ".tle"
     assert data["tle_ext_source"] == "default"
+    assert data["cache_dir"] is None
+
+
+def test_propagate_uses_cache_dir(runner, tle_file, tmp_path, monkeypatch):
+    monkeypatch.setenv("THISTLE_CACHE_DIR", str(tmp_path / "cache"))
+    for _ in range(2):
+        result = runner.invoke(
+            app,
+            ["propagate", str(tle_file), "--lla", "--switch", "tca"],
+            input=PROPAGATE_TIMES,
+        )
+        assert result.exit_code == 0
+    assert len(list((tmp_path / "cache").glob("*.npy"))) == 1
 
 
 def test_config_warns_missing_dir(runner, monkeypatch, tmp_path):
@@ -2,16 +2,28 @@
 
 import numpy as np
 import pytest
-from skyfield.api import EarthSatellite, load
+from skyfield import almanac
+from skyfield.api import EarthSatellite, load, wgs84
 
+from thistle._core import Site, eph
 from thistle.propagator import Propagator
-from thistle.utils import read_tle
+from thistle.tle_array import TLEArray
+from thistle.utils import dt64_to_time, read_tle, time_to_dt64
 from thistle.events import (
+    EventKind,
+    _bisect,
+    _changes,
+    _merge_passes,
+    _merge_periods,
+    _search_grid,
     find_ascending_periods,
+    find_catalog_passes,
     find_descending_periods,
     find_eclipse_periods,
+    find_events,
     find_node_crossings,
     find_passes,
+    find_passes_multi,
     find_sunlit_periods,
 )
 
@@ -28,6 +40,156 @@ BOULDER_LAT = 40.0150
 BOULDER_LON = -105.2705
 
 
+class TestFindDiscrete:
+    """Tests for the vectorized event search engine."""
+
+    @staticmethod
+    def _search(predicate):
+        grid = _search_grid(START_24H, STOP_24H, np.timedelta64(0, "us"))
+        values = predicate(grid)
+        index, after = _changes(values)
+        (event_times,) = _bisect(grid, lambda times: times, [(predicate, index, after)])
+        return event_times, after, bool(values[0])
+
+    def test_finds_every_change(self):
+        """Events every 7 min are all found, to the tolerance, in few calls."""
+        period = np.timedelta64(420, "s")
+        calls = []
+
+        def predicate(times):
+            calls.append(len(times))
+            return ((times - START_24H) // period) % 2 == 1
+
+        event_times, values, initial = self._search(predicate)
+        expected = START_24H + period * np.arange(1, 206)
+        assert not initial
+        np.testing.assert_array_equal(values, np.arange(1, 206) % 2 == 1)
+        error = (event_times - expected) / np.timedelta64(1, "us")
+        assert np.all((error >= 0) & (error <= 1000))
+        # One grid evaluation plus one per bisection iteration
+        assert len(calls) <= 18
+        assert all(n == len(expected) for n in calls[1:])
+
+    def test_no_changes(self):
+        event_times, values, initial = self._search(
+            lambda times: np.ones(len(times), dtype=bool)
+        )
+        assert len(event_times) == 0 and len(values) == 0
+        assert initial
+
+    def test_jobs_share_propagation(self):
+        """Brackets of several predicates are refined in the same calls."""
+        grid = _search_grid(START_24H, STOP_24H, np.timedelta64(0, "us"))
+        calls = []
+
+        def propagate(times):
+            calls.append(len(times))
+            return times
+
+        jobs = []
+        for period in (420, 1000):
+            step = np.timedelta64(period, "s")
+
+            def predicate(times, step=step):
+                return ((times - START_24H) // step) % 2 == 1
+
+            jobs.append((predicate, *_changes(predicate(grid))))
+        found = _bisect(grid, propagate, jobs)
+        assert [len(f) for f in found] == [205, 86]
+        assert len(calls) <= 17
+        assert all(n == 205 + 86 for n in calls)
+
+    def test_matches_skyfield_find_discrete(self):
+        """Sunlit transitions agree with Skyfield's almanac search."""
+        t0, t1 = dt64_to_time(np.array([START_24H, STOP_24H]), ts)
+
+        def is_sunlit(t):
+            return SAT.at(t).is_sunlit(eph)
+
+        is_sunlit.step_days = 1 / 1440  # type: ignore[attr-defined]
+        expected, _ = almanac.find_discrete(t0, t1, is_sunlit)
+        periods = find_sunlit_periods(START_24H, STOP_24H, SAT)
+        found = np.array(
+            [p["start"] for p in periods if p["start"] != START_24H]
+            + [p["stop"] for p in periods if p["stop"] != STOP_24H]
+        )
+        diff = np.sort(found) - time_to_dt64(expected)
+        assert np.abs(diff / np.timedelta64(1, "s")).max() < 0.01
+
+
+class TestFindEvents:
+    """Tests for the combined single-propagation event search."""
+
+    KINDS: list[EventKind] = [
+        "passes", "node_crossings", "sunlit", "eclipse", "ascending", "descending"
+    ]
+
+    def test_matches_single_kind_functions(self):
+        sites: dict[str, Site] = {
+            "boulder": (BOULDER_LAT, BOULDER_LON),
+            "equator": (0.0, 0.0),
+        }
+        events = find_events(START_24H, STOP_24H, SAT, self.KINDS, sites=sites)
+        assert set(events) == {
+            "passes_boulder",
+            "passes_equator",
+            "node_crossings",
+            "sunlit",
+            "eclipse",
+            "ascending",
+            "descending",
+        }
+        assert events["passes_boulder"] == find_passes(
+            START_24H, STOP_24H, SAT, BOULDER_LAT, BOULDER_LON
+        )
+        assert events["passes_equator"] == find_passes(
+            START_24H, STOP_24H, SAT, 0.0, 0.0
+        )
+        assert events["node_crossings"] == find_node_crossings(START_24H, STOP_24H, SAT)
+        for kind, func in [
+            ("sunlit", find_sunlit_periods),
+            ("eclipse", find_eclipse_periods),
+            ("ascending", find_ascending_periods),
+            ("descending", find_descending_periods),
+        ]:
+            assert events[kind] == func(START_24H, STOP_24H, SAT)
+
+    def test_only_requested_kinds(self):
+        events = find_events(START_24H, STOP_24H, SAT, ["eclipse"])
+        assert list(events) == ["eclipse"]
+
+    def test_passes_match_skyfield(self):
+        """Rise and set times agree with Skyfield's find_events."""
+        t0, t1 = dt64_to_time(np.array([START_24H, STOP_24H]), ts)
+        topos = wgs84.latlon(BOULDER_LAT, BOULDER_LON)
+        times, kinds = SAT.find_events(topos, t0, t1, altitude_degrees=5.0)
+        expected = time_to_dt64(times)[kinds != 1]
+        passes = find_events(
+            START_24H, STOP_24H, SAT, ["passes"], sites=[(BOULDER_LAT, BOULDER_LON)]
+        )["passes_0"]
+        found = np.array(
+            [p["start"] for p in passes if p["start"] != START_24H]
+            + [p["stop"] for p in passes if p["stop"] != STOP_24H]
+        )
+        diff = np.sort(found) - expected
+        # Skyfield refines rise and set to half a second
+        assert np.abs(diff / np.timedelta64(1, "s")).max() < 1.0
+
+    def test_passes_without_sites_raises(self):
+        with pytest.raises(ValueError, match="site"):
+            find_events(START_24H, STOP_24H, SAT, ["passes"])
+
+    def test_unknown_kind_raises(self):
+        with pytest.raises(ValueError, match="Unknown"):
+            find_events(
+                START_24H, STOP_24H, SAT, ["perigee"]  # type: ignore[list-item]
+            )
+
+    def test_start_equals_stop_raises(self):
+        with pytest.raises(ValueError):
+            find_events(START_24H, START_24H, SAT, ["sunlit"])
+
+
 class TestFindPasses:
     """Tests for find_passes."""
 
@@ -93,6 +255,90 @@ class TestFindPasses:
         assert len(passes_30) <= len(passes_5)
 
 
+class TestFindPassesMulti:
+    """Tests for find_passes_multi."""
+
+    SITES = {
+        "boulder": (BOULDER_LAT, BOULDER_LON, 1655.0),
+        "equator": (0.0, 0.0),
+        "south": (-45.0, 170.0, 300.0),
+    }
+
+    def test_matches_find_passes(self):
+        result = find_passes_multi(START_24H, STOP_24H, SAT, self.SITES)
+        assert list(result) == list(self.SITES)
+        for name, site in self.SITES.items():
+            assert result[name] == find_passes(START_24H, STOP_24H, SAT, *site)
+
+    def test_list_sites_keyed_by_index(self):
+        sites = list(self.SITES.values())
+        result = find_passes_multi(START_24H, STOP_24H, SAT, sites, min_elevation=10.0)
+        assert list(result) == ["0", "1", "2"]
+        assert result["2"] == find_passes(
+            START_24H, STOP_24H, SAT, *sites[2], min_elevation=10.0
+        )
+
+    def test_empty_sites_raises(self):
+        with pytest.raises(ValueError):
+            find_passes_multi(START_24H, STOP_24H, SAT, [])
+
+
+class TestFindCatalogPasses:
+    """Tests for find_catalog_passes."""
+
+    CATALOG = TLEArray(read_tle("tests/thistle/data/leo.tle")[::300])
+    START = np.datetime64("2025-02-01T00:00:00", "us")
+    STOP = np.datetime64("2025-02-01T12:00:00", "us")
+
+    def test_matches_find_passes(self):
+        result = find_catalog_passes(
+            self.START, self.STOP, self.CATALOG, BOULDER_LAT, BOULDER_LON, 1655.0
+        )
+        assert len(result) > 0
+        for i, tle in enumerate(self.CATALOG):
+            sat = EarthSatellite(*tle, ts=ts)
+            expected = find_passes(
+                self.START, self.STOP, sat, BOULDER_LAT, BOULDER_LON, 1655.0
+            )
+            found = result[result["index"] == i]
+            assert len(found) == len(expected)
+            assert np.all(found["satnum"] == self.CATALOG.satnum[i])
+            for row, p in zip(found, expected):
+                assert row["start"] == p["start"]
+                assert row["stop"] == p["stop"]
+                assert row["peak_time"] == p["peak_time"]
+                assert row["peak_elevation"] == pytest.approx(p["peak_elevation"])
+
+    def test_sorted_by_start(self):
+        result = find_catalog_passes(self.START, self.STOP, self.CATALOG, 0.0, 0.0)
+        assert np.all(np.diff(result["start"]) >= np.timedelta64(0, "us"))
+
+    def test_earth_satellites(self):
+        sats = [EarthSatellite(*tle, ts=ts) for tle in self.CATALOG]
+        expected = find_catalog_passes(self.START, self.STOP, self.CATALOG, 0.0, 0.0)
+        result = find_catalog_passes(self.START, self.STOP, sats, 0.0, 0.0)
+        np.testing.assert_array_equal(result, expected)
+
+    def test_unreachable_orbits_skipped(self):
+        """Low-inclination orbits never rise over a polar site."""
+        low = self.CATALOG[np.flatnonzero(self.CATALOG.inc < 60.0)]
+        assert len(low) > 0
+        result = find_catalog_passes(self.START, self.STOP, low, 85.0, 0.0)
+        assert len(result) == 0
+        assert result.dtype.names == (
+            "index",
+            "satnum",
+            "start",
+            "stop",
+            "peak_time",
+            "peak_elevation",
+        )
+
+    def test_start_equals_stop_raises(self):
+        with pytest.raises(ValueError):
+            find_catalog_passes(self.START, self.START, self.CATALOG, 0.0, 0.0)
+
+
 class TestFindNodeCrossings:
     """Tests for find_node_crossings."""
 
@@ -479,3 +725,145 @@ class TestMultiTLEPropagator:
         assert len(crossings) > 100
         for i in range(len(crossings) - 1):
             assert crossings[i]["start"] < crossings[i + 1]["start"]
+
+
+PARALLEL_STOP = np.datetime64("1998-11-23T00:00:00", "us")
+MS = np.timedelta64(1, "ms")
+
+
+@pytest.fixture(scope="module", params=[SAT, PROP_MULTI], ids=["sat", "prop"])
+def results(request):
+    """Serial and parallel find_events over a three-day window."""
+    kinds: list[EventKind] = [
+        "passes", "node_crossings", "sunlit", "eclipse", "ascending"
+    ]
+    sites = [(BOULDER_LAT, BOULDER_LON, 1655.0), (0.0, 0.0, 0.0)]
+    args = (START_24H, PARALLEL_STOP, request.param, kinds, sites)
+    return find_events(*args), find_events(*args, workers=2)
+
+
+class TestParallel:
+    """workers > 1 splits long windows across processes."""
+
+    @pytest.mark.parametrize("kind", ["sunlit", "eclipse", "ascending"])
+    def test_periods_match_serial(self, results, kind):
+        serial, parallel = results
+        assert parallel[kind] == serial[kind]
+
+    @pytest.mark.parametrize("kind", ["passes_0", "passes_1", "node_crossings"])
+    def test_events_match_serial(self, results, kind):
+        serial, parallel = results
+        assert len(parallel[kind]) == len(serial[kind]) > 0
+        for a, b in zip(serial[kind], parallel[kind]):
+            assert abs(a["start"] - b["start"]) <= MS
+            assert abs(a["stop"] - b["stop"]) <= MS
+
+    def test_wrapper_workers(self):
+        serial = find_sunlit_periods(START_24H, PARALLEL_STOP, SAT)
+        assert find_sunlit_periods(START_24H, PARALLEL_STOP, SAT, workers=2) == serial
+
+    def test_short_window_runs_serially(self):
+        serial = find_passes(START_24H, STOP_24H, SAT, BOULDER_LAT, BOULDER_LON)
+        parallel = find_passes(
+            START_24H, STOP_24H, SAT, BOULDER_LAT, BOULDER_LON, workers=4
+        )
+        assert parallel == serial
+
+    @pytest.mark.parametrize("workers", [0, -1])
+    def test_invalid_workers_raises(self, workers):
+        with pytest.raises(ValueError, match="workers"):
+            find_sunlit_periods(START_24H, STOP_24H, SAT, workers=workers)
+
+    def test_catalog_matches_serial(self):
+        catalog = TestFindCatalogPasses.CATALOG
+        args = (
+            TestFindCatalogPasses.START,
+            TestFindCatalogPasses.STOP,
+            catalog,
+            BOULDER_LAT,
+            BOULDER_LON,
+        )
+        expected = find_catalog_passes(*args)
+        np.testing.assert_array_equal(find_catalog_passes(*args, workers=2), expected)
+
+    def test_merge_periods(self):
+        t = START_24H + np.arange(4) * np.timedelta64(1, "h")
+        periods = [{"start": t[0], "stop": t[1]}, {"start": t[1], "stop": t[2]}]
+        assert _merge_periods(periods) == [{"start": t[0], "stop": t[2]}]
+        periods = [{"start": t[0], "stop": t[1]}, {"start": t[2], "stop": t[3]}]
+        assert _merge_periods(periods) == periods
+
+    def test_merge_passes(self):
+        t = START_24H + np.arange(4) * np.timedelta64(1, "m")
+        first = {"start": t[0], "stop": t[2], "peak_time": t[1], "peak_elevation": 30}
+        second = {"start": t[1], "stop": t[3], "peak_time": t[2], "peak_elevation": 40}
+        assert _merge_passes([first, second]) == [
+            {"start": t[0], "stop": t[3], "peak_time": t[2], "peak_elevation": 40}
+        ]
+
+
+# Each TLE limited to three hours around its epoch: the window holds two
+# covered intervals separated by a 22-hour gap.
+PROP_MAX_AGE = Propagator(_tles, method="midpoint", max_age=3 * 3600)
+MAX_AGE_STOP = np.datetime64("1998-11-21T12:00:00", "us")
+MAX_AGE_KINDS: list[EventKind] = ["passes", "node_crossings", "sunlit", "ascending"]
+MAX_AGE_SITES = [(BOULDER_LAT, BOULDER_LON), (0.0, 0.0)]
+
+
+@pytest.fixture(scope="module")
+def max_age_events():
+    """Serial find_events over both covered intervals and the gap between."""
+    return find_events(
+        START_24H, MAX_AGE_STOP, PROP_MAX_AGE, MAX_AGE_KINDS, MAX_AGE_SITES
+    )
+
+
+class TestPropagatorMaxAge:
+    """Event searches stay inside the coverage of a max_age Propagator."""
+
+    def test_events_inside_coverage(self, max_age_events):
+        assert len(max_age_events["passes_1"]) > 0
+        for key, found in max_age_events.items():
+            times = np.array(
+                [t for e in found for t in (e["start"], e["stop"])],
+                dtype="datetime64[us]",
+            )
+            assert PROP_MAX_AGE.covered(times).all(), key
+
+    def test_periods_clipped_at_gaps(self, max_age_events):
+        gaps = PROP_MAX_AGE.gaps()
+        for key in ("sunlit", "ascending", "passes_0", "passes_1"):
+            for p in max_age_events[key]:
+                spans = (gaps[:, 0] < p["stop"]) & (gaps[:, 1] > p["start"])
+                assert not spans.any(), key
+
+    def test_crossings_match_unlimited(self, max_age_events):
+        """Crossings are the unlimited ones in covered time, none at the edges."""
+        crossings = max_age_events["node_crossings"]
+        assert len(crossings) > 0
+        assert not np.isnan([c["longitude"] for c in crossings]).any()
+        unlimited = find_node_crossings(
+            START_24H, MAX_AGE_STOP, Propagator(_tles, method="midpoint")
+        )
+        expected = [c for c in unlimited if PROP_MAX_AGE.covered(c["start"])]
+        assert len(crossings) == len(expected)
+        for a, b in zip(crossings, expected):
+            assert abs(a["start"] - b["start"]) <= np.timedelta64(1, "ms")
+            assert a["ascending"] == b["ascending"]
+
+    def test_parallel_matches_serial(self, max_age_events):
+        args = (START_24H, MAX_AGE_STOP, PROP_MAX_AGE, MAX_AGE_KINDS, MAX_AGE_SITES)
+        assert find_events(*args, workers=2) == max_age_events
+
+    def test_window_in_gap(self):
+        start = np.datetime64("1998-11-20T12:00:00", "us")
+        stop = np.datetime64("1998-11-21T00:00:00", "us")
+        assert not PROP_MAX_AGE.covered(np.array([start, stop])).any()
+        events = find_events(start, stop, PROP_MAX_AGE, MAX_AGE_KINDS, MAX_AGE_SITES)
+        assert events == {
+            "node_crossings": [],
+            "sunlit": [],
+            "ascending": [],
+            "passes_0": [],
+            "passes_1": [],
+        }
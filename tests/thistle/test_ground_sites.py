@@ -248,6 +248,50 @@ class TestGenerateRangePropagator:
             r_prop["range_rate_0"], r_sat["range_rate_0"], rtol=1e-10
         )
 
+    def test_propagator_segments_match_per_satellite(self):
+        """Each TLE segment's values equal that satellite's own results."""
+        prop = Propagator(_tles, method="epoch")
+        times = prop.switcher.transitions[1] + np.arange(
+            -1800, 1800, 60, dtype="timedelta64[s]"
+        )
+        result = generate_range(times, prop, sites=[(SITE_LAT, SITE_LON)])
+        for t_slice, sat in prop.segment_times(times):
+            expected = generate_range(t_slice, sat, sites=[(SITE_LAT, SITE_LON)])
+            mask = np.isin(times, t_slice)
+            np.testing.assert_array_equal(result["range_0"][mask], expected["range_0"])
+            np.testing.assert_array_equal(
+                result["range_rate_0"][mask], expected["range_rate_0"]
+            )
+
+    def test_propagator_unsorted_times(self):
+        prop = Propagator(_tles, method="epoch")
+        times = prop.switcher.transitions[1] + np.arange(
+            -1800, 1800, 60, dtype="timedelta64[s]"
+        )
+        forward = generate_range(times, prop, sites=[(SITE_LAT, SITE_LON)])
+        backward = generate_range(times[::-1], prop, sites=[(SITE_LAT, SITE_LON)])
+        np.testing.assert_array_equal(backward["range_0"], forward["range_0"][::-1])
+
+    def test_propagator_empty_times(self):
+        prop = Propagator(_tles, method="epoch")
+        result = generate_range(TIMES[:0], prop, sites=[(SITE_LAT, SITE_LON)])
+        assert result["range_0"].shape == (0,)
+
+    def test_propagator_uncovered_is_nan(self):
+        prop = Propagator(_tles, method="epoch", max_age=1200)
+        full = Propagator(_tles, method="epoch")
+        times = prop.switcher.transitions[1] + np.arange(
+            -1800, 1800, 60, dtype="timedelta64[s]"
+        )
+        covered = prop.covered(times)
+        result = generate_range(times, prop, sites=[(SITE_LAT, SITE_LON)])
+        expected = generate_range(times, full, sites=[(SITE_LAT, SITE_LON)])
+        np.testing.assert_array_equal(
+            result["range_0"][covered], expected["range_0"][covered]
+        )
+        assert np.isnan(result["range_0"][~covered]).all()
+        assert covered.any() and not covered.all()
+
 
 # ---------- doppler_shift tests ----------
 
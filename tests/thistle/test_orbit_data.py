@@ -1,15 +1,21 @@
 """Tests for thistle.orbit_data generate_* functions."""
 
+import datetime
+
 import numpy as np
 import pytest
 from skyfield.api import EarthSatellite, load
+from skyfield.framelib import itrs
 
-from thistle.utils import read_tle
+from thistle._core import TimeGrid
+from thistle.utils import dt64_to_time, read_tle, trange
 from thistle.ground_sites import generate_range
 from thistle.orbit_data import (
     GENERATORS,
     generate,
     generate_beta_angle,
+    generate_iter,
+    generate_many,
     generate_ecef,
     generate_eci,
     generate_equinoctial,
@@ -544,6 +550,338 @@ class TestGenerateWithSites:
         assert not any(k.startswith("range") for k in result)
 
 
+# ---------------------------------------------------------------------------
+# Extraction context
+# ---------------------------------------------------------------------------
+class TestExtractionContext:
+    """Intermediates are computed once per generate() call."""
+
+    def test_sun_ephemeris_evaluated_once(self, monkeypatch):
+        from thistle import _core
+
+        calls = []
+        prop = _core.TimeGrid.__dict__["sun_position_km"]
+        original = prop.func
+
+        def counting(self):
+            calls.append(1)
+            return original(self)
+
+        monkeypatch.setattr(prop, "func", counting)
+        generate(TIMES, SAT, ["sunlight", "beta"])
+        assert len(calls) == 1
+
+    def test_shared_subpoint_matches_standalone(self):
+        combined = generate(TIMES, SAT, ["lla", "lst", "mag_ecef"])
+        np.testing.assert_allclose(
+            combined["lat"], generate_lla(TIMES, SAT)["lat"], rtol=1e-6
+        )
+        np.testing.assert_allclose(
+            combined["lst"], generate_local_solar_time(TIMES, SAT)["lst"], rtol=1e-6
+        )
+        np.testing.assert_allclose(
+            combined["Bx"], generate_magnetic_field_ecef(TIMES, SAT)["Bx"], rtol=1e-6
+        )
+
+
+# ---------------------------------------------------------------------------
+# generate() with interpolated Sun and Earth-orientation tables
+# ---------------------------------------------------------------------------
+class TestGenerateInterpolated:
+    """Tests for generate(..., interpolate=True)."""
+
+    TIMES = T0 + np.arange(0, 2 * 24 * 60 * 60, 30, dtype="timedelta64[s]")
+    GROUPS = ["eci", "ecef", "lla", "sunlight", "beta", "lst"]
+
+    def test_matches_exact(self):
+        exact = generate(self.TIMES, SAT, self.GROUPS)
+        fast = generate(self.TIMES, SAT, self.GROUPS, interpolate=True)
+        for key in ("eci_x", "eci_y", "eci_z", "ecef_x", "ecef_y", "ecef_z"):
+            np.testing.assert_allclose(fast[key], exact[key], atol=1e-3)
+        np.testing.assert_allclose(fast["beta"], exact["beta"], atol=1e-5)
+        np.testing.assert_allclose(fast["lst"], exact["lst"], atol=1e-5)
+        np.testing.assert_array_equal(fast["sun"], exact["sun"])
+
+    def test_short_grid_is_exact(self):
+        """Grids with fewer samples than interpolation nodes are exact."""
+        exact = generate(TIMES[:3], SAT, ["ecef", "beta"])
+        fast = generate(TIMES[:3], SAT, ["ecef", "beta"], interpolate=True)
+        for key in ("ecef_x", "beta"):
+            np.testing.assert_array_equal(fast[key], exact[key])
+
+    def test_propagator(self):
+        prop = Propagator(_tles[:3], method="midpoint")
+        exact = generate(self.TIMES, prop, ["ecef"])
+        fast = generate(self.TIMES, prop, ["ecef"], interpolate=True)
+        np.testing.assert_allclose(fast["ecef_x"], exact["ecef_x"], atol=1e-3)
+
+    def test_time_left_exact(self):
+        """The interpolated tables stay on the grid, not on the Skyfield Time."""
+        t = dt64_to_time(self.TIMES, ts)
+        grid = TimeGrid(t, interpolate=True)
+        assert grid.interpolate
+        rotation = grid.itrs_rotation
+        assert "_nutation_angles_radians" not in vars(t)
+        np.testing.assert_allclose(rotation, itrs.rotation_at(t), atol=1e-14)
+
+
+# ---------------------------------------------------------------------------
+# generate_iter()
+# ---------------------------------------------------------------------------
+class TestGenerateIter:
+    """Tests for generate_iter()."""
+
+    START = datetime.datetime(1998, 11, 20, 6, 50)
+    STOP = datetime.datetime(1998, 11, 22, 6, 50)
+    STEP = 90.0
+
+    def test_chunks_concatenate_to_generate(self):
+        prop = Propagator(_tles[:3], method="midpoint")
+        groups = ["eci", "lla", "mag_total"]
+        chunks = list(
+            generate_iter(self.START, self.STOP, self.STEP, prop, groups, chunk=500)
+        )
+        assert [len(c["times"]) for c in chunks] == [500, 500, 500, 420]
+
+        times = trange(self.START, self.STOP, self.STEP)
+        expected = generate(times, prop, groups)
+        for key in expected:
+            np.testing.assert_array_equal(
+                np.concatenate([c[key] for c in chunks]), expected[key], key
+            )
+
+    def test_empty_range(self):
+        assert list(generate_iter(self.STOP, self.START, 60.0, SAT, ["eci"])) == []
+
+    def test_datetime64_bounds(self):
+        chunks = list(
+            generate_iter(T0, T0 + np.timedelta64(10, "m"), 60.0, SAT, ["eci"], chunk=4)
+        )
+        times = np.concatenate([c["times"] for c in chunks])
+        np.testing.assert_array_equal(times, TIMES[:10])
+
+    def test_invalid_step_raises(self):
+        with pytest.raises(ValueError, match="step"):
+            next(generate_iter(self.START, self.STOP, 0.0, SAT, ["eci"]))
+
+
+# ---------------------------------------------------------------------------
+# generate() with the raw SGP4 backend
+# ---------------------------------------------------------------------------
+class TestGenerateRawBackend:
+    """Tests for generate(..., backend="raw")."""
+
+    def test_keys_match_skyfield_backend(self):
+        raw = generate(TIMES, SAT, ["eci", "ecef", "lla"], backend="raw")
+        sky = generate(TIMES, SAT, ["eci", "ecef", "lla"])
+        assert set(raw) == set(sky)
+        for key in raw:
+            assert raw[key].shape == (N,), f"{key} shape mismatch"
+            assert raw[key].dtype == sky[key].dtype, f"{key} dtype mismatch"
+
+    def test_eci_matches_skyfield_at_utc(self):
+        """Raw runs SGP4 at true UTC; Skyfield agrees to the millimetre."""
+        raw = generate(TIMES, SAT, ["eci"], backend="raw")
+        utc = datetime.timezone.utc
+        t = ts.from_datetimes([d.replace(tzinfo=utc) for d in TIMES.tolist()])
+        pos = np.asarray(SAT.at(t).position.m)
+        np.testing.assert_allclose(raw["eci_x"], pos[0], atol=0.01)
+        np.testing.assert_allclose(raw["eci_y"], pos[1], atol=0.01)
+        np.testing.assert_allclose(raw["eci_z"], pos[2], atol=0.01)
+
+    def test_close_to_skyfield_backend(self):
+        """The backends differ only by DUT1 (< 0.9 s) of motion."""
+        raw = generate(TIMES, SAT, ["ecef", "lla"], backend="raw")
+        sky = generate(TIMES, SAT, ["ecef", "lla"])
+        for key in ("ecef_x", "ecef_y", "ecef_z"):
+            np.testing.assert_allclose(raw[key], sky[key], atol=7_000.0)
+        np.testing.assert_allclose(raw["lat"], sky["lat"], atol=0.1)
+        np.testing.assert_allclose(raw["alt"], sky["alt"], atol=100.0)
+
+    def test_sites(self):
+        raw = generate(TIMES, SAT, [], sites=[(SITE_LAT, SITE_LON)], backend="raw")
+        sky = generate(TIMES, SAT, [], sites=[(SITE_LAT, SITE_LON)])
+        np.testing.assert_allclose(raw["range_0"], sky["range_0"], atol=7_000.0)
+        np.testing.assert_allclose(
+            raw["range_rate_0"], sky["range_rate_0"], atol=10.0
+        )
+
+    def test_propagator_matches_single_satellite(self):
+        prop = Propagator(_tles[:1], method="epoch")
+        result_prop = generate(TIMES, prop, ["eci", "lla"], backend="raw")
+        result_sat = generate(TIMES, SAT, ["eci", "lla"], backend="raw")
+        for key in ("eci_x", "eci_y", "eci_z", "lat", "lon", "alt"):
+            np.testing.assert_array_equal(result_prop[key], result_sat[key])
+
+    def test_unsupported_group_raises(self):
+        with pytest.raises(ValueError, match="raw backend"):
+            generate(TIMES, SAT, ["keplerian"], backend="raw")
+
+    def test_unknown_backend_raises(self):
+        with pytest.raises(ValueError, match="Unknown backend"):
+            generate(TIMES, SAT, ["eci"], backend="fast")  # type: ignore[arg-type]
+
+
+# ---------------------------------------------------------------------------
+# generate() with a process pool
+# ---------------------------------------------------------------------------
+class TestGenerateParallel:
+    """Tests for generate(..., workers=N)."""
+
+    def test_matches_serial_propagator(self):
+        prop = Propagator(_tles[:3], method="midpoint")
+        times = T0 + np.arange(0, 2 * 24 * 60 * 60, 600, dtype="timedelta64[s]")
+        groups = ["eci", "lla", "keplerian", "sunlight", "mag_total"]
+        sites = [(SITE_LAT, SITE_LON)]
+        serial = generate(times, prop, groups, sites=sites)
+        parallel = generate(times, prop, groups, sites=sites, workers=2)
+        assert set(parallel) == set(serial)
+        for key in serial:
+            if key == "times":
+                continue
+            assert parallel[key].dtype == serial[key].dtype, f"{key} dtype"
+            np.testing.assert_allclose(
+                parallel[key], serial[key], rtol=1e-12, err_msg=key
+            )
+
+    def test_matches_serial_interpolated(self):
+        prop = Propagator(_tles[:3], method="midpoint")
+        times = T0 + np.arange(0, 2 * 24 * 60 * 60, 60, dtype="timedelta64[s]")
+        groups = ["eci", "ecef", "beta"]
+        serial = generate(times, prop, groups, interpolate=True)
+        parallel = generate(times, prop, groups, interpolate=True, workers=2)
+        # The chunks share the serial node grid, so the tables agree exactly
+        for key in ("eci_x", "eci_y", "eci_z", "ecef_x", "ecef_y", "ecef_z"):
+            np.testing.assert_array_equal(parallel[key], serial[key], err_msg=key)
+
+    def test_matches_serial_raw_backend(self):
+        serial = generate(TIMES, SAT, ["eci", "lla"], backend="raw")
+        parallel = generate(TIMES, SAT, ["eci", "lla"], backend="raw", workers=2)
+        for key in ("eci_x", "eci_vz", "lat", "lon", "alt"):
+            np.testing.assert_allclose(parallel[key], serial[key], rtol=1e-9)
+
+    def test_invalid_workers_raises(self):
+        with pytest.raises(ValueError, match="workers"):
+            generate(TIMES, SAT, ["eci"], workers=0)
+
+
+# ---------------------------------------------------------------------------
+# generate() with a Propagator limited by max_age
+# ---------------------------------------------------------------------------
+class TestGenerateUncovered:
+    """Samples outside a Propagator's coverage are never propagated."""
+
+    GROUPS = ["eci", "lla", "sunlight", "mag_total"]
+
+    def setup_class(self):
+        self.prop = Propagator(_tles[:3], method="midpoint", max_age=6 * 3600)
+        self.full = Propagator(_tles[:3], method="midpoint")
+        self.times = T0 + np.arange(0, 2 * 24 * 60 * 60, 600, dtype="timedelta64[s]")
+        self.covered = self.prop.covered(self.times)
+        assert self.covered.any() and not self.covered.all()
+
+    def test_nan_fill(self):
+        result = generate(self.times, self.prop, self.GROUPS)
+        expected = generate(self.times, self.full, self.GROUPS)
+        np.testing.assert_array_equal(result["times"], self.times)
+        for key in ("eci_x", "lat", "sun"):
+            assert result[key].dtype == expected[key].dtype
+            np.testing.assert_array_equal(
+                result[key][self.covered], expected[key][self.covered]
+            )
+        assert np.isnan(result["eci_x"][~self.covered]).all()
+        assert (result["sun"][~self.covered] == -1).all()
+
+    def test_drop(self):
+        result = generate(self.times, self.prop, ["eci"], uncovered="drop")
+        np.testing.assert_array_equal(result["times"], self.times[self.covered])
+        assert not np.isnan(result["eci_x"]).any()
+
+    def test_drop_all_uncovered(self):
+        times = self.times[~self.covered][:5]
+        result = generate(times, self.prop, ["eci", "sunlight"], uncovered="drop")
+        assert all(arr.shape == (0,) for arr in result.values())
+
+    def test_generate_iter_drop(self):
+        start, stop = self.times[0], self.times[-1] + np.timedelta64(600, "s")
+        chunks = list(
+            generate_iter(
+                start, stop, 600.0, self.prop, ["eci"], chunk=50, uncovered="drop"
+            )
+        )
+        expected = generate(self.times, self.prop, ["eci"], uncovered="drop")
+        for key in expected:
+            np.testing.assert_array_equal(
+                np.concatenate([c[key] for c in chunks]), expected[key], key
+            )
+
+    def test_raw_backend(self):
+        result = generate(self.times, self.prop, ["eci"], backend="raw")
+        expected = generate(self.times, self.full, ["eci"], backend="raw")
+        covered = self.covered
+        np.testing.assert_allclose(
+            result["eci_x"][covered], expected["eci_x"][covered], rtol=1e-9
+        )
+        assert np.isnan(result["eci_x"][~covered]).all()
+
+    def test_generate_many(self):
+        many = generate_many(self.times, [self.prop], ["eci", "sunlight"])
+        single = generate(self.times, self.prop, ["eci", "sunlight"])
+        np.testing.assert_array_equal(many["eci_x"][0], single["eci_x"])
+        np.testing.assert_array_equal(many["sun"][0], single["sun"])
+
+    def test_unknown_mode_raises(self):
+        with pytest.raises(ValueError, match="uncovered"):
+            generate(TIMES, SAT, ["eci"], uncovered="zero")  # type: ignore[arg-type]
+
+
+# ---------------------------------------------------------------------------
+# generate_many()
+# ---------------------------------------------------------------------------
+class TestGenerateMany:
+    """Tests for generate_many()."""
+
+    SATS = [EarthSatellite(a, b, ts=ts) for a, b in _tles[:3]]
+    GROUPS = ["eci", "ecef", "lla", "sunlight", "beta", "lst", "mag_total"]
+
+    def test_wide_shapes(self):
+        result = generate_many(TIMES, self.SATS, self.GROUPS)
+        assert result["times"].shape == (N,)
+        for key, arr in result.items():
+            if key != "times":
+                assert arr.shape == (3, N), f"{key} shape mismatch"
+
+    def test_matches_generate(self):
+        sites = [(SITE_LAT, SITE_LON)]
+        result = generate_many(TIMES, self.SATS, self.GROUPS, sites=sites)
+        for i, sat in enumerate(self.SATS):
+            single = generate(TIMES, sat, self.GROUPS, sites=sites)
+            for key in single:
+                if key == "times":
+                    continue
+                assert result[key].dtype == single[key].dtype, f"{key} dtype"
+                np.testing.assert_array_equal(result[key][i], single[key], key)
+
+    def test_propagator(self):
+        prop = Propagator(_tles[:3], method="midpoint")
+        times = T0 + np.arange(0, 2 * 24 * 60 * 60, 600, dtype="timedelta64[s]")
+        result = generate_many(times, [prop, self.SATS[0]], ["eci"])
+        single = generate(times, prop, ["eci"])
+        np.testing.assert_array_equal(result["eci_x"][0], single["eci_x"])
+
+    def test_long_layout(self):
+        wide = generate_many(TIMES, self.SATS, ["eci"])
+        long = generate_many(TIMES, self.SATS, ["eci"], layout="long")
+        assert long["eci_x"].shape == (3 * N,)
+        np.testing.assert_array_equal(long["times"][N : 2 * N], TIMES)
+        np.testing.assert_array_equal(long["object"], np.repeat([0, 1, 2], N))
+        np.testing.assert_array_equal(long["eci_x"], wide["eci_x"].ravel())
+
+    def test_unknown_layout_raises(self):
+        with pytest.raises(ValueError, match="Unknown layout"):
+            generate_many(TIMES, self.SATS, ["eci"], layout="tall")  # type: ignore[arg-type]
+
+
 # ---------------------------------------------------------------------------
 # generate() with various datetime64 resolutions
 # ---------------------------------------------------------------------------
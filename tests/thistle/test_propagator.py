@@ -9,13 +9,17 @@ from sgp4.api import Satrec
 from sgp4.exporter import export_tle
 from skyfield.api import EarthSatellite, load
 
+from thistle._core import sgp4_segments, sgp4_time
 from thistle.propagator import (
+    BlendSwitchStrategy,
     EpochSwitchStrategy,
     MidpointSwitchStrategy,
     Propagator,
+    SatelliteList,
     SwitchingStrategy,
     TCASwitchStrategy,
     _find_tca,
+    _find_tcas,
     _slices_by_transitions,
 )
 from thistle.utils import (
@@ -25,6 +29,7 @@ from thistle.utils import (
     dt64_to_datetime,
     pairwise,
     read_tle,
+    time_to_dt64,
     trange,
 )
 
@@ -46,6 +51,33 @@ def test_slices(
         assert (times[slc_] < transitions[idx + 1]).all()
 
 
+@given(cst.transitions(), cst.times(max_size=30))
+def test_slices_match_bins(
+    transitions: npt.NDArray[np.datetime64], times: npt.NDArray[np.datetime64]
+):
+    """Sorted and shuffled times land in the same bins as a direct search."""
+    bins = np.searchsorted(transitions, times, side="right") - 1
+    for order in (np.arange(len(times)), np.arange(len(times))[::-1]):
+        shuffled = times[order]
+        assigned = np.full(len(times), -1)
+        for idx, index in _slices_by_transitions(transitions, shuffled):
+            assigned[index] = idx
+        np.testing.assert_array_equal(assigned, bins[order])
+
+
+def test_slices_sorted_are_contiguous():
+    transitions = np.array(
+        [DATETIME64_MIN, "2024-01-02", "2024-01-04", DATETIME64_MAX],
+        dtype="datetime64[us]",
+    )
+    times = np.arange(
+        np.datetime64("2024-01-01"), np.datetime64("2024-01-06"), np.timedelta64(1, "D")
+    )
+    slices = _slices_by_transitions(transitions, times)
+    assert slices == [(0, slice(0, 1)), (1, slice(1, 3)), (2, slice(3, 5))]
+    assert _slices_by_transitions(transitions, times[:0]) == []
+
+
 @given(cst.satrec_lists())
 def test_midpoint_switcher(satrec_list: list[Satrec]) -> None:
     ts = load.timescale()
@@ -289,7 +321,7 @@ class TestFindTCA:
         epoch_a = sat_a.epoch.utc_datetime().replace(tzinfo=None)
         epoch_b = sat_b.epoch.utc_datetime().replace(tzinfo=None)
 
-        tca = _find_tca(sat_a, sat_b, self.ts)
+        tca = _find_tca(sat_a, sat_b)
 
         assert epoch_a <= tca
         assert tca <= epoch_b
@@ -303,7 +335,7 @@ class TestFindTCA:
         sat_b = EarthSatellite(a1, a2, ts=self.ts)
         epoch_a = sat_a.epoch.utc_datetime().replace(tzinfo=None)
 
-        tca = _find_tca(sat_a, sat_b, self.ts)
+        tca = _find_tca(sat_a, sat_b)
 
         # Allow for floating-point precision (within 1 millisecond)
         assert abs((tca - epoch_a).total_seconds()) < 0.001
@@ -320,7 +352,7 @@ class TestFindTCA:
         epoch_a = sat_a.epoch.utc_datetime().replace(tzinfo=None)
         epoch_b = sat_b.epoch.utc_datetime().replace(tzinfo=None)
 
-        tca = _find_tca(sat_a, sat_b, self.ts)
+        tca = _find_tca(sat_a, sat_b)
 
         def distance_at(dt):
             t = self.ts.from_datetimes([dt.replace(tzinfo=UTC)])
@@ -337,6 +369,65 @@ class TestFindTCA:
         assert d_tca <= d_b
 
 
+class TestFindTCAs:
+    LINES = [
+        (
+            "1 25544U 98067A   98324.28472222 -.00003657  11563-4  00000+0 0  9996",
+            "2 25544 051.5908 168.3788 0125362 086.4185 359.7454 16.05064833    05",
+        ),
+        (
+            "1 25544U 98067A   98325.45376114  .01829530  18113-2  41610-2 0  9996",
+            "2 25544 051.5938 162.0926 0074012 097.3081 262.5015 15.92299093   191",
+        ),
+        (
+            "1 25544U 98067A   98325.51671211  .01832406  18178-2  41610-2 0  9996",
+            "2 25544 051.5928 161.7497 0074408 097.6565 263.2450 15.92278419   200",
+        ),
+    ]
+
+    def setup_class(self):
+        self.satrecs = [Satrec.twoline2rv(a, b) for a, b in self.LINES]
+
+    def separation(self, sat_a, sat_b, times):
+        seconds = (times - np.datetime64("1970-01-01")) / np.timedelta64(1, "s")
+        jd = np.full(len(times), 2440587.5)
+        fr = seconds / 86400.0
+        _, r_a, _ = sat_a.sgp4_array(jd, fr)
+        _, r_b, _ = sat_b.sgp4_array(jd, fr)
+        return np.linalg.norm(r_b - r_a, axis=1)
+
+    def test_matches_pairwise(self):
+        """The batched search gives each pair the same TCA as alone."""
+        batched = _find_tcas(self.satrecs)
+        for idx, (sat_a, sat_b) in enumerate(pairwise(self.satrecs)):
+            alone = _find_tcas([sat_a, sat_b])
+            assert abs(batched[idx] - alone[0]) <= np.timedelta64(1, "us")
+
+    def test_local_minimum(self):
+        """The separation at each TCA is no larger than 10 ms either side."""
+        tcas = _find_tcas(self.satrecs)
+        offsets = np.array([-10_000, 0, 10_000]).astype("timedelta64[us]")
+        for tca, (sat_a, sat_b) in zip(tcas, pairwise(self.satrecs)):
+            d = self.separation(sat_a, sat_b, tca + offsets)
+            assert d[1] <= d[0] + 1e-9
+            assert d[1] <= d[2] + 1e-9
+
+    def test_finer_than_grid(self):
+        """Refinement beats the best sample of a 1 s grid over the window."""
+        sat_a, sat_b = self.satrecs[1], self.satrecs[2]
+        tca = _find_tcas([sat_a, sat_b])[0]
+        start = np.datetime64(
+            int(round((sat_a.jdsatepoch - 2440587.5 + sat_a.jdsatepochF) * 86400)), "s"
+        )
+        grid = start + np.arange(0, 5440).astype("timedelta64[s]")
+        d_grid = self.separation(sat_a, sat_b, grid)
+        d_tca = self.separation(sat_a, sat_b, np.array([tca]))[0]
+        assert d_tca <= d_grid.min() + 1e-9
+
+    def test_single_satellite(self):
+        assert len(_find_tcas(self.satrecs[:1])) == 0
+
+
 class TestTCASwitchStrategy(SwitchStrategyBasic):
     class_ = TCASwitchStrategy
 
@@ -352,6 +443,14 @@ class TestTCASwitchStrategy(SwitchStrategyBasic):
         # One transition per satrec, plus one after
         assert len(self.switcher.transitions) == 20 + 1
 
+    def test_fine_step_deprecated(self):
+        """The old fine_step argument warns and leaves tolerance unchanged."""
+        with pytest.warns(DeprecationWarning, match="fine_step"):
+            positional = TCASwitchStrategy([], self.ts, 60.0, 5.0)
+        with pytest.warns(DeprecationWarning, match="fine_step"):
+            keyword = TCASwitchStrategy([], ts=self.ts, fine_step=5.0)
+        assert positional.tolerance == keyword.tolerance == 1e-3
+
     def test_transitions_between_epochs(self):
         """Each TCA transition should fall between the neighboring epochs."""
         tolerance = datetime.timedelta(microseconds=10)
@@ -471,6 +570,20 @@ class TestSegmentTimes:
         assert len(segments) == 1
         assert segments[0][1] is first_sat
 
+    def test_segments_are_views(self):
+        segments = self.propagator.segment_times(self.times)
+        for t_slice, _ in segments:
+            assert np.shares_memory(t_slice, self.times)
+
+    def test_unsorted_times(self):
+        shuffled = self.times[::-1]
+        segments = self.propagator.segment_times(shuffled)
+        expected = self.propagator.segment_times(self.times)
+        assert len(segments) == len(expected)
+        for (t_slice, sat), (e_slice, e_sat) in zip(segments, expected):
+            np.testing.assert_array_equal(t_slice, e_slice)
+            assert sat is e_sat
+
     def test_empty_gaps_omitted(self):
         """Segments with no matching times are not returned."""
         segments = self.propagator.segment_times(self.times)
@@ -543,3 +656,485 @@ class TestStrategyInstance:
         """Passing an invalid type raises TypeError."""
         with pytest.raises(TypeError, match="strategy name or SwitchingStrategy"):
             Propagator(ISS_TLES, method=42)
+
+
+class TestBatchedAt:
+    """Propagator.at() evaluates all segments in one batch."""
+
+    def setup_class(self):
+        self.ts = load.timescale()
+        self.propagator = Propagator(ISS_TLES, method="midpoint")
+        first = self.propagator.satellites[0].epoch.tt
+        last = self.propagator.satellites[-1].epoch.tt
+        self.tt = self.ts.tt_jd(np.linspace(first - 0.5, last + 0.5, 2000))
+
+    def test_matches_per_segment_propagation(self):
+        """Results are bit-identical to calling EarthSatellite.at() per segment."""
+        times = time_to_dt64(self.tt)
+        geo = self.propagator.at(self.tt)
+        pos = np.asarray(geo.xyz.au)
+        vel = np.asarray(geo.velocity.au_per_d)
+        for idx, index in _slices_by_transitions(
+            self.propagator.switcher.transitions, times
+        ):
+            exp_geo = self.propagator.satellites[idx].at(self.tt[index])
+            np.testing.assert_array_equal(pos[:, index], exp_geo.xyz.au)
+            np.testing.assert_array_equal(vel[:, index], exp_geo.velocity.au_per_d)
+
+    def test_slices_match_index_arrays(self):
+        """Slice segments equal index-array segments."""
+        times = time_to_dt64(self.tt)
+        jd, fr = sgp4_time(self.tt)
+        slices = _slices_by_transitions(self.propagator.switcher.transitions, times)
+        satrec = self.propagator.satellites.satrec
+        positions = np.arange(len(times))
+        r, v = sgp4_segments(((satrec(idx), index) for idx, index in slices), jd, fr)
+        r_idx, v_idx = sgp4_segments(
+            ((satrec(idx), positions[index]) for idx, index in slices), jd, fr
+        )
+        np.testing.assert_array_equal(r, r_idx)
+        np.testing.assert_array_equal(v, v_idx)
+
+    def test_sgp4_errors_are_nan(self):
+        """Samples SGP4 flags as errors come back NaN, like uncovered ones."""
+        decaying = Satrec.twoline2rv(
+            "1 25544U 98067A   08264.51782528 -.00002182  00000-0  11606-1 0  2927",
+            "2 25544  51.6416 247.4627 0006703 130.5360 325.0288 15.72125391563537",
+        )
+        jd = decaying.jdsatepoch + np.array([0.0, 300.0, 2000.0])
+        fr = np.zeros(3)
+        error, _, _ = decaying.sgp4_array(jd, fr)
+        r, v = sgp4_segments([(decaying, slice(0, 2))], jd, fr)
+        assert error.tolist()[:2] == [0, 1]
+        assert np.isfinite(r[:, 0]).all() and np.isfinite(v[:, 0]).all()
+        assert np.isnan(r[:, 1:]).all() and np.isnan(v[:, 1:]).all()
+
+    def test_scalar_time(self):
+        t = self.tt[10]
+        pos = np.asarray(self.propagator.at(t).xyz.au)
+        assert pos.shape == (3,)
+        np.testing.assert_array_equal(
+            pos, np.asarray(self.propagator.at(self.tt).xyz.au)[:, 10]
+        )
+
+
+class TestBlendSwitchStrategy:
+    """BlendSwitchStrategy cross-fades states around midpoint transitions."""
+
+    def setup_class(self):
+        self.tles = read_tle("tests/thistle/data/obj/50001.txt")[:40]
+        self.blend = Propagator(self.tles, method="blend")
+        self.hard = Propagator(self.tles, method="midpoint")
+        self.edges = self.blend.switcher.transitions[1:-1]
+
+    def test_transitions_are_midpoints(self):
+        np.testing.assert_array_equal(
+            self.blend.switcher.transitions, self.hard.switcher.transitions
+        )
+        assert self.blend.switcher.cache_token() == "midpoint"
+
+    def test_matches_midpoint_outside_windows(self):
+        start, stop = self.edges[0], self.edges[-1]
+        times = np.arange(start, stop, np.timedelta64(97, "s"))
+        switcher = self.blend.switcher
+        assert isinstance(switcher, BlendSwitchStrategy)
+        half = switcher.window / 2
+        gap = np.abs((times[:, None] - self.edges[None, :]) / np.timedelta64(1, "s"))
+        outside = gap.min(axis=1) > half
+        assert outside.any() and not outside.all()
+        r, v = self.blend.propagate_teme(times)
+        r_hard, v_hard = self.hard.propagate_teme(times)
+        np.testing.assert_array_equal(r[:, outside], r_hard[:, outside])
+        np.testing.assert_array_equal(v[:, outside], v_hard[:, outside])
+        assert not np.array_equal(r[:, ~outside], r_hard[:, ~outside])
+
+    def test_continuous_at_transition(self):
+        step = np.timedelta64(1, "ms")
+        for edge in self.edges[::5]:
+            times = np.array([edge - step, edge])
+            r, _ = self.blend.propagate_teme(times)
+            r_hard, _ = self.hard.propagate_teme(times)
+            jump = np.linalg.norm(np.diff(r, axis=1))
+            hard_jump = np.linalg.norm(np.diff(r_hard, axis=1))
+            assert jump < 0.05
+            assert jump <= hard_jump
+
+    def test_velocity_is_derivative(self):
+        """Blended velocity tracks d/dt of blended position as SGP4's does."""
+        offsets = np.arange(-280, 280, 23) * 1_000_000
+        step = np.timedelta64(10_000, "us")
+
+        def derivative_error(prop, times):
+            r_lo, _ = prop.propagate_teme(times - step)
+            r_hi, _ = prop.propagate_teme(times + step)
+            _, v = prop.propagate_teme(times)
+            return np.abs(v - (r_hi - r_lo) / 0.02).max()
+
+        for edge in self.edges[::7]:
+            times = edge + offsets.astype("timedelta64[us]")
+            blend_error = derivative_error(self.blend, times)
+            hard_error = derivative_error(self.hard, times - np.timedelta64(1, "h"))
+            assert blend_error < 2 * hard_error + 1e-5
+
+    def test_window_shrinks_for_close_tles(self):
+        switcher = BlendSwitchStrategy(self.blend.satellites, window=1e9)
+        switcher.compute_transitions()
+        prop = Propagator(self.tles, method=switcher)
+        gaps = np.diff(self.edges) / np.timedelta64(1, "s")
+        times = self.edges[1:] - (gaps / 2 * 1e6).astype("timedelta64[us]")
+        r, _ = prop.propagate_teme(times)
+        r_hard, _ = self.hard.propagate_teme(times)
+        np.testing.assert_array_equal(r, r_hard)
+
+    def test_zero_window(self):
+        switcher = BlendSwitchStrategy(self.blend.satellites, window=0.0)
+        prop = Propagator(self.tles, method=switcher)
+        times = self.edges[:5]
+        np.testing.assert_array_equal(
+            prop.propagate_teme(times)[0], self.hard.propagate_teme(times)[0]
+        )
+
+    def test_unsorted_times(self):
+        times = self.edges[:6] + np.timedelta64(30, "s")
+        order = np.array([4, 0, 5, 2, 1, 3])
+        r, v = self.blend.propagate_teme(times)
+        r_unsorted, v_unsorted = self.blend.propagate_teme(times[order])
+        np.testing.assert_array_equal(r_unsorted, r[:, order])
+        np.testing.assert_array_equal(v_unsorted, v[:, order])
+
+
+class TestCoverage:
+    """Propagator(max_age=...) limits each TLE to a validity horizon."""
+
+    def setup_class(self):
+        self.tles = read_tle("tests/thistle/data/obj/50001.txt")[:40]
+        self.max_age = 12 * 3600
+        self.prop = Propagator(self.tles, method="midpoint", max_age=self.max_age)
+        self.full = Propagator(self.tles, method="midpoint")
+        epochs = self.prop.satellites.epochs
+        step = np.timedelta64(7, "m")
+        self.times = np.arange(epochs[0] - np.timedelta64(1, "D"), epochs[-1], step)
+
+    def test_no_max_age(self):
+        np.testing.assert_array_equal(
+            self.full.coverage(), [[DATETIME64_MIN, DATETIME64_MAX]]
+        )
+        assert self.full.gaps().shape == (0, 2)
+        assert self.full.gaps().dtype == self.full.coverage().dtype
+        assert self.full.covered(self.times).all()
+
+    def test_no_tle_within_max_age(self):
+        class Stale(EpochSwitchStrategy):
+            def compute_transitions(self):
+                # Every switching interval is empty, so no TLE covers any time
+                n = len(self.satellites) + 1
+                self.transitions = np.full(n, DATETIME64_MIN, dtype="datetime64[us]")
+
+        prop = Propagator(self.tles, method=Stale([]), max_age=self.max_age)
+        coverage = prop.coverage()
+        assert coverage.shape == (0, 2)
+        assert coverage.dtype == self.prop.coverage().dtype
+        np.testing.assert_array_equal(prop.gaps(), [[DATETIME64_MIN, DATETIME64_MAX]])
+        assert not prop.covered(self.times).any()
+
+    def test_query_inside_gap(self):
+        lo, hi = self.prop.gaps()[1]
+        times = np.arange(lo, hi, np.timedelta64(10, "m"))
+        assert len(times)
+        assert not self.prop.covered(times).any()
+        r, v = self.prop.propagate_teme(times)
+        assert np.isnan(r).all() and np.isnan(v).all()
+
+    def test_covered_matches_age(self):
+        idx = self.full.find_satellite_index(self.times)
+        age = np.abs(self.times - self.full.satellites.epochs[idx])
+        expected = age < np.timedelta64(self.max_age, "s")
+        covered = self.prop.covered(self.times)
+        # Samples exactly max_age before an epoch are covered, after are not
+        assert np.count_nonzero(covered != expected) <= 1
+        assert covered.any() and not covered.all()
+
+    def test_intervals(self):
+        coverage, gaps = self.prop.coverage(), self.prop.gaps()
+        assert np.all(coverage[:, 0] < coverage[:, 1])
+        assert np.all(coverage[1:, 0] > coverage[:-1, 1])
+        # Gaps and coverage alternate and tile the whole timeline
+        bounds = np.sort(np.concatenate([coverage.ravel(), gaps.ravel()]))
+        assert bounds[0] == DATETIME64_MIN and bounds[-1] == DATETIME64_MAX
+        assert len(gaps) == len(coverage) + 1
+        inside = (self.times[:, None] >= coverage[:, 0]) & (
+            self.times[:, None] < coverage[:, 1]
+        )
+        np.testing.assert_array_equal(inside.any(axis=1), self.prop.covered(self.times))
+
+    def test_propagate_teme(self):
+        covered = self.prop.covered(self.times)
+        r, v = self.prop.propagate_teme(self.times)
+        r_full, v_full = self.full.propagate_teme(self.times)
+        np.testing.assert_array_equal(r[:, covered], r_full[:, covered])
+        np.testing.assert_array_equal(v[:, covered], v_full[:, covered])
+        assert np.isnan(r[:, ~covered]).all() and np.isnan(v[:, ~covered]).all()
+
+    def test_unsorted(self):
+        order = np.random.default_rng(0).permutation(len(self.times))
+        r, _ = self.prop.propagate_teme(self.times)
+        r_unsorted, _ = self.prop.propagate_teme(self.times[order])
+        np.testing.assert_array_equal(r_unsorted, r[:, order])
+
+    def test_invalid_max_age(self):
+        with pytest.raises(ValueError, match="max_age"):
+            Propagator(self.tles, max_age=0)
+
+
+class TestTransitionCache:
+    """Propagator(cache_dir=...) reuses transitions across constructions."""
+
+    def test_second_build_reads_cache(self, tmp_path, monkeypatch):
+        first = Propagator(ISS_TLES, method="tca", cache_dir=tmp_path)
+        assert len(list(tmp_path.glob("*.npy"))) == 1
+
+        def fail(self):
+            raise AssertionError("transitions recomputed")
+
+        monkeypatch.setattr(TCASwitchStrategy, "compute_transitions", fail)
+        second = Propagator(ISS_TLES, method="tca", cache_dir=tmp_path)
+        np.testing.assert_array_equal(
+            first.switcher.transitions, second.switcher.transitions
+        )
+
+    def test_key_covers_strategy_and_tles(self, tmp_path):
+        Propagator(ISS_TLES, method="tca", cache_dir=tmp_path)
+        Propagator(ISS_TLES, method="midpoint", cache_dir=tmp_path)
+        Propagator(
+            ISS_TLES,
+            method=TCASwitchStrategy([], ts=load.timescale(), coarse_step=30.0),
+            cache_dir=tmp_path,
+        )
+        Propagator(ISS_TLES[:-1], method="tca", cache_dir=tmp_path)
+        assert len(list(tmp_path.glob("*.npy"))) == 4
+
+    def test_custom_strategy_not_cached(self, tmp_path):
+        class Custom(EpochSwitchStrategy):
+            def cache_token(self):
+                return None
+
+        Propagator(ISS_TLES, method=Custom([]), cache_dir=tmp_path)
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.parametrize(
+        "cls, kwargs",
+        [
+            (EpochSwitchStrategy, {}),
+            (MidpointSwitchStrategy, {}),
+            (TCASwitchStrategy, {"ts": load.timescale()}),
+        ],
+    )
+    def test_subclass_not_cached(self, cls, kwargs, tmp_path):
+        class Custom(cls):
+            pass
+
+        strategy = Custom([], **kwargs)
+        assert strategy.cache_token() is None
+        Propagator(ISS_TLES, method=strategy, cache_dir=tmp_path)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_key_covers_cache_version(self, tmp_path, monkeypatch):
+        Propagator(ISS_TLES, method="midpoint", cache_dir=tmp_path)
+        monkeypatch.setattr("thistle.propagator._CACHE_VERSION", -1)
+        Propagator(ISS_TLES, method="midpoint", cache_dir=tmp_path)
+        assert len(list(tmp_path.glob("*.npy"))) == 2
+
+    def test_corrupt_entry_recomputed(self, tmp_path):
+        expected = Propagator(ISS_TLES, method="midpoint", cache_dir=tmp_path)
+        (path,) = tmp_path.glob("*.npy")
+        path.write_bytes(b"not an array")
+        prop = Propagator(ISS_TLES, method="midpoint", cache_dir=tmp_path)
+        np.testing.assert_array_equal(
+            prop.switcher.transitions, expected.switcher.transitions
+        )
+
+    def test_failed_write_skips_caching(self, tmp_path, monkeypatch):
+        def fail(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(np, "save", fail)
+        Propagator(ISS_TLES, method="midpoint", cache_dir=tmp_path)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_failed_write_removes_temp_file(self, tmp_path, monkeypatch):
+        def fail(*args, **kwargs):
+            raise ValueError("cannot serialize")
+
+        monkeypatch.setattr(np, "save", fail)
+        with pytest.raises(ValueError, match="serialize"):
+            Propagator(ISS_TLES, method="midpoint", cache_dir=tmp_path)
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestExtend:
+    """Propagator.extend() matches rebuilding from all TLEs."""
+
+    @pytest.mark.parametrize("method", ["epoch", "midpoint", "tca"])
+    def test_matches_rebuild(self, method):
+        full = Propagator(ISS_TLES, method=method)
+        prop = Propagator(ISS_TLES[::2], method=method)
+        prop.extend(ISS_TLES[1::2])
+        assert [s.epoch.tt for s in prop.satellites] == [
+            s.epoch.tt for s in full.satellites
+        ]
+        assert prop.switcher.satellites is prop.satellites
+        np.testing.assert_array_equal(
+            prop.switcher.transitions, full.switcher.transitions
+        )
+
+    @pytest.mark.parametrize(
+        "method, cls",
+        [
+            ("epoch", EpochSwitchStrategy),
+            ("midpoint", MidpointSwitchStrategy),
+            ("tca", TCASwitchStrategy),
+        ],
+    )
+    def test_no_full_recompute(self, method, cls, monkeypatch):
+        prop = Propagator(ISS_TLES[:-1], method=method)
+
+        def fail(self):
+            raise AssertionError("all transitions recomputed")
+
+        monkeypatch.setattr(cls, "compute_transitions", fail)
+        prop.extend(ISS_TLES[-1:])
+        assert len(prop.switcher.transitions) == len(ISS_TLES) + 1
+
+    def test_custom_strategy_recomputes(self):
+        class Custom(EpochSwitchStrategy):
+            def update_transitions(self, inserted):
+                SwitchingStrategy.update_transitions(self, inserted)
+
+        prop = Propagator(ISS_TLES[:-1], method=Custom([]))
+        prop.extend(ISS_TLES[-1:])
+        expected = Propagator(ISS_TLES, method="epoch").switcher.transitions
+        np.testing.assert_array_equal(prop.switcher.transitions, expected)
+
+    def test_empty(self):
+        prop = Propagator(ISS_TLES, method="midpoint")
+        before = prop.switcher.transitions.copy()
+        prop.extend([])
+        np.testing.assert_array_equal(prop.switcher.transitions, before)
+
+
+class TestFindMany:
+    """Array lookups agree with the scalar find_* methods."""
+
+    def setup_method(self):
+        self.propagator = Propagator(ISS_TLES, method="midpoint")
+        transitions = self.propagator.switcher.transitions[1:-1]
+        offsets = np.array([-1, 0, 1], dtype="timedelta64[s]")
+        self.times = (transitions[:, None] + offsets).ravel()[::-1]
+
+    def test_index_matches_scalar(self):
+        indices = self.propagator.find_satellite_index(self.times)
+        assert indices.shape == self.times.shape
+        for time, idx in zip(self.times, indices):
+            expected = self.propagator.find_satellite(time)
+            assert self.propagator.satellites[idx] is expected
+
+    def test_index_accepts_datetimes(self):
+        dts = [dt64_to_datetime(t) for t in self.times]
+        np.testing.assert_array_equal(
+            self.propagator.find_satellite_index(dts),
+            self.propagator.find_satellite_index(self.times),
+        )
+        assert self.propagator.find_satellite_index(dts[0]) == (
+            self.propagator.find_satellite_index(self.times[:1])[0]
+        )
+
+    def test_index_out_of_range(self):
+        times = np.array([DATETIME64_MIN - 1, DATETIME64_MAX + 1])
+        indices = self.propagator.find_satellite_index(times)
+        assert indices.tolist() == [0, len(ISS_TLES) - 1]
+
+    def test_find_tles(self):
+        tles = self.propagator.find_tles(self.times)
+        assert tles == [self.propagator.find_tle(t) for t in self.times]
+
+
+class TestSatelliteList:
+    """SatelliteList defers building satellites and matches eager ones."""
+
+    def setup_method(self):
+        self.ts = load.timescale()
+        self.tles = ISS_TLES[::-1]
+        self.eager = sorted(
+            (EarthSatellite(*tle, ts=self.ts) for tle in self.tles),
+            key=lambda sat: sat.epoch.tt,
+        )
+
+    def test_epochs_match_eager(self):
+        lazy = SatelliteList(self.tles, self.ts)
+        assert len(lazy) == len(self.eager)
+        assert lazy.tt.tolist() == [sat.epoch.tt for sat in self.eager]
+        utc = [sat.epoch.utc_datetime() for sat in self.eager]
+        expected = [datetime_to_dt64(dt) for dt in utc]  # type: ignore[arg-type]
+        np.testing.assert_array_equal(lazy.epochs, expected)
+        assert not lazy._satellites and not lazy._satrecs
+
+    def test_items_match_eager(self):
+        lazy = SatelliteList(self.tles, self.ts)
+        for i, sat in enumerate(self.eager):
+            assert lazy[i].epoch.tt == sat.epoch.tt
+            assert export_tle(lazy.satrec(i)) == export_tle(sat.model)
+        assert lazy[-1].epoch.tt == self.eager[-1].epoch.tt
+        with pytest.raises(IndexError):
+            lazy[len(lazy)]
+
+    def test_satrec_reuses_satellite(self):
+        lazy = SatelliteList(self.tles, self.ts)
+        sat = lazy[0]
+        assert lazy.satrec(0) is sat.model
+        assert not lazy._satrecs
+
+    def test_lru_bound(self):
+        lazy = SatelliteList(self.tles, self.ts, maxsize=2)
+        first = lazy[0]
+        lazy[1]
+        assert lazy[0] is first
+        lazy[2]
+        assert list(lazy._satellites) == [0, 2]
+        assert lazy[1] is not None
+        assert len(lazy._satellites) == 2
+
+    def test_slice(self):
+        lazy = SatelliteList(self.tles, self.ts)
+        part = lazy[1:3]
+        assert isinstance(part, SatelliteList)
+        assert part.tles == lazy.tles[1:3]
+        assert part.tt.tolist() == lazy.tt[1:3].tolist()
+
+    def test_merge(self):
+        lazy = SatelliteList(ISS_TLES[::2], self.ts)
+        kept = lazy[1]
+        merged, inserted = lazy.merge(SatelliteList(ISS_TLES[1::2], self.ts))
+        full = SatelliteList(ISS_TLES, self.ts)
+        assert merged.tles == full.tles
+        np.testing.assert_array_equal(merged.epochs, full.epochs)
+        assert [merged.tles[i] for i in inserted] == sorted(
+            ISS_TLES[1::2], key=lambda tle: full.tles.index(tle)
+        )
+        assert kept in merged._satellites.values()
+
+    def test_propagator_builds_only_used(self):
+        prop = Propagator(ISS_TLES, method="midpoint")
+        assert not prop.satellites._satellites and not prop.satellites._satrecs
+        time = prop.switcher.transitions[1]
+        prop.find_satrec(time)
+        assert len(prop.satellites._satrecs) == 1
+        assert not prop.satellites._satellites
+
+    def test_max_loaded(self):
+        prop = Propagator(ISS_TLES, method="epoch", max_loaded=1)
+        times = np.array(prop.switcher.transitions[1:-1])
+        expected = Propagator(ISS_TLES, method="epoch").propagate_teme(times)
+        r, v = prop.propagate_teme(times)
+        np.testing.assert_array_equal(r, expected[0])
+        np.testing.assert_array_equal(v, expected[1])
+        assert len(prop.satellites._satrecs) == 1
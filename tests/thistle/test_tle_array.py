@@ -0,0 +1,133 @@
+import numpy as np
+import pytest
+from sgp4.api import Satrec, SatrecArray
+from sgp4.exporter import export_tle
+
+from thistle.propagator import Propagator
+from thistle.tle_array import TLEArray
+from thistle.utils import read_tle
+
+from .conftest import ISS_TLES
+
+LEO_TLES = read_tle("tests/thistle/data/leo.tle")
+OBJECT_TLES = read_tle("tests/thistle/data/obj/50001.txt")
+
+SATREC_ATTRS = [
+    "satnum",
+    "classification",
+    "intldesg",
+    "epochyr",
+    "epochdays",
+    "jdsatepoch",
+    "jdsatepochF",
+    "ndot",
+    "nddot",
+    "bstar",
+    "ephtype",
+    "elnum",
+    "inclo",
+    "nodeo",
+    "ecco",
+    "argpo",
+    "mo",
+    "no_kozai",
+    "revnum",
+]
+
+
+class TestTLEArray:
+    @pytest.mark.parametrize("tles", [LEO_TLES, OBJECT_TLES])
+    def test_lines_match_export(self, tles):
+        array = TLEArray(tles)
+        assert len(array) == len(tles)
+        for i, tle in enumerate(tles):
+            assert array[i] == export_tle(Satrec.twoline2rv(*tle))
+
+    @pytest.mark.parametrize("tles", [LEO_TLES, OBJECT_TLES])
+    def test_satrec_matches(self, tles):
+        array = TLEArray(tles)
+        for i, tle in enumerate(tles):
+            expected = Satrec.twoline2rv(*tle)
+            actual = array.satrec(i)
+            for attr in SATREC_ATTRS:
+                assert getattr(actual, attr) == getattr(expected, attr), attr
+
+    def test_fields(self):
+        array = TLEArray(ISS_TLES)
+        satrec = Satrec.twoline2rv(*ISS_TLES[0])
+        assert array.satnum[0] == satrec.satnum
+        assert array.epoch_days[0] == satrec.epochdays
+        assert array.inc[0] == pytest.approx(np.degrees(satrec.inclo))
+        assert array.ecc[0] == satrec.ecco
+        assert array.mm[0] == pytest.approx(satrec.no_kozai * 1440 / (2 * np.pi))
+
+    def test_compact(self):
+        array = TLEArray(LEO_TLES)
+        assert array.nbytes / len(array) < 128
+
+    def test_alpha5(self):
+        line1, line2 = ISS_TLES[0]
+        tle = ("1 A0001" + line1[7:68], "2 A0001" + line2[7:68])
+        array = TLEArray([tle])
+        assert array.satnum[0] == 100001
+        assert array[0][0][2:7] == "A0001"
+        assert array.satrec(0).satnum == 100001
+
+    def test_slicing(self):
+        array = TLEArray(LEO_TLES[:10])
+        part = array[2:5]
+        assert isinstance(part, TLEArray)
+        assert list(part) == [array[i] for i in range(2, 5)]
+        picked = array[np.array([7, 1])]
+        assert list(picked) == [array[7], array[1]]
+
+    def test_concatenate(self):
+        a = TLEArray(LEO_TLES[:3])
+        b = TLEArray(LEO_TLES[3:5])
+        joined = TLEArray.concatenate([a, b])
+        assert list(joined) == list(TLEArray(LEO_TLES[:5]))
+
+    def test_empty(self):
+        array = TLEArray([])
+        assert len(array) == 0
+        assert list(array) == []
+
+    def test_satrecs(self):
+        array = TLEArray(LEO_TLES[:20])
+        jd = np.array([2460700.5])
+        fr = np.array([0.25])
+        e, r, v = array.satrecs([0, 5]).sgp4(jd, fr)
+        expected = SatrecArray(
+            [Satrec.twoline2rv(*LEO_TLES[0]), Satrec.twoline2rv(*LEO_TLES[5])]
+        ).sgp4(jd, fr)
+        np.testing.assert_array_equal(r, expected[1])
+        np.testing.assert_array_equal(v, expected[2])
+
+
+class TestPropagatorTLEArray:
+    """A Propagator built from a TLEArray matches one built from lines."""
+
+    @pytest.mark.parametrize("method", ["epoch", "midpoint", "tca"])
+    def test_matches_lines(self, method):
+        tles = OBJECT_TLES[:200][::-1]
+        expected = Propagator(tles, method=method)
+        prop = Propagator(TLEArray(tles), method=method)
+        assert isinstance(prop.satellites.tles, TLEArray)
+        np.testing.assert_array_equal(
+            prop.switcher.transitions, expected.switcher.transitions
+        )
+        times = expected.switcher.transitions[1:-1]
+        r, v = prop.propagate_teme(times)
+        np.testing.assert_array_equal(r, expected.propagate_teme(times)[0])
+        np.testing.assert_array_equal(v, expected.propagate_teme(times)[1])
+        for time in times[::20]:
+            assert prop.find_tle(time) == expected.find_tle(time)
+
+    def test_extend(self):
+        full = Propagator(OBJECT_TLES[:100], method="midpoint")
+        prop = Propagator(TLEArray(OBJECT_TLES[:100:2]), method="midpoint")
+        prop.extend(OBJECT_TLES[1:100:2])
+        assert isinstance(prop.satellites.tles, TLEArray)
+        np.testing.assert_array_equal(
+            prop.switcher.transitions, full.switcher.transitions
+        )